@@ -0,0 +1,79 @@
+#! /usr/bin/env python3
+
+""" Generated converter benchmark
+
+Times the converters generated by `pieoffice.codegen` for the scripts whose
+tables are compiled to a character trie, against that trie and against the
+chain of `str.replace` calls the converters used to run, one per rule. The
+texts are made of random words drawn from each table and are the same from
+one run to the next. The trie and the generated converter are checked to
+agree on them before being timed; the replace chain, which may rewrite the
+output of earlier rules, is only timed. The time taken to generate and
+compile each converter is shown as well.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/codegen.py
+"""
+
+import importlib
+import random
+import timeit
+
+from pieoffice.codegen import GeneratedConverter
+from pieoffice.engine import TrieConverter
+
+SCRIPTS = ("pie", "linearb", "cypriot", "luwian")
+
+WORDS = 20000
+
+
+def sample(rules, seed=0):
+    """ Returns a text of random words drawn from a rule table """
+    generator = random.Random(seed)
+    keys = [key for key, value in rules if key]
+    return " ".join("".join(generator.choice(keys)
+                            for _ in range(generator.randint(1, 4)))
+                    for _ in range(WORDS))
+
+
+def replace_chain(rules, text):
+    """ The former conversion, one replacement per rule """
+    for key, value in rules:
+        if key:
+            text = text.replace(key, value)
+    return text
+
+
+def best(function, argument, number):
+    """ Returns the best time of a call, in seconds """
+    timer = timeit.Timer(lambda: function(argument))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    for script in SCRIPTS:
+        rules = getattr(importlib.import_module("pieoffice." + script),
+                        "ASCII_TO_" + script.upper())
+        text = sample(rules)
+        trie = TrieConverter(rules)
+        generation = timeit.Timer(lambda: GeneratedConverter(rules))
+        built = min(generation.repeat(repeat=3, number=1))
+        generated = GeneratedConverter(rules)
+        assert generated.convert(text) == trie.convert(text)
+
+        print("{} ({} rules, {} characters)".format(
+            script, len(rules), len(text)))
+        chain = best(lambda text: replace_chain(rules, text), text, 1)
+        walk = best(trie.convert, text, 5)
+        after = best(generated.convert, text, 5)
+        print("    replace chain {:12.6f} s".format(chain))
+        print("    trie          {:12.6f} s".format(walk))
+        print("    generated     {:12.6f} s  ({:.1f}x trie, {:.1f}x chain)"
+              .format(after, walk / after, chain / after))
+        print("    generation    {:12.6f} s".format(built))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#! /usr/bin/env python3
+
+""" Cold start benchmark
+
+Times the first conversion of a fresh process, the case of every command
+line call: the compilation of the rule table, then the whole process. The
+scripts with tables of regular expressions are run with the compiled
+artifacts disabled, and with them stored by an earlier run, in a temporary
+cache directory. Literal tables are built in full every time; the Gothic,
+Linear B and Luwian ones show that the cold start barely grows with their
+size.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/coldstart.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+# (module, rule table, function, text), with whether the table is compiled
+# to an artifact.
+SCRIPTS = (
+    ("avestan", "ASCII_TO_AVESTAN_SCRIPT",
+     "AsciiConverter().converter", "mazdA", True),
+    ("armenian", "ASCII_TO_ARMENIAN_SCRIPT_MINISCULES",
+     "alpha_to_armenian", "hayerEn", True),
+    ("gothic", "ASCII_TO_GOTHIC", "alpha_to_gothic", "wulfila", False),
+    ("linearb", "ASCII_TO_LINEARB", "alpha_to_linearb", "ko-wo", False),
+    ("luwian", "ASCII_TO_LUWIAN", "alpha_to_luwian", "MAGNUS.REX", False),
+)
+
+RUNS = 21
+
+COMPILE = """
+import time
+from pieoffice.compiler import compile_regex_rules, compile_rules
+from pieoffice.{0} import {1}
+compile = compile_regex_rules if {4} else compile_rules
+start = time.perf_counter()
+compile({1}).convert({3!r})
+print(time.perf_counter() - start)
+"""
+
+PROCESS = """
+import time
+start = time.perf_counter()
+from pieoffice.{0} import *
+{2}({3!r})
+print(time.perf_counter() - start)
+"""
+
+
+def median(code, directory):
+    """ Returns the median time printed by code run in fresh processes """
+    environment = dict(os.environ, PIEOFFICE_CACHE_DIR=directory)
+    times = sorted(
+        float(subprocess.run([sys.executable, "-c", code], env=environment,
+                             stdout=subprocess.PIPE, check=True).stdout)
+        for _ in range(RUNS))
+    return times[RUNS // 2]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for script in SCRIPTS:
+            module, table, function, text, stored = script
+            print(module)
+            for name, template in (("compile", COMPILE), ("process", PROCESS)):
+                code = template.format(*script)
+                if not stored:
+                    print("    {:8} {:9.3f} ms".format(
+                        name, median(code, "") * 1000))
+                    continue
+                disabled = median(code, "")
+                median(code, directory)
+                print("    {:8} {:9.3f} ms  artifacts {:9.3f} ms".format(
+                    name, disabled * 1000, median(code, directory) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#! /usr/bin/env python3
+
+""" Devanagari context rules benchmark
+
+Times the Harvard-Kyoto to Devanagari conversion, accents already placed,
+with the context rules run as a single pass against the regular expression
+passes of `ASCII_HK_TO_DEVA` they replaced. The text repeats a Rigveda
+verse. Both are checked to agree on it before being timed.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/context.py
+"""
+
+import timeit
+
+from pieoffice.compiler import compile_context_rules, compile_regex_rules
+from pieoffice.vedic import ASCII_HK_TO_DEVA, HK_TO_DEVA_RULES, hkUdToHkAnu
+
+VERSE = ("agni/mILe puro/hitaM yajJa/sya deva/m Rtvi/jam |"
+         " ho/tAraM ratnadhA/tamam ||\n")
+
+
+def best(function, argument, number):
+    """ Returns the best time of a call, in seconds """
+    timer = timeit.Timer(lambda: function(argument))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    regex = compile_regex_rules(ASCII_HK_TO_DEVA)
+    context = compile_context_rules(HK_TO_DEVA_RULES)
+    for count in (1, 1000):
+        text = hkUdToHkAnu(VERSE * count)
+        assert context.convert(text) == regex.convert(text)
+
+        print("{} verses ({} characters)".format(count, len(text)))
+        number = 2000 if count == 1 else 5
+        before = best(regex.convert, text, number)
+        after = best(context.convert, text, number)
+        print("    regex passes {:12.6f} s".format(before))
+        print("    context      {:12.6f} s  ({:.1f}x)".format(
+            after, before / after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#! /usr/bin/env python3
+
+""" Differential harness between the legacy and compiled engines
+
+Converts the same texts with the compiled converters and with the chains
+of `str.replace` and `re.sub` calls they replaced, kept by
+`pieoffice.legacy` and selected with `get_converter(language,
+engine="legacy")`, for every language and type of transliteration listed by
+`pieoffice list`. The texts are generated from the rule tables by
+`pieoffice.corpus`, with a fixed seed, or read from the files given.
+
+Every word converted differently, or every line when none of its words is,
+is reduced to a minimal reproducer: as few of its characters as keep the
+outputs apart, removed by halves and then one at a time. Each distinct
+reproducer is printed with both outputs. For each converter the speedup is
+the time of the median legacy call over that of the median compiled call on
+the same text.
+
+Some mismatches are intended, and listed as known rather than counted:
+
+    - a key written after a shorter key it contains, like Luwian `LEO2`
+      after `LEO`, was never matched by the chain of replacements, while the
+      converters reading the longest key read it whole. These keys are the
+      "shadowed" findings of `pieoffice.compiler.analyze_rules` on the
+      tables each converter reads that way;
+    - the fixes listed in `DELIBERATE`, such as the Vedic `ai` written with
+      one vowel sign after a consonant, or the Linear B and Luwian signs
+      separated by a hyphen, like `a-ri`, which the released converters
+      joined into another key, `ari`, by deleting the hyphens first.
+
+A word is known to differ only if masking those keys and fixes in it, i.e.
+removing every text they match, leaves it converted the same by both
+engines: a word in which anything else differs is counted, and reduced to
+that other difference.
+
+Converters from the scripts back to their transliteration, like `vedicdeva`,
+had no legacy form and are not compared.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/differential.py
+    $ PYTHONPATH=. python benchmarks/differential.py luwian --file text.txt
+
+See `--help` for the options. The exit status is non-zero if any output
+differs other than by a known divergence.
+"""
+
+import re
+import sys
+import time
+
+from docopt import docopt
+
+from pieoffice import compiler
+from pieoffice.compiler import compiled_findings
+from pieoffice.corpus import PROFILES, sample
+from pieoffice.legacy import ReplaceConverter
+from pieoffice.linearb import ASCII_TO_LINEARB
+from pieoffice.luwian import ASCII_TO_LUWIAN
+from pieoffice.registry import get_converter, get_language, languages
+
+USAGE = """Differential harness between the legacy and compiled engines
+
+Usage:
+    differential.py [<language>...] [--length CHARS] [--seeds N]
+                    [--file FILE]... [--calls N]
+
+Options:
+    --length CHARS      Length of the generated texts [default: 10000].
+    --seeds N           Number of generated texts, seeded 0 to N - 1
+                        [default: 3].
+    -f --file FILE      Compare on the text in FILE as well.
+    --calls N           Calls timed on each text [default: 5].
+"""
+
+# Languages converting a script back to its transliteration.
+NO_LEGACY = ("vedicdeva",)
+
+
+def hyphenated(rules):
+    """ Returns the keys of a table split by a hyphen, as patterns """
+    spans = {key[:cut] + "-" + key[cut:]
+             for key, value in rules if "-" not in key
+             for cut in range(1, len(key))}
+    return tuple(map(re.escape, sorted(spans, key=len, reverse=True)))
+
+
+# Deliberate divergences from the released converters, as patterns of the
+# text converted differently, by (language, type).
+DELIBERATE = {
+    # Signs on both sides of a hyphen, kept apart rather than read as
+    # another key once the hyphen is deleted.
+    ("linearb", None): hyphenated(ASCII_TO_LINEARB),
+    ("luwian", None): hyphenated(ASCII_TO_LUWIAN),
+    ("vedic", None): (
+        # "ai" after a consonant, written with one vowel sign.
+        r"(?<=[bcdDgGhjJklLmnNprsStTvyz])ai",
+        # A word-initial "lRR", read whole.
+        r"(?<!\S)lRR",
+        # Runs of "L", read from the left two at a time.
+        r"L{3,}",
+    ),
+}
+
+
+def parts(text, differs):
+    """ Yields the words of text converted differently
+
+    A line converted differently with none of its words is yielded whole,
+    and so is the text if none of its lines is converted differently.
+    """
+    found = False
+    for line in text.split("\n"):
+        if not line or not differs(line):
+            continue
+        found = True
+        words = [word for word in line.split(" ") if word and differs(word)]
+        if words:
+            yield from words
+        else:
+            yield line
+    if not found:
+        yield text
+
+
+def shrink(text, differs):
+    """ Returns a minimal part of text that differs still """
+    chunk = len(text) // 2
+    while chunk:
+        removed = False
+        position = 0
+        while position < len(text):
+            candidate = text[:position] + text[position + chunk:]
+            if candidate and differs(candidate):
+                text = candidate
+                removed = True
+            else:
+                position += chunk
+        if not removed:
+            chunk //= 2
+    return text
+
+
+def median_time(conv, text, calls):
+    """ Returns the time of the median call of a converter on a text """
+    timer = time.perf_counter
+    times = []
+    for _ in range(calls):
+        start = timer()
+        conv(text)
+        times.append(timer() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def shadowed_keys(tables):
+    """ Returns the shadowed keys of rule tables, read whole by design
+
+    The tables still applied as a chain of replacements never read them
+    whole, and are left out.
+    """
+    chained = {id(rules) for rules, converter in compiler._compiled.values()
+               if isinstance(converter, ReplaceConverter)}
+    return {finding.rule[0]
+            for rules, findings in compiled_findings()
+            if id(rules) in tables and id(rules) not in chained
+            for finding in findings if finding.kind == "shadowed"}
+
+
+def masking(keys, patterns):
+    """ Returns a function removing the known divergences from a text """
+    alternatives = list(patterns)
+    alternatives.extend(map(re.escape, sorted(keys, key=len, reverse=True)))
+    if not alternatives:
+        return lambda text: text
+    pattern = re.compile("|".join(alternatives))
+
+    def mask(text):
+        # Removing a match may join the text around it into another.
+        while True:
+            masked = pattern.sub("", text)
+            if masked == text:
+                return text
+            text = masked
+
+    return mask
+
+
+def compare(language, scheme, texts, calls, known):
+    """ Compares the engines on texts, returning the unexpected reproducers
+
+    The keys known to be read differently are added to known, for the
+    tables the converter compiles.
+    """
+    before = {id(rules) for rules, findings in compiled_findings()}
+    compiled = get_converter(language, scheme)[0]
+    compiled("")
+    known.update(shadowed_keys({id(rules)
+                                for rules, findings in compiled_findings()}
+                               - before))
+    legacy = get_converter(language, scheme, engine="legacy")[0]
+    differs = lambda text: compiled(text) != legacy(text)
+    mask = masking(known, DELIBERATE.get((language, scheme), ()))
+    unknown = lambda text: differs(text) and differs(mask(text))
+
+    reproducers = []
+    seen = set()
+    legacy_time = compiled_time = 0.0
+    for name, text in texts:
+        if differs(text):
+            for part in parts(text, differs):
+                expected = not unknown(part)
+                reproducer = shrink(part, differs if expected else unknown)
+                if reproducer not in seen:
+                    seen.add(reproducer)
+                    reproducers.append((name, reproducer, expected))
+        legacy_time += median_time(legacy, text, calls)
+        compiled_time += median_time(compiled, text, calls)
+    unexpected = [(name, text) for name, text, expected in reproducers
+                  if not expected]
+
+    speedup = legacy_time / compiled_time if compiled_time else float("inf")
+    status = "identical"
+    if reproducers:
+        status = "{} mismatch(es), {} known".format(
+            len(reproducers), len(reproducers) - len(unexpected))
+    print("{:<16}{:<12}{:>8.2f}x  {}".format(
+        language, scheme or "default", speedup, status))
+    for name, text, expected in reproducers:
+        print("    in {}: {!r}{}".format(
+            name, text, " (known)" if expected else ""))
+        print("        compiled {!r}".format(compiled(text)))
+        print("        legacy   {!r}".format(legacy(text)))
+    return unexpected
+
+
+def main():
+    arguments = docopt(USAGE)
+    try:
+        names = {get_language(name).name for name in arguments["<language>"]}
+    except ValueError as error:
+        sys.exit(str(error))
+
+    files = []
+    for path in arguments["--file"]:
+        with open(path, encoding="utf-8") as source:
+            files.append((path, source.read()))
+
+    length = int(arguments["--length"])
+    calls = int(arguments["--calls"])
+    mismatches = 0
+    for language in languages():
+        if names and language.name not in names \
+                or language.name in NO_LEGACY:
+            continue
+        texts = list(files)
+        if language.name in PROFILES:
+            texts.extend(("seed {}".format(seed),
+                          sample(language.name, length, seed))
+                         for seed in range(int(arguments["--seeds"])))
+        if not texts:
+            continue
+        # Schemes of a language may share their tables.
+        known = set()
+        for scheme in (None,) + language.types:
+            mismatches += len(compare(language.name, scheme, texts, calls,
+                                      known))
+
+    if mismatches:
+        sys.exit("{} word(s) converted differently, other than by a known "
+                 "divergence".format(mismatches))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#! /usr/bin/env python3
+
+""" Literal table benchmark
+
+Times the engines reading the longest key that a literal table of an
+alphabetic script could be compiled to, a reordered chain of `str.replace`
+calls and a character trie, against the chain of `str.replace` calls in
+table order these scripts are converted with,
+`pieoffice.legacy.ReplaceConverter`. The times are given relative to it,
+along with the converter `pieoffice.compiler.compile_rules` picks. Neither
+engine converts these tables faster, so they are kept on the chain; the
+costs `compile_rules` weighs it against a trie with are measured here.
+
+The texts are made of random words drawn from each table, one letter in
+twenty being a longer key such as Gothic `th` or Ogham `,ear,`, and are the
+same from one run to the next. The engines are checked to agree on the
+texts before being timed.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/literal.py
+"""
+
+import importlib
+import random
+import timeit
+
+from pieoffice.compiler import _prune, compile_rules
+from pieoffice.engine import ChainConverter, TrieConverter
+from pieoffice.legacy import ReplaceConverter
+
+SCRIPTS = ("gothic", "ogham", "oscan", "lydian", "carian", "lycian")
+
+# Share of the letters drawn among the longer keys.
+LONGER = 0.05
+
+WORDS = 20000
+
+
+def sample(rules, seed=0):
+    """ Returns a text of random words drawn from a rule table """
+    generator = random.Random(seed)
+    single = [key for key, value in rules if len(key) == 1]
+    longer = [key for key, value in rules if len(key) > 1] or single
+    words = []
+    for _ in range(WORDS):
+        words.append("".join(
+            generator.choice(longer if generator.random() < LONGER
+                             else single)
+            for _ in range(generator.randint(2, 8))))
+    return " ".join(words)
+
+
+def best(function, argument, number):
+    """ Returns the best time of a call, in seconds """
+    timer = timeit.Timer(lambda: function(argument))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    for script in SCRIPTS:
+        rules = getattr(importlib.import_module("pieoffice." + script),
+                        "ASCII_TO_" + script.upper())
+        text = sample(rules)
+        effective = _prune(rules)[0]
+        compiled = compile_rules(rules)
+        converters = (("chain", ChainConverter(effective)),
+                      ("trie", TrieConverter(effective)))
+        expected = converters[-1][1].convert(text)
+        for name, converter in converters:
+            assert converter.convert(text) == expected, name
+
+        print("{} ({} characters, compiled to {})".format(
+            script, len(text), type(compiled).__name__))
+        reference = best(ReplaceConverter(rules).convert, text, 5)
+        print("    replace     {:12.6f} s".format(reference))
+        for name, converter in converters:
+            seconds = best(converter.convert, text, 5)
+            print("    {:<12}{:12.6f} s  ({:.2f}x)".format(
+                name, seconds, reference / seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#! /usr/bin/env python3
+
+""" Logogram lookup benchmark
+
+Times looking logograms and sign numbers up as whole words against the
+character trie walking them, on administrative texts made mostly of
+logograms and on syllabic texts. Luwian logograms, like `MAGNUS.REX`, are
+long enough for the lookup to pay; the Linear B ones, like `VIR`, are not,
+so Linear B keeps the trie. Both are checked to agree on the texts before
+being timed.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/logograms.py
+"""
+
+import timeit
+
+from pieoffice.compiler import compile_rules, compile_token_rules
+from pieoffice.linearb import ASCII_TO_LINEARB
+from pieoffice.luwian import ASCII_TO_LUWIAN
+
+TEXTS = (
+    ("linearb", ASCII_TO_LINEARB, "[A-Z*0-9]", "logograms",
+     "VIR 12 MUL 3 *180 BOSm 4 OVISf 120 GRA 5 VIN 2 HORD 7 OLIV 3\n"),
+    ("linearb", ASCII_TO_LINEARB, "[A-Z*0-9]", "syllabic",
+     "to-so-jo pe-ma ko-wa me-zo-e ko-wo me-wi-jo-e a-pi-qo-i-ta do-e-ra\n"),
+    ("luwian", ASCII_TO_LUWIAN, "[A-Z*(]", "logograms",
+     "REX REGIO *180 MAGNUS.REX DEUS VIR INFANS (DEUS)VIA+TERRA HEROS\n"),
+    ("luwian", ASCII_TO_LUWIAN, "[A-Z*(]", "syllabic",
+     "a-mu ka-ma-ni-ia-wa-sa-za ta-wa-ni-sa ka-ra-ka-mi-sà wa-mu\n"),
+)
+
+
+def best(function, argument, number):
+    """ Returns the best time of a call, in seconds """
+    timer = timeit.Timer(lambda: function(argument))
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main():
+    for script, rules, initials, name, line in TEXTS:
+        text = line * 3000
+        trie = compile_rules(rules)
+        tokens = compile_token_rules(rules, initials)
+        assert tokens.convert(text) == trie.convert(text)
+
+        print("{}, {} ({} characters)".format(script, name, len(text)))
+        before = best(trie.convert, text, 3)
+        after = best(tokens.convert, text, 3)
+        print("    trie          {:12.6f} s".format(before))
+        print("    lookup        {:12.6f} s  ({:.1f}x)".format(
+            after, before / after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#! /usr/bin/env python3
+
+""" Pass-through benchmark
+
+Times the trie converter on texts where few characters start a rule, such as
+transliterations buried in editorial brackets, line numbers and punctuation,
+and on plain transliterations. The converter copies the runs of characters
+no rule starts with as a whole; it is compared with the per character walk
+it replaced, kept here as a reference. Both are checked to agree on the
+texts before being timed.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/passthrough.py
+"""
+
+import timeit
+
+from pieoffice.compiler import compile_rules
+from pieoffice.linearb import ASCII_TO_LINEARB
+from pieoffice.luwian import ASCII_TO_LUWIAN
+
+# A tablet line with its apparatus, and the bare transliteration.
+INERT = "[   ]  .1   [ • • • ]   (   ) 12 ; 3 // [   ]  .2  ko-wo  ||  ] vacat [\n"
+PLAIN = "to-so-jo pe-ma ko-wa me-zo-e ko-wo me-wi-jo-e a-pi-qo-i-ta do-e-ra\n"
+LUWIAN = "MAGNUS.REX MAGNUS-TONITRUS HEROS ka-ra-ka-mi-sà REGIO REX\n"
+
+TEXTS = (
+    ("linearb", ASCII_TO_LINEARB, "inert", INERT * 2000),
+    ("linearb", ASCII_TO_LINEARB, "plain", PLAIN * 2000),
+    ("luwian", ASCII_TO_LUWIAN, "inert", INERT * 2000),
+    ("luwian", ASCII_TO_LUWIAN, "plain", LUWIAN * 2000),
+)
+
+
+def convert_per_character(converter, text):
+    """ The former walk of `TrieConverter.convert`, kept as a reference """
+    root = converter._root
+    output = []
+    append = output.append
+    position = 0
+    length = len(text)
+    while position < length:
+        node = root.get(text[position])
+        if node is None:
+            append(text[position])
+            position += 1
+            continue
+
+        match = node.get(None)
+        end = cursor = position + 1
+        while cursor < length:
+            node = node.get(text[cursor])
+            if node is None:
+                break
+            cursor += 1
+            if None in node:
+                match = node[None]
+                end = cursor
+
+        if match is None:
+            append(text[position])
+            position += 1
+        else:
+            append(match)
+            position = end
+    return "".join(output)
+
+
+def best(function, argument, number):
+    """ Returns the best time of a call, in seconds """
+    timer = timeit.Timer(lambda: function(argument))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    for script, rules, name, text in TEXTS:
+        converter = compile_rules(rules)
+        reference = lambda text: convert_per_character(converter, text)
+        assert converter.convert(text) == reference(text)
+
+        print("{}, {} ({} characters)".format(script, name, len(text)))
+        before = best(reference, text, 5)
+        after = best(converter.convert, text, 5)
+        print("    per character {:12.6f} s".format(before))
+        print("    runs          {:12.6f} s  ({:.1f}x)".format(
+            after, before / after))
+
+
+if __name__ == "__main__":
+    main()
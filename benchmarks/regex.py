@@ -0,0 +1,80 @@
+#! /usr/bin/env python3
+
+""" Regular expression table benchmark
+
+Times the compiled converters of the tables made of regular expressions,
+those of Armenian, Avestan and the Vedic transliterations, against the chains
+of `re.sub` calls they replaced, kept by `pieoffice.legacy`, on short entries
+and on long texts. Both are checked to agree on the texts before being
+timed.
+
+The merged passes pay off on short entries, such as those of a lexicon:
+each `re.sub` call of a chain then costs more to start than to scan. On long
+texts the chains already spend their time in C, mostly building the
+replaced strings, and the compiled converters are only somewhat faster.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/regex.py
+"""
+
+import timeit
+
+from pieoffice import armenian, avestan, vedic
+from pieoffice.compiler import use_engine
+from pieoffice.corpus import sample
+
+CASES = (
+    ("armenian", armenian.AsciiConverter, "armenian_alphabet"),
+    ("armenian", armenian.AsciiConverter, "armenian_maiscules"),
+    ("armenian", armenian.AsciiConverter, "iso"),
+    ("armenian", armenian.AsciiConverter, "classical"),
+    ("avestan", avestan.AsciiConverter, "script"),
+    ("avestan", avestan.AsciiConverter, "roman-hoffman"),
+    ("vedic", vedic.AsciiConverter, "hk_to_iso"),
+    ("vedic", vedic.AsciiConverter, "hk_to_iast"),
+)
+
+LENGTH = 200000
+
+ENTRIES = 2000
+
+
+def best(function, argument, number):
+    """ Returns the best time of a call, in seconds """
+    timer = timeit.Timer(lambda: function(argument))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def convert_all(converter, entries):
+    return [converter(entry) for entry in entries]
+
+
+def main():
+    for language, cls, scheme in CASES:
+        text = sample(language, LENGTH)
+        entries = text.split()[:ENTRIES]
+        compiled = cls(scheme).converter
+        with use_engine("legacy"):
+            legacy = cls(scheme).converter
+        assert compiled(text) == legacy(text)
+        assert convert_all(compiled, entries) == convert_all(legacy, entries)
+
+        print("{}, {} ({} entries, text of {} characters)".format(
+            language, scheme, len(entries), len(text)))
+        print("{:>12} {:>12} {:>12}".format("", "legacy", "compiled"))
+        before = best(lambda entries: convert_all(legacy, entries),
+                      entries, 1) / len(entries)
+        after = best(lambda entries: convert_all(compiled, entries),
+                     entries, 1) / len(entries)
+        print("{:>12} {:>10.2f}us {:>10.2f}us  ({:.1f}x)".format(
+            "entry", before * 1e6, after * 1e6, before / after))
+        before = best(legacy, text, 3)
+        after = best(compiled, text, 3)
+        print("{:>12} {:>11.4f}s {:>11.4f}s  ({:.1f}x)".format(
+            "text", before, after, before / after))
+
+
+if __name__ == "__main__":
+    main()
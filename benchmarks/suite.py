@@ -0,0 +1,207 @@
+#! /usr/bin/env python3
+
+""" Benchmark suite
+
+Runs the converter of every language and type of transliteration listed by
+`pieoffice list` over small, medium and large texts, of 100, 10 000 and
+1 000 000 characters, generated from its rule table by `pieoffice.corpus`
+with a fixed seed, so that runs on different machines convert the same
+texts. For each it reports the characters converted per second by the
+median call, which noise affects less than the mean, the latency of a call
+at the 50th, 90th and 99th percentiles and the peak memory allocated by a
+call. Converters are built and called once before being timed, so that
+compilation is not counted.
+
+The results can be written to a JSON file and compared with those of an
+earlier run, such as the last release: a converter that converts fewer
+characters per second than the baseline, by more than the threshold, is a
+regression, reported with a non-zero exit status.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/suite.py
+    $ PYTHONPATH=. python benchmarks/suite.py --output baseline.json
+    $ PYTHONPATH=. python benchmarks/suite.py --baseline baseline.json
+    $ PYTHONPATH=. python benchmarks/suite.py luwian vedic --sizes small
+
+See `--help` for the options.
+"""
+
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from docopt import docopt
+
+from pieoffice.corpus import PROFILES, sample
+from pieoffice.registry import get_converter, get_language, languages
+
+USAGE = """Benchmark suite
+
+Usage:
+    suite.py [<language>...] [--sizes SIZES] [--seed SEED] [--output FILE]
+             [--baseline FILE] [--threshold RATIO]
+
+Options:
+    --sizes SIZES           Sizes of the texts [default: small,medium,large].
+    --seed SEED             Seed of the generated texts [default: 0].
+    -o --output FILE        Write the results to FILE, as JSON.
+    -b --baseline FILE      Compare the results with those in FILE.
+    -t --threshold RATIO    Slowdown counted as a regression [default: 0.1].
+"""
+
+# Length of the texts and number of calls timed, by size.
+SIZES = {
+    "small": (100, 1000),
+    "medium": (10000, 100),
+    "large": (1000000, 3),
+}
+
+def revision():
+    """ Returns the git revision of the tree benchmarked, if known """
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL, universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def percentile(values, rank):
+    """ Returns the nearest-rank percentile of sorted values """
+    index = max(0, -(-len(values) * rank // 100) - 1)
+    return values[index]
+
+
+def measure(conv, text, calls):
+    """ Returns the measures of a converter on a text """
+    conv(text)
+    latencies = []
+    timer = time.perf_counter
+    gc.disable()
+    try:
+        for _ in range(calls):
+            start = timer()
+            conv(text)
+            latencies.append(timer() - start)
+    finally:
+        gc.enable()
+    latencies.sort()
+
+    tracemalloc.start()
+    try:
+        conv(text)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "characters": len(text),
+        "calls": calls,
+        "chars_per_second": len(text) / percentile(latencies, 50),
+        "latency": {
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+        },
+        "peak_memory": peak,
+    }
+
+
+def run(names, sizes, seed):
+    """ Runs the suite, returning its results """
+    results = []
+    for language in languages():
+        if names and language.name not in names \
+                or language.name not in PROFILES:
+            continue
+        texts = {size: sample(language.name, SIZES[size][0], seed)
+                 for size in sizes}
+        for scheme in (None,) + language.types:
+            conv = get_converter(language.name, scheme)[0]
+            for size in sizes:
+                result = {"language": language.name,
+                          "scheme": scheme or "default",
+                          "size": size}
+                result.update(measure(conv, texts[size], SIZES[size][1]))
+                results.append(result)
+                report(result)
+    return results
+
+
+def report(result):
+    latency = result["latency"]
+    print("{:<16}{:<12}{:<8}{:>12,.0f} chars/s  p50 {:>10.6f} s"
+          "  p90 {:>10.6f} s  p99 {:>10.6f} s  {:>8.1f} KiB".format(
+              result["language"], result["scheme"], result["size"],
+              result["chars_per_second"], latency["p50"], latency["p90"],
+              latency["p99"], result["peak_memory"] / 1024))
+
+
+def compare(results, baseline, threshold, seed):
+    """ Prints the changes from a baseline, returning the regressions """
+    before = {(result["language"], result["scheme"], result["size"]):
+              result for result in baseline["results"]}
+    regressions = []
+    print()
+    print("Compared with revision {} on Python {}:".format(
+        baseline.get("revision"), baseline["python"]))
+    if baseline.get("seed") != seed:
+        print("(the baseline texts were generated with another seed)")
+    for result in results:
+        key = (result["language"], result["scheme"], result["size"])
+        if key not in before:
+            continue
+        ratio = result["chars_per_second"] / before[key]["chars_per_second"]
+        regression = ratio < 1 - threshold
+        if regression:
+            regressions.append(key)
+        print("{:<16}{:<12}{:<8}{:>8.2f}x{}".format(
+            *key, ratio, "  REGRESSION" if regression else ""))
+    return regressions
+
+
+def main():
+    arguments = docopt(USAGE)
+    try:
+        names = {get_language(name).name for name in arguments["<language>"]}
+    except ValueError as error:
+        sys.exit(str(error))
+    sizes = arguments["--sizes"].split(",")
+    for size in sizes:
+        if size not in SIZES:
+            sys.exit("Unknown size: {}".format(size))
+
+    seed = int(arguments["--seed"])
+    results = run(names, sizes, seed)
+    document = {
+        "revision": revision(),
+        "seed": seed,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if arguments["--output"]:
+        with open(arguments["--output"], "w", encoding="utf-8") as output:
+            json.dump(document, output, indent=2)
+
+    if arguments["--baseline"]:
+        with open(arguments["--baseline"], encoding="utf-8") as source:
+            baseline = json.load(source)
+        regressions = compare(results, baseline,
+                              float(arguments["--threshold"]), seed)
+        if regressions:
+            sys.exit("{} regression(s) beyond {:.0%}".format(
+                len(regressions), float(arguments["--threshold"])))
+
+
+if __name__ == "__main__":
+    main()
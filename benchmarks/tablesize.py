@@ -0,0 +1,69 @@
+#! /usr/bin/env python3
+
+""" Table size benchmark
+
+Times the trie converter on the Luwian table cut down to a growing number of
+its rules, converting the same text of sign numbers and logograms kept in
+every cut, such as `*180` and `MAGNUS.REX`. The time per character depends
+on the longest key tried at each position, not on the number of rules. Keys
+of Linear B and Luwian extending another key, like `*181` and `wa5.`, are
+first checked to be read whole, whatever their order in the table.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/tablesize.py
+"""
+
+import random
+import timeit
+
+from pieoffice.compiler import compile_rules
+from pieoffice.engine import TrieConverter
+from pieoffice.linearb import ASCII_TO_LINEARB
+from pieoffice.luwian import ASCII_TO_LUWIAN
+
+# Keys with a prefix that is a key as well, and that prefix.
+LONGEST = (
+    (ASCII_TO_LINEARB, ("*181", "*18", "*180")),
+    (ASCII_TO_LUWIAN, ("wa5.", "wa5", "MAGNUS.REX", "MAGNUS.DOMUS", "MAGNUS")),
+)
+
+WORDS = 20000
+
+
+def cut(rules, keys, size):
+    """ Returns size rules of a table, among them those of keys """
+    kept = [rule for rule in rules if rule[0] in keys]
+    others = [rule for rule in rules if rule[0] not in keys]
+    return tuple(kept + random.Random(size).sample(others, size - len(kept)))
+
+
+def best(function, argument, number):
+    """ Returns the best time of a call, in seconds """
+    timer = timeit.Timer(lambda: function(argument))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    for rules, words in LONGEST:
+        values = dict(reversed(rules))
+        text = " ".join(words)
+        expected = " ".join(values[word] for word in words)
+        assert compile_rules(rules).convert(text) == expected, text
+        assert TrieConverter(tuple(reversed(rules))).convert(text) \
+            == " ".join(dict(rules)[word] for word in words), text
+
+    generator = random.Random(0)
+    keys = [key for key, value in ASCII_TO_LUWIAN
+            if key.startswith("*") or key.isupper()][:60]
+    text = " ".join(generator.choice(keys) for _ in range(WORDS))
+    for size in (60, 120, 240, 480, len(ASCII_TO_LUWIAN)):
+        converter = TrieConverter(cut(ASCII_TO_LUWIAN, set(keys), size))
+        elapsed = best(converter.convert, text, 5)
+        print("{:4} rules {:12.6f} s  {:6.1f} ns per character".format(
+            size, elapsed, elapsed / len(text) * 1e9))
+
+
+if __name__ == "__main__":
+    main()
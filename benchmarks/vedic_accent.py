@@ -0,0 +1,79 @@
+#! /usr/bin/env python3
+
+""" Vedic accent benchmark
+
+Times the udatta to anudatta accent conversion of `pieoffice.vedic` on a
+hymn-length and on a book-length text, and compares `udToAnu` with the
+iterative rewriting it replaced, which rescanned the whole accent string
+until it stopped changing. Both implementations are checked to agree on the
+texts before being timed.
+
+Usage
+-----
+
+    $ PYTHONPATH=. python benchmarks/vedic_accent.py
+"""
+
+import re
+import timeit
+
+from pieoffice.vedic import hkAccentuation, hkToSyllables, hkUdToHkAnu, \
+    udToAnu
+
+# Rigveda 1.1.1-9, with the udatta marked by a slash.
+HYMN = """\
+agni/mILe puro/hitaM yajJa/sya deva/mRtvi/jam | hotA/raM ratnadhA/tamam ||
+agniH/ pU/rvebhir R/SibhirI/Dyo nU/tanairuta/ | sa devA/N eha/ vakSati ||
+agni/nA rayima/znavat poSa/meva/ dive/-dive | yaza/saM vIra/vattamam ||
+agne/ yaM yajJa/madhvaraM/ vizva/taH paribhU/rasi | sa i/d deve/Su gacchati ||
+agni/rhotA/ kavi/kratuH satya/zcitra/zravastamaH | devo/ deve/bhirA/ gamat ||
+ya/daGga dAzu/Se tva/magne/ bhadraM/ kariSya/si | tave/t tat satya/maGgiraH ||
+u/pa tvAgne dive/-dive do/SAvastardhiyA/ vayam | namo/ bha/ranta e/masi ||
+rA/jantamadhvarA/NAM gopA/mRta/sya dI/divim | va/rdhamAnaM sve/ da/me ||
+sa/ naH piteva/ sUna/ve/ 'gne/ sUpAyano/ bhava | sa/casvA naH svasta/ye ||
+"""
+
+# Roughly the length of the first mandala.
+BOOK = HYMN * 191
+
+
+def udToAnu_iterative(udStr):
+    """ The former `udToAnu`, kept as a reference """
+    anuStr = udStr
+
+    anuStr = re.sub(r"BU",  "AU", anuStr)
+    anuStr = re.sub(r"UB",  "US", anuStr)
+    anuStr = re.sub(r"U",   "D", anuStr)
+
+    while ("BA" in anuStr or "BD" in anuStr):
+        anuStr = re.sub(r"^(B*)[BD](A)",    r"\1A\2", anuStr)
+        anuStr = re.sub(r"\n(B*)[BD](A)",   r"\1A\2", anuStr)
+        anuStr = re.sub(r"([ADSB])B([AD])", r"\1D\2", anuStr)
+        anuStr = re.sub(r"B$", "D", anuStr)
+
+    return anuStr
+
+
+def best(function, argument, number):
+    """ Returns the best time of a call, in seconds """
+    timer = timeit.Timer(lambda: function(argument))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    for name, text, number in (("hymn", HYMN, 100), ("book", BOOK, 1)):
+        accents = hkAccentuation(hkToSyllables(text))
+        assert udToAnu(accents) == udToAnu_iterative(accents)
+
+        print("{} ({} syllables)".format(name, len(accents)))
+        iterative = best(udToAnu_iterative, accents, number)
+        linear = best(udToAnu, accents, number)
+        print("    udToAnu, iterative  {:12.6f} s".format(iterative))
+        print("    udToAnu, linear     {:12.6f} s  ({:.1f}x)".format(
+            linear, iterative / linear))
+        print("    hkUdToHkAnu         {:12.6f} s".format(
+            best(hkUdToHkAnu, text, number)))
+
+
+if __name__ == "__main__":
+    main()
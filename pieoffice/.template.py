@@ -8,12 +8,13 @@ of <++> and the <++> Script itself with (almost) simple rules.
 The file can be imported as a module and contains the following functions:
     alpha_to_<++> - returns a converted string in <++> script from
     a romanized string.
-    <++>_to_alpha - returns a converted string in romanized linear B from a
-    string in <++> Script. (Might return problematic data due to double
-    readings for the same grapheme in <++>)
+    <++>_to_alpha - returns a converted string in romanized <++> from a
+    string in <++> Script. Glyphs with several readings are given their
+    shortest one.
 
-It also contains a dictionary:
-    script - contains the equivalences between romanized and <++> scripts.
+It also contains a table:
+    ASCII_TO_<++> - contains the equivalences between romanized and <++>
+    scripts.
 
 Usage
 -----
@@ -21,11 +22,16 @@ Usage
 
 """
 
-from tools import get_key
+from pieoffice.compiler import LazyConverter, LazyReverseConverter
 
-script = {
+ASCII_TO_<++> = (
+    ("-", ""),
+
+)
+
+_converter = LazyConverter(ASCII_TO_<++>)
+_reverse = LazyReverseConverter(ASCII_TO_<++>, "-")
 
-        }
 
 def alpha_to_<++>(input):
     """ Converts text in Latin Alphabet to <++> Script
@@ -50,30 +56,16 @@ def alpha_to_<++>(input):
 
     """
 
-    output = []
-    input = input.split(" ")
-    for word in input:
-        word_out = ""
-        if word.isnumeric():
-            word = [int(i) for i in word]
-            tens = [10**n for n in range(len(word)-1,-1,-1)]
-            for i in range(len(tens)):
-                word_out = word_out + script[str(word[i]*tens[i])]
-        elif "-" in word:
-            for syllabe in word.split("-"):
-                word_out = word_out + script[syllabe]
-        else:
-            word_out = script[word]
-
-        output.append(word_out)
+    output = _converter.convert(input)
 
-    return " ".join(output)
+    return output
 
 
 def <++>_to_alpha(input):
     """ Converts text in <++> Script to Latin Alphabet
 
-    Some errors might occur if a syllable has multiple values.
+    Syllables are separated by dashes. Glyphs with several readings are
+    given their shortest one.
 
     Parameters
     ----------
@@ -91,25 +83,10 @@ def <++>_to_alpha(input):
     > <++>_to_alpha("<++>")
 
     """
-    output = []
-    input = input.split()
-    for word in input:
-        word_out = ""
-        if len(word) > 1:
-            syllabes = [sy for sy in word]
-            for syllabe in syllabes:
-                word_out = word_out + get_key(syllabe, script) + "-"
-            word_out = str(word_out)
-            if len(word_out) > 1 and word_out[-1] == "-":
-                word_out = word_out[:-1]
-        else:
-            word_out = get_key(word, script)
-        output.append(word_out)
-        for i in range(len(output)):
-            if output[i].split("-")[0].isnumeric():
-                output[i] = str(sum([int(i) for i in output[i].split("-")]))
-
-    return " ".join(output)
+
+    output = _reverse.convert(input)
+
+    return output
 
 if __name__ == "__main__":
         
@@ -0,0 +1,8 @@
+import os
+
+from pieoffice.batch import convert_many
+from pieoffice.cache import WordCache
+
+if os.environ.get("PIEOFFICE_PROFILE", "0") not in ("", "0"):
+    from pieoffice.profiling import profile_process
+    profile_process()
@@ -5,7 +5,11 @@
 A terminal based script converter for ancient (Proto-)Indo-European languages.
 
 Usage:
-    pieoffice convert <language> <text> [--type TYPE]
+    pieoffice convert <language> <text> [--type TYPE] [--client] [--socket PATH]
+    pieoffice convert <language> --input FILE [--output FILE] [--type TYPE]
+    pieoffice serve [--socket PATH | --stdio]
+    pieoffice profile <language> <file> [--type TYPE]
+    pieoffice check <language> [--type TYPE]
     pieoffice rules <language>
     pieoffice list
     pieoffice --help
@@ -29,135 +33,132 @@ Languages:
 
 Options:
     -t --type           Type of transliteration
+    -i --input FILE     Convert the text in FILE, - for the standard input
+    -o --output FILE    Write the converted text to FILE
+    --client            Have a running `pieoffice serve` convert the text
+    --socket PATH       Unix socket of the server
+    --stdio             Serve JSON lines on the standard input and output
     -h --help           Show this screen.
 
 """
 
+import sys
+
 from docopt import docopt
 
+from pieoffice.registry import get_converter, get_language, languages
+
+
 def main():
     arguments = docopt(__doc__)
 
     rules = False
 
-    if arguments["convert"]:
-        language = arguments["<language>"]
-        # print(arguments["--type"])
-        if language == "pie":
-            from pieoffice.pie import alpha_to_pie as conv
-        if language == "greek":
-            from pieoffice.greek import alpha_to_greek as conv
-        if language == "linearb":
-            from pieoffice.linearb import alpha_to_linearb as conv
-        elif language == "luwian":
-            from pieoffice.luwian import alpha_to_luwian as conv
-        elif language == "lycian":
-            from pieoffice.lycian import alpha_to_lycian as conv
-        elif language == "lydian":
-            from pieoffice.lydian import alpha_to_lydian as conv
-        elif language == "carian":
-            from pieoffice.carian import alpha_to_carian as conv
-        elif language == "gothic":
-            from pieoffice.gothic import alpha_to_gothic as conv
-        elif language == "armenian":
-            from pieoffice.armenian import AsciiConverter
-            if arguments["TYPE"] == "iso":
-                ascii_conv = AsciiConverter("iso")
-            elif arguments["TYPE"] == "classical":
-                ascii_conv = AsciiConverter("classical")
-            elif arguments["TYPE"] == "maiscules":
-                ascii_conv = AsciiConverter("armenian_maiscules")
-            else:
-                ascii_conv = AsciiConverter()
-            conv = ascii_conv.converter
-        elif language == "vedic" or language == "sanskrit":
-            from pieoffice.vedic import AsciiConverter
-            if arguments["TYPE"] == "iso":
-                ascii_conv = AsciiConverter("hk_to_iso")
-            elif arguments["TYPE"] == "iast":
-                ascii_conv = AsciiConverter("hk_to_iast")
+    if arguments["serve"]:
+        from pieoffice.server import Server, serve_socket, serve_stdio
+        server = Server(get_converter)
+        server.warm((language.name, scheme)
+                    for language in languages()
+                    for scheme in (None,) + language.types)
+        if arguments["--stdio"]:
+            serve_stdio(server)
+        else:
+            try:
+                serve_socket(server, arguments["--socket"])
+            except OSError as error:
+                sys.exit(str(error))
+
+    if arguments["convert"] and arguments["--client"]:
+        from pieoffice.server import request
+        try:
+            print(request(arguments["<language>"], arguments["<text>"],
+                          arguments["TYPE"], arguments["--socket"]))
+        except OSError as error:
+            sys.exit("Cannot reach the server: {}".format(error))
+        except ValueError as error:
+            sys.exit(str(error))
+
+    elif arguments["convert"]:
+        try:
+            conv, stream_options = get_converter(arguments["<language>"],
+                                                 arguments["TYPE"])
+        except ValueError as error:
+            sys.exit(str(error))
+
+        if arguments["--input"]:
+            from pieoffice.stream import convert_stream
+            if arguments["--input"] == "-":
+                source = sys.stdin
             else:
-                ascii_conv = AsciiConverter()
-            conv = ascii_conv.converter
-        elif language == "avestan":
-            from pieoffice.avestan import AsciiConverter
-            if arguments["TYPE"] == "translit":
-                ascii_conv = AsciiConverter("roman-hoffman")
+                source = open(arguments["--input"], encoding="utf-8")
+            if arguments["--output"]:
+                target = open(arguments["--output"], "w", encoding="utf-8")
             else:
-                ascii_conv = AsciiConverter("script")
-            conv = ascii_conv.converter
-        elif language == "oldpersian":
-            from pieoffice.oldpersian import alpha_to_oldpersian as conv
-        elif language == "ogham":
-            from pieoffice.ogham import alpha_to_ogham as conv
-        elif language == "oscan":
-            from pieoffice.oscan import alpha_to_oscan as conv
-        elif language == "cypriot":
-            from pieoffice.cypriot import alpha_to_cypriot as conv
-
-
-        if arguments['<text>']:
+                target = sys.stdout
+            try:
+                convert_stream(conv, source, target, **stream_options)
+            finally:
+                if source is not sys.stdin:
+                    source.close()
+                if target is not sys.stdout:
+                    target.close()
+        elif arguments['<text>']:
             print(conv(arguments['<text>']))
         else:
             print("Insert a text.")
             rules = True
 
 
+    if arguments["profile"]:
+        from pieoffice.profiling import profile_file
+        try:
+            sys.stdout.write(profile_file(arguments["<language>"],
+                                          arguments["<file>"],
+                                          arguments["TYPE"]))
+        except ValueError as error:
+            sys.exit(str(error))
+
+    if arguments["check"]:
+        try:
+            print(check(arguments["<language>"], arguments["TYPE"]))
+        except ValueError as error:
+            sys.exit(str(error))
+
     if arguments['rules'] or rules:
-        language = arguments["<language>"]
-        if language == "pie":
-            from pieoffice.pie import __doc__ as doc
-        if language == "greek":
-            from pieoffice.greek import __doc__ as doc
-        if language == "linearb":
-            from pieoffice.linearb import __doc__ as doc
-        elif language == "luwian":
-            from pieoffice.luwian import __doc__ as doc
-        elif language == "lycian":
-            from pieoffice.lycian import __doc__ as doc
-        elif language == "lydian":
-            from pieoffice.lydian import __doc__ as doc
-        elif language == "carian":
-            from pieoffice.carian import __doc__ as doc
-        elif language == "gothic":
-            from pieoffice.gothic import __doc__ as doc
-        elif language == "armenian":
-            from pieoffice.armenian import __doc__ as doc
-        elif language == "avestan" or language == "avestantranslit":
-            from pieoffice.avestan import __doc__ as doc
-        elif language in ["vedic", "vedictranslit", "sanskrit", "sanskrithk"]:
-            from pieoffice.vedic import __doc__ as doc
-        elif language == "oldpersian":
-            from pieoffice.oldpersian import __doc__ as doc
-        elif language == "ogham":
-            from pieoffice.ogham import __doc__ as doc
-        elif language == "oscan":
-            from pieoffice.oscan import __doc__ as doc
-        elif language == "cypriot":
-            from pieoffice.cypriot import __doc__ as doc
-        print(doc)
+        try:
+            language = get_language(arguments["<language>"])
+        except ValueError as error:
+            sys.exit(str(error))
+        print(language.doc)
 
     if arguments['list']:
-        print("""Languages:
-            pie                             Proto-Indo-European
-            greek                           Polytonic Greek
-            linearb                         Mycenaean Libear B
-            cypriot                         Cypriot Greek Script
-            luwian                          Hieroglyphic Luwian
-            lycian                          Lycian
-            lydian                          Lydian
-            carian                          Carian
-            gothic                          Gothic
-            armenian                        Armenian
-            vedic / sanskrit                Vedic / Sanskrit (HK>Devanagari)
-            vedictranslit /sanskrithk       Vedic / Sanskrit (HK>IAST)
-            avestan                         Avestan (script)
-            avestantranslit                 Avestan (romanized)
-            oldpersian                      Old Persian Cuneiform
-            ogham                           Ogham Script
-            oscan                           Oscan (Old Italic Script)
-            """
-            )
+        print("Languages:")
+        for language in languages():
+            names = " / ".join((language.name,) + language.aliases)
+            print("    {:<32}{}".format(names, language.description))
+
+
+def check(language, scheme):
+    """ Returns the report of the analysis of the tables of a converter """
+    from pieoffice import compiler
+
+    before = {id(rules) for rules, findings in compiler.compiled_findings()}
+    get_converter(language, scheme)[0]("")
+    lines = []
+    for rules, findings in compiler.compiled_findings():
+        if id(rules) in before:
+            continue
+        pruned = sum(finding.pruned for finding in findings)
+        lines.append("{}: {} rules, {} pruned".format(
+            compiler.table_name(rules) or "a table", len(rules), pruned))
+        for finding in findings:
+            cause = ""
+            if finding.cause is not None:
+                cause = " by #{} {!r}".format(finding.cause,
+                                               rules[finding.cause][0])
+            lines.append("    {:<12}#{} {!r}{}".format(
+                finding.kind, finding.index, finding.rule[0], cause))
+    return "\n".join(lines) or "No dead or shadowed rules."
 
 
 if __name__ == "__main__":
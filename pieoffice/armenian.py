@@ -30,7 +30,7 @@ pieoffice armenian <text> --type
 
 """
 
-import re
+from pieoffice.compiler import compile_regex_rules
 
 ASCII_TO_ARMENIAN_SCRIPT_MINISCULES = [
         # Complex input (+1 char)
@@ -295,6 +295,7 @@ class AsciiConverter:
         elif scheme == "classical":
             self.scheme = "classical"
             self.script_set = ASCII_TO_ARMENIAN_CLASSICAL
+        self._converter = compile_regex_rules(self.script_set)
 
     def converter(self, ascii_text):
         if self.scheme == "armenian_maiscules":
@@ -302,9 +303,7 @@ class AsciiConverter:
         else:
             output = ascii_text
 
-        for pair in self.script_set:
-            output = re.sub(pair[0], pair[1], output)
-        return output
+        return self._converter.convert(output)
 
 
 
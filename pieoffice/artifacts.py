@@ -0,0 +1,170 @@
+#! /usr/bin/env python3
+
+""" Compiled rule table artifacts
+
+Compiling a table of regular expression rules, such as those of Avestan or
+Armenian, means analysing which of its rules can be merged into a single
+pass, which takes longer than converting the few words a command line call
+is given. The result of the analysis is therefore stored on disk with
+`marshal`, and later processes load it instead of analysing the table again.
+
+An artifact is named after the kind of compilation and the version of its
+format, a checksum of its rule table, a checksum of the source of the
+pieoffice modules and the Python implementation, so that editing a table,
+changing what the compilation holds, or changing or upgrading either
+gives a new artifact. The table itself is stored
+with the compilation and compared with the one being compiled, which rules
+out checksum collisions. Artifacts live in `$PIEOFFICE_CACHE_DIR` if set,
+and otherwise in the user cache directory, e.g. `~/.cache/pieoffice`.
+Setting `PIEOFFICE_CACHE_DIR` to an empty string disables them. An artifact
+that cannot be read or written only costs a compilation.
+
+The file can be imported as a module and contains the following:
+    cache_dir - returns the directory of the artifacts.
+    Artifact - the stored compilation of a rule table.
+
+Usage
+-----
+
+    > artifact = Artifact("regex", ASCII_TO_AVESTAN_SCRIPT, 2)
+    > plan = artifact.load()
+    > if plan is None:
+    >     plan = analyse(ASCII_TO_AVESTAN_SCRIPT)
+    >     artifact.save(plan)
+"""
+
+import marshal
+import os
+import sys
+import zlib
+
+# Checksum of the source of the package, computed once.
+_code = None
+
+
+def cache_dir():
+    """ Returns the directory of the artifacts
+
+    Returns
+    -------
+    directory : str or None
+        Directory of the artifacts, None when they are disabled.
+    """
+    directory = os.environ.get("PIEOFFICE_CACHE_DIR")
+    if directory is not None:
+        return directory or None
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") \
+            or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+    elif sys.platform == "darwin":
+        base = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") \
+            or os.path.expanduser(os.path.join("~", ".cache"))
+    return os.path.join(base, "pieoffice")
+
+
+def _code_checksum():
+    """ Returns a checksum of the source of the pieoffice modules
+
+    It stands for the version of the code making the compilations, read
+    from the modules themselves rather than from a version number that may
+    be left behind.
+    """
+    global _code
+    if _code is None:
+        directory = os.path.dirname(os.path.abspath(__file__))
+        checksum = 0
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                with open(os.path.join(directory, name), "rb") as module:
+                    checksum = zlib.crc32(module.read(), checksum)
+        _code = checksum
+    return _code
+
+
+class Artifact:
+    """
+    The stored compilation of a rule table.
+
+    Attributes
+    ----------
+    kind : str
+        Kind of compilation, such as "regex".
+
+    source : tuple
+        Rule table, with any option the compilation depends on.
+
+    version : int
+        Version of the format of the compilation.
+
+    path : str or None
+        File of the artifact, None when artifacts are disabled.
+
+    Methods
+    -------
+    load(self)
+        Returns the stored compilation, or None.
+    save(self, compiled)
+        Stores a compilation of the table.
+    """
+
+    def __init__(self, kind, source, version=1):
+        self.kind = kind
+        self.source = source
+        self.version = version
+        self.path = None
+        directory = cache_dir()
+        if directory is not None:
+            try:
+                checksum = zlib.crc32(marshal.dumps(source))
+                code = _code_checksum()
+            except (ValueError, OSError):
+                return
+            name = "{}{}-{:08x}-{:08x}.{}.marshal".format(
+                kind, version, checksum, code, sys.implementation.cache_tag)
+            self.path = os.path.join(directory, name)
+
+    def load(self):
+        """ Returns the stored compilation
+
+        Returns
+        -------
+        compiled : object or None
+            Compilation saved for the same table, None if there is none.
+        """
+        if self.path is None:
+            return None
+        try:
+            with open(self.path, "rb") as artifact:
+                source, compiled = marshal.loads(artifact.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if source != self.source:
+            return None
+        return compiled
+
+    def save(self, compiled):
+        """ Stores a compilation of the table
+
+        The artifact is written to a temporary file first and moved in
+        place, so that concurrent processes never read half of it.
+
+        Parameters
+        ----------
+        compiled : object
+            Compilation of the table, made of types `marshal` supports.
+        """
+        if self.path is None:
+            return
+        temporary = "{}.{}.tmp".format(self.path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temporary, "wb") as artifact:
+                marshal.dump((self.source, compiled), artifact)
+            os.replace(temporary, self.path)
+        except (OSError, ValueError):
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
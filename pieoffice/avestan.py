@@ -20,7 +20,7 @@ The typing scheme is as follows:
 --------------------------------------------------------------------------
 
 """
-import re
+from pieoffice.compiler import compile_regex_rules
 
 ASCII_TO_AVESTAN_SCRIPT = [
     # Complex
@@ -172,13 +172,12 @@ class AsciiConverter:
         else:
             self.scheme = "script"
             self.script_set = ASCII_TO_AVESTAN_SCRIPT
+        self._converter = compile_regex_rules(self.script_set)
 
     def converter(self, ascii_text):
         output = ascii_text
 
-        for pair in self.script_set:
-            output = re.sub(pair[0], pair[1], output)
-        return output
+        return self._converter.convert(output)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+#! /usr/bin/env python3
+
+""" Batch conversion
+
+Converts large numbers of strings in parallel. The strings are sent in chunks
+to a pool of worker processes, each loading the converter once, and the
+results are yielded back in the order of the input. The input is consumed
+lazily, with only a few chunks per worker in flight, so it can be a file or
+any other long iterable.
+
+The file can be imported as a module and contains the following:
+    convert_many - converts an iterable of strings with a process pool.
+
+Usage
+-----
+
+    > from pieoffice import convert_many
+    > with open("corpus.txt") as corpus:
+    >     for line in convert_many("luwian", corpus, workers=8):
+    >         print(line, end="")
+"""
+
+import collections
+import itertools
+import os
+
+from pieoffice.registry import get_converter, get_language
+
+# Chunks submitted ahead of the one being yielded, per worker.
+_PREFETCH = 2
+
+
+def _convert_chunk(language, scheme, texts):
+    conv = get_converter(language, scheme)[0]
+    return [conv(text) for text in texts]
+
+
+def _chunks(texts, chunksize):
+    texts = iter(texts)
+    while True:
+        chunk = list(itertools.islice(texts, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert_many(language, texts, scheme=None, workers=None, chunksize=512):
+    """ Converts many strings in parallel, preserving their order
+
+    Parameters
+    ----------
+    language : str
+        Name or alias of the language, as on the command line.
+
+    texts : iterable of str
+        Strings to be converted.
+
+    scheme : str
+        Type of transliteration, as given with --type.
+
+    workers : int
+        Number of worker processes, by default the number of CPUs. With a
+        single worker the strings are converted in the calling process.
+
+    chunksize : int
+        Number of strings sent to a worker at a time.
+
+    Yields
+    ------
+    output : str
+        Converted strings, in the order of texts.
+    """
+    get_language(language)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        conv = get_converter(language, scheme)[0]
+        for text in texts:
+            yield conv(text)
+        return
+
+    # Imported here to keep `import pieoffice` light.
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(workers)
+    pending = collections.deque()
+    try:
+        for chunk in _chunks(texts, chunksize):
+            pending.append(
+                executor.submit(_convert_chunk, language, scheme, chunk))
+            if len(pending) > workers * _PREFETCH:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown()
@@ -0,0 +1,184 @@
+#! /usr/bin/env python3
+
+""" Word cache
+
+Corpora in ancient languages repeat the same few words over and over. This
+module converts texts word by word through a bounded least recently used
+cache keyed by (language, type, word), so that each distinct word is only
+converted once while it stays in the cache.
+
+A word is a run of characters between spaces and newlines, and is looked
+up bare, so that `ko-wo`, `ko-wo ` and `ko-wo\n` share an entry; the runs
+of spaces and newlines between words are converted on their own, and kept
+in the same cache without counting as hits or misses. Languages
+with rules that read the whitespace around a word, such as Ogham's `kw `,
+keep the spaces and newlines following each word in its key instead. Either
+way the rules looking at the start of words see the same context as in the
+whole text. Converters whose output depends on the whole text, like Vedic
+with anudatta accents, are called on the whole text.
+
+The file can be imported as a module and contains the following:
+    WordCache - converts texts word by word through an LRU cache.
+
+Usage
+-----
+
+    > cache = WordCache(maxsize=10000)
+    > cache.convert("linearb", "ko-wo pa-te\nko-wo ")
+    + 𐀒𐀺 𐀞𐀳 𐀒𐀺
+    > cache.hits, cache.misses
+    + (1, 2)
+"""
+
+import collections
+import importlib
+import re
+
+from pieoffice.registry import get_language
+
+_WORD = re.compile(r"[^ \n]+|[ \n]+")
+_SPACED_WORD = re.compile(r"[^ \n]+[ \n]*|[ \n]+")
+
+# Rule keys that may read the whitespace around a word: spaces and newlines,
+# and in regular expressions the escapes, anchors and lookarounds that could
+# stand for them.
+_READS_WHITESPACE = re.compile(r"[ \n]|\\[sSnbBZ]|\$|\(\?<?[=!]")
+
+
+class WordCache:
+    """
+    Convert texts word by word, caching the converted words.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of words, and runs of whitespace, kept.
+
+    hits : int
+        Words found in the cache.
+
+    misses : int
+        Words converted and added to the cache.
+
+    evictions : int
+        Words, or runs of whitespace, dropped to make room for new ones.
+
+    bypasses : int
+        Texts converted whole, as their converter depends on the whole text.
+
+    Methods
+    -------
+    convert(self, language, text, scheme=None)
+        Converts a text, looking its words up in the cache.
+    info(self)
+        Returns the counters and the size of the cache.
+    clear(self)
+        Empties the cache and resets the counters.
+    """
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self._words = collections.OrderedDict()
+        self._patterns = {}
+        self.clear()
+
+    def convert(self, language, text, scheme=None):
+        """ Converts a text, looking its words up in the cache
+
+        Parameters
+        ----------
+        language : str
+            Name or alias of the language.
+
+        text : str
+            Text to be converted.
+
+        scheme : str
+            Type of transliteration, as given with --type.
+
+        Returns
+        -------
+        output : str
+            Converted text, the same as with the converter itself.
+        """
+        language = get_language(language)
+        scheme = language.scheme(scheme)
+        conv = language.converter(scheme)
+        options = language.stream_options.get(scheme, {})
+        if options.get("lines"):
+            self.bypasses += 1
+            return conv(text)
+
+        try:
+            pattern = self._patterns[language.name]
+        except KeyError:
+            pattern = self._patterns[language.name] = \
+                _SPACED_WORD if _reads_whitespace(language) else _WORD
+
+        words = self._words
+        outputs = []
+        for word in pattern.findall(text):
+            # Whitespace between words is cached as well, but not counted.
+            counted = word[0] not in " \n" or pattern is not _WORD
+            key = (language.name, scheme, word)
+            try:
+                output = words[key]
+            except KeyError:
+                self.misses += counted
+                output = words[key] = conv(word)
+                if len(words) > self.maxsize:
+                    words.popitem(last=False)
+                    self.evictions += 1
+            else:
+                self.hits += counted
+                words.move_to_end(key)
+            outputs.append(output)
+
+        separator = options.get("separator")
+        if separator is None:
+            return "".join(outputs)
+        # Converters that normalize the whitespace around their output.
+        return separator.join(output for output in outputs if output)
+
+    def info(self):
+        """ Returns the counters and the size of the cache
+
+        Returns
+        -------
+        info : dict
+            hits, misses, evictions, bypasses, size and maxsize.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bypasses": self.bypasses,
+            "size": len(self._words),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """ Empties the cache and resets the counters """
+        self._words.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypasses = 0
+
+
+def _reads_whitespace(language):
+    """ Whether a rule of the language may read the whitespace after a word
+
+    Every rule table of the module of the language is looked at, which may
+    count rules the converter does not use, but never misses one.
+    """
+    module = importlib.import_module(language.module)
+    for name, table in vars(module).items():
+        if not name.isupper() or not isinstance(table, (list, tuple)):
+            continue
+        for rule in table:
+            if isinstance(rule, (list, tuple)) and rule \
+                    and isinstance(rule[0], str) \
+                    and _READS_WHITESPACE.search(rule[0]):
+                return True
+    return False
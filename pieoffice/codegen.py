@@ -0,0 +1,206 @@
+#! /usr/bin/env python3
+
+""" Converter code generation
+
+Generates the source of a converter specialized for one literal rule table,
+instead of walking a generic trie at runtime. The trie is written out as a
+regular expression of nested character alternatives, e.g. `k(?:a|u(?:r)?)`
+for the keys `ka`, `ku` and `kur`, which the regular expression engine
+dispatches on in C. Each alternative may be followed by a longer key before
+falling back on the shorter one, so the match at each position is the
+longest key, as with `pieoffice.engine.TrieConverter`. The text is split on
+the matches, which are replaced by their literal output fragments and joined
+once with the text between them.
+
+Generated converters are faster than the trie, but the larger their table
+the longer their regular expression takes to compile: about 10 ms for the
+729 rules of Hieroglyphic Luwian. They suit long texts and long-running
+processes rather than single command line calls, so `compile_rules` does not
+use them and they are compiled on demand.
+
+The source is a module of its own, which can be exec'd or written to a file
+at build time:
+
+    $ python -m pieoffice.codegen pieoffice.luwian ASCII_TO_LUWIAN > luwian.py
+
+The file can be imported as a module and contains the following:
+    trie_pattern - returns the regular expression matching a table's keys.
+    generate_source - returns the source of a converter module for a table.
+    compile_generated - returns the compiled generated converter of a table.
+    GeneratedConverter - a converter running generated code.
+
+Usage
+-----
+
+    > from pieoffice.linearb import ASCII_TO_LINEARB
+    > converter = compile_generated(ASCII_TO_LINEARB)
+    > converter("ko-wo")
+    + 𐀒𐀺
+"""
+
+import importlib
+import re
+import sys
+
+_generated = {}
+
+_TEMPLATE = '''\
+#! /usr/bin/env python3
+
+""" Converter generated by pieoffice.codegen from {name} """
+
+import re
+
+PATTERN = re.compile({pattern!r})
+
+OUTPUT = {output!r}
+
+
+def convert(text):
+    # Text between matches at even indices, matched keys at odd ones.
+    parts = PATTERN.split(text)
+    parts[1::2] = map(OUTPUT.__getitem__, parts[1::2])
+    return "".join(parts)
+'''
+
+
+def _effective_rules(rules):
+    """ Returns the effective rules, the first one of each key """
+    output = {}
+    for key, value in rules:
+        if key:
+            output.setdefault(key, value)
+    return output
+
+
+def trie_pattern(rules):
+    """ Returns the regular expression matching the keys of a rule table
+
+    The pattern has a single group around the whole match, so that
+    `re.split` keeps the matched keys.
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs.
+
+    Returns
+    -------
+    pattern : str
+        Regular expression matching the longest key at each position.
+    """
+    root = {}
+    for key in _effective_rules(rules):
+        node = root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[None] = True
+    if not root:
+        return "(?!)"
+    return "(" + _node_pattern(root) + ")"
+
+
+def _node_pattern(node):
+    branches = [re.escape(char) + _node_pattern(node[char])
+                for char in sorted(char for char in node if char is not None)]
+    if not branches:
+        return ""
+    if len(branches) == 1 and None not in node:
+        return branches[0]
+    pattern = "(?:" + "|".join(branches) + ")"
+    # A key ending here is matched only if no longer one does.
+    return pattern + "?" if None in node else pattern
+
+
+def generate_source(rules, name="rule table"):
+    """ Returns the source of a converter module for a rule table
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs.
+
+    name : str
+        Name of the table, for the module docstring.
+
+    Returns
+    -------
+    source : str
+        Python source defining `convert(text)`.
+    """
+    return _TEMPLATE.format(name=name, pattern=trie_pattern(rules),
+                            output=_effective_rules(rules))
+
+
+class GeneratedConverter:
+    """
+    Convert strings with code generated for a table of literal rules.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs the converter was generated from.
+
+    source : str
+        Source of the generated module.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string applying the longest matching rule at each
+        position.
+    """
+
+    def __init__(self, rules, name="rule table"):
+        self.rules = tuple(rules)
+        self.source = generate_source(self.rules, name)
+        namespace = {}
+        exec(compile(self.source, "<pieoffice.codegen {}>".format(name),
+                     "exec"), namespace)
+        self._convert = namespace["convert"]
+
+    def convert(self, text):
+        """ Converts a string with the generated code
+
+        Parameters
+        ----------
+        text : str
+            Text to be converted.
+
+        Returns
+        -------
+        output : str
+            Converted text.
+        """
+        return self._convert(text)
+
+    __call__ = convert
+
+
+def compile_generated(rules):
+    """ Generates and compiles the converter of a rule table
+
+    The result is cached like that of `pieoffice.compiler.compile_rules`.
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs.
+
+    Returns
+    -------
+    converter : GeneratedConverter
+        Converter running the code generated for the table.
+    """
+    try:
+        return _generated[id(rules)][1]
+    except KeyError:
+        converter = GeneratedConverter(rules)
+        _generated[id(rules)] = (rules, converter)
+        return converter
+
+
+if __name__ == "__main__":
+    module, table = sys.argv[1:3]
+    rules = getattr(importlib.import_module(module), table)
+    sys.stdout.write(generate_source(rules, "{}.{}".format(module, table)))
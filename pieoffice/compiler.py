@@ -0,0 +1,1070 @@
+#! /usr/bin/env python3
+
+r""" Rule table compiler
+
+The converters describe their transliteration schemes as ordered tables of
+(key, value) pairs, such as `ASCII_TO_LUWIAN` or `ASCII_TO_GOTHIC`. This
+module turns those tables into converter objects. Compilation happens once
+per table and per process: the first conversion compiles the table and every
+later call reuses the compiled converter.
+
+Small literal tables, like those of the alphabetic scripts, are still
+applied as the chain of `str.replace` calls of `pieoffice.legacy`, one call
+per rule in the order of the table, each of which runs in C: reading the
+longest key at each position instead would convert them no faster. Large
+tables, like that of Linear B, are compiled to a character trie reading
+the longest key at each position, whose cost does not grow with their size.
+Those with logograms, like Luwian, can look their logograms up as whole
+words first.
+
+Tables whose keys are regular expressions, like `ASCII_TO_AVESTAN_SCRIPT`, are
+compiled into as few passes as possible: consecutive rules are merged into a
+single alternation as long as the merge cannot change the result of applying
+them one after the other, i.e. no earlier rule can overlap a later one or
+produce text that a later rule would rewrite again. The result of that
+analysis is stored on disk by `pieoffice.artifacts`, so that short-lived
+processes do not analyse the tables again. Literal tables are compiled
+faster than such an artifact would load.
+
+Tables whose rules depend on their context, such as the Harvard-Kyoto to
+Devanagari rules writing a vowel differently at the start of a word and
+after a consonant, are compiled to a single pass as well, the context being
+checked as the rules are matched.
+
+The converters used before, applying the rules one after the other with
+`str.replace` and `re.sub`, are kept by `pieoffice.legacy`. Within
+`use_engine("legacy")` the compile functions return those instead, to check
+the compiled converters against them; reverse converters, which had no
+legacy form, are always compiled.
+
+Before being compiled, tables are pruned of the rules that can never fire:
+the later rules of a repeated key, which the former chains of replacements
+found nothing left to replace, rules with an empty key, and rules of regular
+expressions whose every match holds text that an earlier rule replaced
+everywhere, such as Armenian `\.'` after `\.`. The analysis also reports
+keys written after a shorter key they contain, like Luwian `wa5.` after
+`wa5`, which a chain of replacements never matches but which the tries,
+reading the longest key, do.
+
+Literal tables can also be inverted, to convert the script back to its
+transliteration. A glyph often has several readings, such as the Luwian 𔖱
+for both `ra` and `ri`: the reverse converter then gives its shortest
+reading with letters, the one listed first in the table when several are as
+short. Any of the readings converts back to the same glyph.
+
+The file can be imported as a module and contains the following:
+    compile_rules - returns the compiled converter for a literal rule table.
+    compile_context_rules - returns the compiled converter for a table of
+    rules with contexts.
+    compile_token_rules - returns the compiled converter for a literal rule
+    table with logograms.
+    invert_rules - returns the (glyph, reading) table of a rule table.
+    compile_reverse_rules - returns the compiled reverse converter for a
+    literal rule table.
+    compile_regex_rules - returns the compiled converter for a table of
+    regular expressions.
+    RuleFinding - a rule the analysis found to be dead or misplaced.
+    analyze_rules - returns the pruned form of a literal rule table and
+    its findings.
+    analyze_context_rules - returns the pruned form of a table of rules
+    with contexts and its findings.
+    analyze_regex_rules - returns the pruned form of a table of regular
+    expressions and its findings.
+    compiled_findings - returns the findings of the compiled tables.
+    table_name - returns the name of a rule table.
+    get_engine - returns the name of the engine in use.
+    use_engine - context manager switching to another engine.
+    LazyConverter - a converter that compiles its table on first use.
+    LazyReverseConverter - a reverse converter that compiles its table on
+    first use.
+    LazyTokenConverter - a converter looking logograms up, that compiles its
+    table on first use.
+
+Usage
+-----
+
+    > from pieoffice.gothic import ASCII_TO_GOTHIC
+    > converter = LazyConverter(ASCII_TO_GOTHIC)
+    > converter("wulfila")
+    + 𐍅𐌿𐌻𐍆𐌹𐌻𐌰
+"""
+
+import contextlib
+import re
+import sys
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+from pieoffice.artifacts import Artifact
+from pieoffice.engine import ChainConverter, ContextConverter, \
+    RegexConverter, ReverseConverter, TokenConverter, TrieConverter
+from pieoffice.legacy import ReplaceConverter, SubConverter
+
+_compiled = {}
+_compiled_context = {}
+_compiled_token = {}
+_compiled_regex = {}
+_compiled_reverse = {}
+_legacy = {}
+_legacy_regex = {}
+
+ENGINES = ("compiled", "legacy")
+
+# Engine the compile functions build converters for, switched by use_engine.
+_engine = "compiled"
+
+# Running `pieoffice.profiling.Profiler`, which instruments the converters
+# as they are compiled, so that converting costs nothing more without one.
+_profiler = None
+
+# Rough cost of converting a character, in nanoseconds, with each engine, as
+# measured by benchmarks/literal.py: a `str.replace` call per rule of a
+# chain, and the walk of a trie, whatever the size of its table.
+_CHAIN_RULE_COST = 1.2
+_TRIE_COST = 170
+
+# Patterns expanding to more alternatives than this are left in a pass of
+# their own.
+_EXPANSION_LIMIT = 64
+
+# Version of the plans of regular expression tables stored as artifacts,
+# to be raised whenever what `_plan` returns changes.
+_PLAN_FORMAT = 3
+
+_TEMPLATE_REFERENCE = re.compile(r"\\(?:(\d+)|g<(\d+)>)?")
+
+
+def get_engine():
+    """ Returns the name of the engine in use, one of `ENGINES` """
+    return _engine
+
+
+@contextlib.contextmanager
+def use_engine(engine):
+    """ Builds and runs the converters with another engine within a block
+
+    The switch is global to the process, so converters should not be used
+    from other threads meanwhile.
+
+    Parameters
+    ----------
+    engine : str
+        "compiled", the default, or "legacy" for the chains of replacements
+        of `pieoffice.legacy`.
+    """
+    global _engine
+    if engine not in ENGINES:
+        raise ValueError("Unknown engine: {}".format(engine))
+    previous = _engine
+    _engine = engine
+    try:
+        yield
+    finally:
+        _engine = previous
+
+
+def _legacy_rules(rules):
+    """ The legacy converter of a literal table, built once """
+    try:
+        return _legacy[id(rules)][1]
+    except KeyError:
+        converter = ReplaceConverter(rules)
+        _legacy[id(rules)] = (rules, converter)
+        return converter
+
+
+def _legacy_regex_rules(rules):
+    """ The legacy converter of a table of regular expressions, built once """
+    rules = tuple(tuple(rule) for rule in rules)
+    try:
+        return _legacy_regex[rules]
+    except KeyError:
+        converter = _legacy_regex[rules] = SubConverter(rules)
+        return converter
+
+
+def compile_rules(rules):
+    """ Compiles a rule table into a converter
+
+    The result is cached, so compiling the same table object twice returns
+    the same converter.
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs.
+
+    Returns
+    -------
+    converter : ReplaceConverter or TrieConverter
+        The chain of replacements of the table, as released, for the tables
+        short enough to chain, or else a converter applying the longest
+        matching rule at each position.
+    """
+    if _engine == "legacy":
+        return _legacy_rules(rules)
+    try:
+        return _compiled[id(rules)][1]
+    except KeyError:
+        effective = _prune(rules)[0]
+        if _CHAIN_RULE_COST * len(effective) < _TRIE_COST:
+            converter = ReplaceConverter(rules)
+        else:
+            converter = TrieConverter(effective)
+        # The table is kept alongside so that its id cannot be reused.
+        _compiled[id(rules)] = (rules, converter)
+        if _profiler is not None:
+            _profiler.instrument(converter)
+        return converter
+
+
+def compile_context_rules(rules, boundaries=" \n", legacy=None):
+    """ Compiles a table of rules with contexts into a converter
+
+    The result is cached like that of `compile_rules`.
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value, context) triples, as read by `ContextConverter`.
+
+    boundaries : str
+        Characters delimiting words.
+
+    legacy : sequence
+        Table of regular expressions the rules stand for, applied by the
+        legacy engine.
+
+    Returns
+    -------
+    converter : ContextConverter
+        Converter applying the rules in a single pass.
+    """
+    if _engine == "legacy" and legacy is not None:
+        return _legacy_regex_rules(legacy)
+    try:
+        return _compiled_context[id(rules), boundaries][1]
+    except KeyError:
+        converter = ContextConverter(_prune(rules, _context_key)[0],
+                                     boundaries)
+        _compiled_context[id(rules), boundaries] = (rules, converter)
+        if _profiler is not None:
+            _profiler.instrument(converter)
+        return converter
+
+
+def compile_token_rules(rules, initials):
+    """ Compiles a rule table with logograms into a converter
+
+    The result is cached like that of `compile_rules`.
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs.
+
+    initials : str
+        Regular expression character class of the characters a logogram
+        starts with.
+
+    Returns
+    -------
+    converter : TokenConverter
+        Converter looking whole logograms up.
+    """
+    if _engine == "legacy":
+        return _legacy_rules(rules)
+    try:
+        return _compiled_token[id(rules), initials][1]
+    except KeyError:
+        converter = TokenConverter(_prune(rules)[0], initials)
+        _compiled_token[id(rules), initials] = (rules, converter)
+        if _profiler is not None:
+            _profiler.instrument(converter)
+        return converter
+
+
+class LazyConverter:
+    """
+    Converter compiled from a rule table the first time it is used.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string with the compiled rules.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self._converter = None
+
+    @property
+    def converter(self):
+        """ The compiled converter, built on first access """
+        if _engine == "legacy":
+            return compile_rules(self.rules)
+        if self._converter is None:
+            self._converter = compile_rules(self.rules)
+        return self._converter
+
+    def convert(self, text):
+        """ Converts a string with the compiled rules
+
+        Parameters
+        ----------
+        text : str
+            Text to be converted.
+
+        Returns
+        -------
+        output : str
+            Converted text.
+        """
+        return self.converter.convert(text)
+
+    __call__ = convert
+
+
+def invert_rules(rules):
+    """ Inverts a rule table, keeping one reading per glyph
+
+    As in the forward direction, only the first rule of a key is effective.
+    Among the keys of a glyph the shortest is kept, the first one listed in
+    the table winning ties. Keys with letters are preferred to numbers and
+    signs, like Luwian `mi` to `4`. Rules producing nothing, such as the dash
+    separating syllables, have no reverse.
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs.
+
+    Returns
+    -------
+    inverted : tuple
+        (value, key) pairs, in the order of the table.
+    """
+    seen = set()
+    readings = {}
+    for key, value in rules:
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        if value and (value not in readings
+                      or _reading_rank(key) < _reading_rank(readings[value])):
+            readings[value] = key
+    return tuple(readings.items())
+
+
+def _reading_rank(key):
+    return not any(char.isalpha() for char in key), len(key)
+
+
+def compile_reverse_rules(rules, separator=""):
+    """ Compiles the reverse converter of a rule table
+
+    The result is cached like that of `compile_rules`.
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs of the forward table.
+
+    separator : str
+        String put between the readings of consecutive glyphs, "-" for
+        syllabic scripts.
+
+    Returns
+    -------
+    converter : ReverseConverter
+        Converter from the script back to the transliteration.
+    """
+    try:
+        return _compiled_reverse[id(rules), separator][1]
+    except KeyError:
+        converter = ReverseConverter(invert_rules(rules), separator)
+        _compiled_reverse[id(rules), separator] = (rules, converter)
+        if _profiler is not None:
+            _profiler.instrument(converter)
+        return converter
+
+
+class LazyReverseConverter(LazyConverter):
+    """
+    Reverse converter compiled from a rule table the first time it is used.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs of the forward table.
+
+    separator : str
+        String put between the readings of consecutive glyphs.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string of glyphs to their readings.
+    """
+
+    def __init__(self, rules, separator=""):
+        super().__init__(rules)
+        self.separator = separator
+
+    @property
+    def converter(self):
+        """ The compiled reverse converter, built on first access """
+        if self._converter is None:
+            self._converter = compile_reverse_rules(self.rules,
+                                                    self.separator)
+        return self._converter
+
+
+class LazyTokenConverter(LazyConverter):
+    """
+    Converter looking logograms up, compiled the first time it is used.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs.
+
+    initials : str
+        Regular expression character class of the characters a logogram
+        starts with.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string with the compiled rules.
+    """
+
+    def __init__(self, rules, initials):
+        super().__init__(rules)
+        self.initials = initials
+
+    @property
+    def converter(self):
+        """ The compiled converter, built on first access """
+        if _engine == "legacy":
+            return compile_token_rules(self.rules, self.initials)
+        if self._converter is None:
+            self._converter = compile_token_rules(self.rules, self.initials)
+        return self._converter
+
+
+def compile_regex_rules(rules):
+    """ Compiles a table of regular expression rules into a converter
+
+    The rules are the (pattern, replacement) pairs that used to be applied
+    with one `re.sub` call each. Rules that can never match, as found by
+    `analyze_regex_rules`, are left out. The result is cached by the
+    contents of the table, so tables assembled on the fly are compiled only
+    once as well.
+
+    Parameters
+    ----------
+    rules : sequence
+        Ordered (pattern, replacement) pairs.
+
+    Returns
+    -------
+    converter : RegexConverter
+        Converter giving the same output as the sequence of `re.sub` calls.
+    """
+    if _engine == "legacy":
+        return _legacy_regex_rules(rules)
+    rules = tuple(tuple(rule) for rule in rules)
+    try:
+        return _compiled_regex[rules]
+    except KeyError:
+        pass
+
+    # The merge analysis is the costly part of the compilation, so its
+    # result is stored as an artifact for later processes.
+    artifact = Artifact("regex", rules, _PLAN_FORMAT)
+    plan = artifact.load()
+    steps = None
+    if plan is not None:
+        try:
+            steps = [_build(*step) for step in plan]
+        except (TypeError, ValueError, re.error):
+            # Stored in another format, though under the same name.
+            steps = None
+    if steps is None:
+        plan = _plan(rules)
+        artifact.save(plan)
+        steps = [_build(*step) for step in plan]
+
+    converter = RegexConverter(steps)
+    _compiled_regex[rules] = converter
+    if _profiler is not None:
+        _profiler.instrument(converter)
+    return converter
+
+
+class _Opaque(Exception):
+    """ Raised for patterns the merging analysis does not model """
+
+
+class _RegexRule:
+    """
+    A (pattern, replacement) rule and what it may match and produce.
+
+    Matches and outputs are described as sequences of character classes,
+    each a (characters, digits) pair where digits stands for `\\d`. Opaque
+    rules use regular expression features outside that model and are never
+    merged with their neighbours.
+    """
+
+    def __init__(self, pattern, replacement):
+        self.pattern = pattern
+        self.replacement = replacement
+        self.regex = re.compile(pattern)
+        self.opaque = False
+        self.strings = None
+        try:
+            groups = {}
+            anchors = []
+            self.sequences = _expand(sre_parse.parse(pattern), groups, anchors)
+            self.outputs, self.literal = _expand_template(replacement, groups)
+        except _Opaque:
+            self.opaque = True
+        else:
+            if not anchors:
+                self.strings = self._enumerate()
+
+    def _enumerate(self):
+        """ Maps every string the rule matches to its replacement
+
+        Returns None when the rule matches digits or too many strings.
+        """
+        strings = [""]
+        for sequence in self.sequences:
+            expanded = [""]
+            for chars, digits in sequence:
+                if digits:
+                    return None
+                expanded = [prefix + char
+                            for prefix in expanded for char in sorted(chars)]
+                if len(expanded) > _EXPANSION_LIMIT:
+                    return None
+            strings.extend(expanded)
+        return {string: self.regex.fullmatch(string).expand(self.replacement)
+                for string in strings[1:]}
+
+
+def _expand(subpattern, groups, anchors):
+    sequences = [()]
+    for op, av in subpattern:
+        if op is sre_constants.LITERAL:
+            alternatives = [((frozenset(chr(av)), False),)]
+        elif op is sre_constants.IN:
+            alternatives = [(_char_class(av),)]
+        elif op is sre_constants.SUBPATTERN:
+            group, add_flags, del_flags, inner = av
+            if add_flags or del_flags:
+                raise _Opaque
+            alternatives = _expand(inner, groups, anchors)
+            if group is not None:
+                groups[group] = alternatives
+        elif op is sre_constants.BRANCH:
+            alternatives = []
+            for branch in av[1]:
+                alternatives.extend(_expand(branch, groups, anchors))
+        elif op is sre_constants.AT:
+            # Anchors only narrow where a pattern matches, so ignoring them
+            # keeps the analysis on the safe side.
+            anchors.append(av)
+            alternatives = [()]
+        else:
+            raise _Opaque
+
+        sequences = [sequence + alternative
+                     for sequence in sequences
+                     for alternative in alternatives]
+        if len(sequences) > _EXPANSION_LIMIT:
+            raise _Opaque
+    return sequences
+
+
+def _char_class(items):
+    chars = set()
+    digits = False
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_constants.RANGE and av[1] - av[0] < 256:
+            chars.update(map(chr, range(av[0], av[1] + 1)))
+        elif op is sre_constants.CATEGORY \
+                and av is sre_constants.CATEGORY_DIGIT:
+            digits = True
+        else:
+            raise _Opaque
+    return frozenset(chars), digits
+
+
+def _expand_template(template, groups):
+    """ Expands a replacement into the sequences it may produce
+
+    Returns the sequences and, for replacements without group references,
+    the literal text.
+    """
+    sequences = [()]
+    position = 0
+    literal = True
+    for reference in _TEMPLATE_REFERENCE.finditer(template):
+        group = reference.group(1) or reference.group(2)
+        if group is None:
+            raise _Opaque
+        literal = False
+        alternatives = groups[int(group)]
+        sequences = [sequence
+                     + tuple((frozenset(char), False)
+                             for char in template[position:reference.start()])
+                     + alternative
+                     for sequence in sequences
+                     for alternative in alternatives]
+        position = reference.end()
+        if len(sequences) > _EXPANSION_LIMIT:
+            raise _Opaque
+    tail = tuple((frozenset(char), False) for char in template[position:])
+    sequences = [sequence + tail for sequence in sequences]
+    return sequences, template if literal else None
+
+
+def _overlap(first, second):
+    if first[0] & second[0]:
+        return True
+    if first[1]:
+        return second[1] or any(char.isdecimal() for char in second[0])
+    return second[1] and any(char.isdecimal() for char in first[0])
+
+
+def _compatible(first, second, shift):
+    """ Whether second may match where it overlaps first, shifted by shift """
+    overlapping = False
+    for index, item in enumerate(second):
+        if 0 <= index + shift < len(first):
+            overlapping = True
+            if not _overlap(first[index + shift], item):
+                return False
+    return overlapping
+
+
+def _conflicts(earlier, later):
+    """ Whether merging later into the pass of earlier may change the output
+
+    That happens when a match of the earlier rule may start inside a match
+    of the later one, which the alternation would find first, or when the
+    later rule may match text the earlier one produced or joined together.
+    """
+    for sequence in earlier.sequences:
+        for other in later.sequences:
+            for shift in range(1, len(other)):
+                if _compatible(other, sequence, shift):
+                    return True
+    for output in earlier.outputs:
+        for other in later.sequences:
+            if not output and len(other) > 1:
+                return True
+            for shift in range(1 - len(other), len(output)):
+                if _compatible(output, other, shift):
+                    return True
+    return False
+
+
+def _first(rules):
+    """ The characters a match of the rules may start with
+
+    Returns a (characters, digits) pair, or None when a rule may match
+    something else, such as the empty string.
+    """
+    chars = set()
+    digits = False
+    for rule in rules:
+        if rule.opaque or rule.regex.flags & re.IGNORECASE:
+            return None
+        for sequence in rule.sequences:
+            if not sequence:
+                return None
+            chars.update(sequence[0][0])
+            digits = digits or sequence[0][1]
+    return "".join(sorted(chars)), digits
+
+
+def _merge(rules):
+    """ Plans a single pass out of merged rules
+
+    Returns the pattern, the replacement of a pass made of a single rule,
+    and for merged rules what tells them apart in the pattern's matches and
+    their own (pattern, replacement) pairs, to be run one after the other on
+    texts long enough for the C-level substitutions to beat the dispatch of
+    each match in Python, with the strings they match if known. It also
+    gives the characters the matches of the pass may start with. The plan
+    only holds strings, numbers and containers, so that it can be stored as
+    an artifact.
+    """
+    sequential = tuple((rule.pattern, rule.replacement, rule.strings)
+                       for rule in rules)
+    if len(rules) == 1:
+        return (rules[0].pattern, rules[0].replacement, None, None,
+                sequential, _first(rules))
+
+    # Rules matching a known set of strings are spelled out as literals, in
+    # the order the alternation tries them, which also lets the regular
+    # expression engine skip ahead to the characters that can start a match.
+    # The matched text then tells which of those rules fired. The remaining
+    # rules are wrapped in a group and told apart by its index.
+    sources = []
+    strings = {}
+    templates = {}
+    index = 1
+    for rule in rules:
+        if rule.strings is not None:
+            for string, output in rule.strings.items():
+                if string not in strings:
+                    strings[string] = output
+                    sources.append(re.escape(string))
+            continue
+
+        sources.append("(" + rule.pattern + ")")
+        templates[index] = _TEMPLATE_REFERENCE.sub(
+            lambda reference, offset=index: "\\g<%d>" % (
+                offset + int(reference.group(1) or reference.group(2))),
+            rule.replacement)
+        index += 1 + rule.regex.groups
+
+    return ("|".join(sources), None, strings, templates, sequential,
+            _first(rules))
+
+
+def _plan(rules):
+    """ Returns the plan of the passes of a table of regular expressions """
+    compiled = [_RegexRule(pattern, replacement)
+                for pattern, replacement in rules]
+    unreachable = _unreachable(compiled)
+    passes = []
+    for index, rule in enumerate(compiled):
+        if index in unreachable:
+            continue
+        if (rule.opaque or not passes or passes[-1][-1].opaque
+                or any(_conflicts(earlier, rule) for earlier in passes[-1])):
+            passes.append([rule])
+        else:
+            passes[-1].append(rule)
+    return tuple(_merge(group) for group in passes)
+
+
+def _build(pattern, replacement, strings, templates, sequential, first):
+    """ Builds a pass of `RegexConverter` from its plan """
+    if replacement is None:
+        def replacement(match):
+            index = match.lastindex
+            if index is None:
+                return strings[match.group()]
+            return match.expand(templates[index])
+
+    rules = tuple((re.compile(rule), template)
+                  for rule, template, matched in sequential)
+
+    # Consecutive rules of literal strings make up an alternation tried in
+    # order, which reads the longest string as well unless a string comes
+    # after a shorter one it starts with. On long texts they are then run
+    # as a chain of `str.replace` calls, and the other rules with `re.sub`.
+    fallback = []
+    run = []
+    for compiled, (rule, template, matched) in zip(rules, sequential):
+        if matched is not None:
+            run.append((compiled, matched))
+            continue
+        fallback.extend(_literal_run(run))
+        fallback.append(compiled)
+        run = []
+    fallback.extend(_literal_run(run))
+    if fallback == list(rules[:1]):
+        # A single rule of its own has nothing faster to fall back on.
+        fallback = []
+    return re.compile(pattern), replacement, rules, tuple(fallback), first
+
+
+def _literal_run(run):
+    """ The steps running consecutive rules of literal strings """
+    literals = {}
+    for compiled, matched in run:
+        for string, output in matched.items():
+            literals.setdefault(string, output)
+    if not literals or not _prefix_free(literals):
+        return [compiled for compiled, matched in run]
+    return [ChainConverter(literals.items())]
+
+
+def _prefix_free(strings):
+    """ Whether no string starts with a string listed before it """
+    listed = set()
+    for string in strings:
+        if any(string[:end] in listed for end in range(1, len(string))):
+            return False
+        listed.add(string)
+    return True
+
+
+class RuleFinding:
+    """
+    A rule of a table that the analysis found to be dead or misplaced.
+
+    Attributes
+    ----------
+    kind : str
+        One of:
+            "duplicate" - a later rule for a key, which never fires;
+            "unreachable" - a rule that can never match;
+            "shadowed" - a key written after a shorter key it contains,
+            which a chain of replacements never matches and a trie only
+            matches because it reads the longest key.
+        Duplicate and unreachable rules are left out of the compiled form.
+
+    index : int
+        Position of the rule in the table.
+
+    rule : tuple
+        The rule itself.
+
+    cause : int or None
+        Position of the earlier rule responsible, if any.
+    """
+
+    def __init__(self, kind, index, rule, cause=None):
+        self.kind = kind
+        self.index = index
+        self.rule = rule
+        self.cause = cause
+
+    @property
+    def pruned(self):
+        """ Whether the rule is left out of the compiled form """
+        return self.kind != "shadowed"
+
+    def __repr__(self):
+        return "RuleFinding({!r}, {!r}, {!r}, {!r})".format(
+            self.kind, self.index, self.rule, self.cause)
+
+
+def _context_key(rule):
+    return rule[0], rule[2]
+
+
+def _prune(rules, identify=lambda rule: rule[0]):
+    """ Drops the rules with an empty key and the later rules of a key """
+    first = {}
+    effective = []
+    findings = []
+    for index, rule in enumerate(rules):
+        if not rule[0]:
+            findings.append(RuleFinding("unreachable", index, rule))
+            continue
+        identity = identify(rule)
+        if identity in first:
+            findings.append(RuleFinding("duplicate", index, rule,
+                                        first[identity]))
+            continue
+        first[identity] = index
+        effective.append(rule)
+    return tuple(effective), findings
+
+
+def _shadowed(rules):
+    """ Finds the keys written after a shorter key they contain """
+    first = {}
+    findings = []
+    for index, rule in enumerate(rules):
+        key = rule[0]
+        if not key:
+            continue
+        for length in range(1, len(key)):
+            causes = [first[key[start:start + length]]
+                      for start in range(len(key) - length + 1)
+                      if key[start:start + length] in first]
+            if causes:
+                findings.append(RuleFinding("shadowed", index, rule,
+                                            min(causes)))
+                break
+        first.setdefault(key, index)
+    return findings
+
+
+def analyze_rules(rules):
+    """ Analyses a literal rule table
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs.
+
+    Returns
+    -------
+    effective : tuple
+        The rules that may fire, as compiled.
+
+    findings : list of RuleFinding
+        Duplicate, unreachable and shadowed rules, in the order of the
+        table.
+    """
+    effective, findings = _prune(rules)
+    findings.extend(_shadowed(rules))
+    findings.sort(key=lambda finding: finding.index)
+    return effective, findings
+
+
+def analyze_context_rules(rules):
+    """ Analyses a table of rules with contexts
+
+    Rules are duplicates when they repeat both the key and the context of
+    an earlier rule. Rules with different contexts are not shadowed, as
+    they do not fire in the same places.
+
+    Parameters
+    ----------
+    rules : tuple
+        Ordered (key, value, context) triples.
+
+    Returns
+    -------
+    effective : tuple
+        The rules that may fire, as compiled.
+
+    findings : list of RuleFinding
+        Duplicate and unreachable rules, in the order of the table.
+    """
+    return _prune(rules, _context_key)
+
+
+def analyze_regex_rules(rules):
+    """ Analyses a table of regular expression rules
+
+    A rule is unreachable when every string it matches holds a string an
+    earlier rule matches, and the earlier rule replaced all of them: its
+    replacement, and those of the rules in between, are never empty and
+    never hold a character of the strings it matches, so that they can
+    neither produce one nor join its pieces together again. Only rules
+    matching a known set of strings are analysed.
+
+    Parameters
+    ----------
+    rules : sequence
+        Ordered (pattern, replacement) pairs.
+
+    Returns
+    -------
+    effective : tuple
+        The rules that may fire, as compiled.
+
+    findings : list of RuleFinding
+        Unreachable rules, in the order of the table.
+    """
+    rules = tuple(tuple(rule) for rule in rules)
+    unreachable = _unreachable([_RegexRule(pattern, replacement)
+                                for pattern, replacement in rules])
+    effective = tuple(rule for index, rule in enumerate(rules)
+                      if index not in unreachable)
+    findings = [RuleFinding("unreachable", index, rules[index], cause)
+                for index, cause in sorted(unreachable.items())]
+    return effective, findings
+
+
+def _unreachable(rules):
+    """ Maps the rules that can never match to the rule consuming them """
+    unreachable = {}
+    for index, earlier in enumerate(rules):
+        if index in unreachable or earlier.strings is None \
+                or "" in earlier.strings:
+            continue
+        alphabet = frozenset("".join(earlier.strings))
+        if not _barrier(earlier, alphabet):
+            continue
+        for later_index in range(index + 1, len(rules)):
+            if later_index in unreachable:
+                continue
+            later = rules[later_index]
+            if later.strings is not None and all(
+                    any(string in match for string in earlier.strings)
+                    for match in later.strings):
+                unreachable[later_index] = index
+            elif not _barrier(later, alphabet):
+                break
+    return unreachable
+
+
+def _barrier(rule, alphabet):
+    """ Whether no replacement of the rule holds or joins alphabet """
+    if rule.opaque:
+        return False
+    characters = (alphabet, False)
+    return all(output and not any(_overlap(item, characters)
+                                  for item in output)
+               for output in rule.outputs)
+
+
+def compiled_findings():
+    """ Returns the findings of the analysis of the compiled tables
+
+    Returns
+    -------
+    findings : list
+        (rules, findings) pairs, for each table compiled so far that has
+        findings, in the order they were compiled.
+    """
+    tables = {}
+    for cache, analyze in ((_compiled, analyze_rules),
+                           (_compiled_token, analyze_rules),
+                           (_compiled_context, analyze_context_rules)):
+        for rules, converter in cache.values():
+            tables.setdefault(id(rules), (rules, analyze))
+    for rules in _compiled_regex:
+        tables.setdefault(id(rules), (rules, analyze_regex_rules))
+    results = []
+    for rules, analyze in tables.values():
+        findings = analyze(rules)[1]
+        if findings:
+            results.append((rules, findings))
+    return results
+
+
+def table_name(rules):
+    """ Returns the name of a rule table, found in the loaded modules
+
+    Parameters
+    ----------
+    rules : sequence
+        Rule table, or its copy as a tuple of tuples.
+
+    Returns
+    -------
+    name : str
+        Module and name of the table, such as
+        "pieoffice.luwian.ASCII_TO_LUWIAN", or None if it was not found.
+    """
+    copied = isinstance(rules, tuple) \
+        and all(isinstance(rule, tuple) for rule in rules)
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith("pieoffice") or module is None:
+            continue
+        for name, value in list(vars(module).items()):
+            if not name.isupper() or not isinstance(value, (list, tuple)):
+                continue
+            if value is rules or copied and len(value) == len(rules) \
+                    and all(isinstance(rule, (list, tuple))
+                            for rule in value) \
+                    and tuple(map(tuple, value)) == rules:
+                return "{}.{}".format(module_name, name)
+    return None
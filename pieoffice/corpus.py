@@ -0,0 +1,377 @@
+#! /usr/bin/env python3
+
+""" Synthetic corpora
+
+Generates pseudo-texts in the notation each converter reads, so that
+benchmarks and bug reports can be reproduced without sharing the corpora
+they were found on. The signs of a language are read from its rule table:
+syllables and logograms for syllabaries, such as Linear B or Hieroglyphic
+Luwian, vowels and consonants for alphabets, such as Armenian or Harvard-
+Kyoto. Keys made only of digits or punctuation are left to the numbers and
+marks of the language.
+
+A lexicon of pseudo-words is built from the signs, the most frequent signs
+being drawn more often, and the text is drawn from the lexicon, both
+following Zipf's law: the frequency of the n-th sign or word is
+proportional to 1/n. Words are separated by spaces and lines, with the
+numbers, editorial marks and punctuation of the language, such as the
+brackets of lacunae in Linear B or the dandas of Vedic.
+
+Everything is drawn from a `random.Random` seeded with the given seed,
+whose sequence does not depend on the machine, so that a language, a
+number of words and a seed always give the same text.
+
+    $ python -m pieoffice.corpus linearb 1000 42 > linearb.txt
+
+The file can be imported as a module and contains the following:
+    Profile - description of the texts of a language.
+    PROFILES - the profiles of the languages shipped with pieoffice.
+    generate - returns a pseudo-text of a number of words.
+    sample - returns a pseudo-text of a number of characters.
+
+Usage
+-----
+
+    > print(generate("linearb", 8, seed=1))
+    + V mu 652 V da o-ju-ri-da da do-da 4 HORD
+"""
+
+import importlib
+import itertools
+import random
+import sys
+import unicodedata
+
+from pieoffice.registry import get_converter, get_language
+
+# Marks put around a word, and marks standing for a word, as in editions.
+LEIDEN = (("[", "]"), ("[", ""), ("", "]"), ("", "?"), ("⸢", "⸣"),
+          ("<", ">"), ("{", "}"))
+LEIDEN_GAPS = ("[ ]", "[•]", "[• •]", "vacat")
+
+# Number of pseudo-words of a lexicon.
+LEXICON = 5000
+
+# Share of the words ending a line.
+LINE_BREAKS = 0.1
+
+
+class Profile:
+    """
+    Description of the texts of a language.
+
+    Attributes
+    ----------
+    module : str
+        Module holding the rule table.
+
+    table : str
+        Name of the rule table, or of a dict, whose keys are the signs of
+        the language.
+
+    joiner : str
+        String between the signs of a word, "-" for syllabaries, whose
+        signs starting with a consonant are read as consonants.
+
+    logograms : bool or tuple
+        Whether keys starting with a capital are logograms, standing for
+        whole words, or the keys which are. Keys starting with "*" or "("
+        are always logograms, and are left out of languages without any.
+
+    vowels : tuple
+        Beginnings of the keys read as vowels, by default those starting
+        with a, e, i, o or u, in either case and with any diacritic.
+
+    codas : tuple
+        Keys only ending syllables, such as the anusvara and visarga.
+
+    accents : tuple
+        Accents following vowels, as in Harvard-Kyoto.
+
+    regex : bool
+        Whether the keys are regular expressions. Keys using other syntax
+        than backslashes are then left out.
+
+    numbers : float
+        Share of the words followed by a number.
+
+    marks : tuple
+        Pairs of strings put before and after a word.
+
+    gaps : tuple
+        Strings standing for a word, such as a lacuna.
+
+    mark_rate : float
+        Share of the words given a mark or replaced by a gap.
+
+    source : str
+        Language whose converter gives the text from one of its own, for
+        converters reading a script rather than a transliteration.
+
+    Methods
+    -------
+    signs(self)
+        Returns the signs of the language, by kind.
+    """
+
+    def __init__(self, module, table, joiner="", logograms=False,
+                 vowels=("a", "e", "i", "o", "u", "A", "E", "I", "O", "U"),
+                 codas=(), accents=(), regex=False, numbers=0.0,
+                 marks=LEIDEN, gaps=LEIDEN_GAPS, mark_rate=0.05, source=None):
+        self.module = module
+        self.table = table
+        self.joiner = joiner
+        self.logograms = logograms
+        self.vowels = vowels
+        self.codas = codas
+        self.accents = accents
+        self.regex = regex
+        self.numbers = numbers
+        self.marks = marks
+        self.gaps = gaps
+        self.mark_rate = mark_rate
+        self.source = source
+
+    def signs(self):
+        """ Returns the signs of the language, by kind
+
+        Keys made only of digits and punctuation are left out.
+
+        Returns
+        -------
+        signs : dict
+            Lists of "vowels", "consonants", "codas" and "logograms",
+            shorter keys and keys earlier in the table first.
+        """
+        rules = getattr(importlib.import_module(self.module), self.table)
+        if isinstance(rules, dict):
+            rules = rules.items()
+        signs = {"vowels": [], "consonants": [], "codas": [],
+                 "logograms": []}
+        logograms = () if isinstance(self.logograms, bool) else self.logograms
+        seen = set()
+        for rule in rules:
+            key = _unescape(rule[0]) if self.regex else rule[0]
+            if key is None or key in seen \
+                    or not any(char.isalpha() for char in key):
+                continue
+            seen.add(key)
+            if key in logograms:
+                signs["logograms"].append(key)
+            elif key[0] in "*(" or self.logograms is True \
+                    and key[0].isupper():
+                if self.logograms is True:
+                    signs["logograms"].append(key)
+            elif key in self.codas:
+                signs["codas"].append(key)
+            elif unicodedata.normalize("NFD", key).startswith(self.vowels):
+                signs["vowels"].append(key)
+            else:
+                signs["consonants"].append(key)
+        for kind in signs:
+            signs[kind].sort(key=len)
+        return signs
+
+
+def _unescape(pattern):
+    """ The string a regular expression matches, None if not a string """
+    output = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            output.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in "[](){}|*+?^$.":
+            return None
+        else:
+            output.append(char)
+    return "".join(output)
+
+
+# Harvard-Kyoto, in which Vedic is typed.
+_HK = dict(vowels=("a", "A", "i", "I", "u", "U", "R", "lR", "e", "o"),
+           codas=("M", "H"), accents=("/",), numbers=0.01,
+           marks=(("", " |"), ("", " ||")), gaps=(), mark_rate=0.1)
+
+PROFILES = {
+    "pie": Profile("pieoffice.pie", "ASCII_TO_PIE",
+                   marks=(("*", ""), ("", "-")), gaps=()),
+    "greek": Profile("pieoffice.greek", "BETACODE_MAP",
+                     vowels=("a", "e", "h", "i", "o", "u", "w"),
+                     marks=(("", ","), ("", "."), ("", ";"), ("", ":")),
+                     gaps=(), mark_rate=0.1),
+    "linearb": Profile("pieoffice.linearb", "ASCII_TO_LINEARB", joiner="-",
+                       logograms=True, numbers=0.15),
+    "cypriot": Profile("pieoffice.cypriot", "ASCII_TO_CYPRIOT", joiner="-",
+                       logograms=True, numbers=0.02),
+    "luwian": Profile("pieoffice.luwian", "ASCII_TO_LUWIAN", joiner="-",
+                      logograms=True, numbers=0.03),
+    "lycian": Profile("pieoffice.lycian", "ASCII_TO_LYCIAN"),
+    "lydian": Profile("pieoffice.lydian", "ASCII_TO_LYDIAN"),
+    "carian": Profile("pieoffice.carian", "ASCII_TO_CARIAN"),
+    "gothic": Profile("pieoffice.gothic", "ASCII_TO_GOTHIC",
+                      marks=(("", " ·"), ("", " :")), gaps=()),
+    "armenian": Profile("pieoffice.armenian",
+                        "ASCII_TO_ARMENIAN_SCRIPT_MINISCULES", regex=True,
+                        numbers=0.01,
+                        marks=(("", "."), ("", ","), ("", "?"), ("", ";"),
+                               ("``", "''")),
+                        gaps=(), mark_rate=0.1),
+    "vedic": Profile("pieoffice.vedic", "HK_TO_DEVA_RULES", **_HK),
+    "vedicdeva": Profile("pieoffice.vedic", "HK_TO_DEVA_RULES",
+                         source="vedic", **_HK),
+    "avestan": Profile("pieoffice.avestan", "ASCII_TO_AVESTAN_SCRIPT",
+                       regex=True, marks=(("", "."),), gaps=(),
+                       mark_rate=0.5),
+    "oldpersian": Profile("pieoffice.oldpersian", "ASCII_TO_OLDPERSIAN",
+                          logograms=("ahuramazda1", "ahuramazda2",
+                                     "ahuramazda3", "xshayathia", "dahyaus1",
+                                     "dahyaus2", "baga", "bumis")),
+    "ogham": Profile("pieoffice.ogham", "ASCII_TO_OGHAM",
+                     marks=((">", ""), ("", "<")), gaps=()),
+    "oscan": Profile("pieoffice.oscan", "ASCII_TO_OSCAN"),
+}
+PROFILES["vedictranslit"] = PROFILES["vedic"]
+PROFILES["avestantranslit"] = PROFILES["avestan"]
+
+
+def _zipf(generator, population):
+    """ Returns a function drawing from population, by Zipf's law """
+    weights = list(itertools.accumulate(
+        1 / rank for rank in range(1, len(population) + 1)))
+    choices = generator.choices
+    return lambda: choices(population, cum_weights=weights)[0]
+
+
+def _lexicon(profile, generator):
+    """ Returns pseudo-words, more frequent ones first """
+    signs = profile.signs()
+    vowels = signs["vowels"]
+    consonants = signs["consonants"]
+    codas = signs["codas"] or consonants
+    if vowels:
+        vowel = _zipf(generator, vowels)
+    if consonants:
+        consonant = _zipf(generator, consonants)
+    if codas:
+        coda = _zipf(generator, codas)
+    if signs["logograms"]:
+        logogram = _zipf(generator, signs["logograms"])
+    accents = profile.accents
+    random = generator.random
+
+    lexicon = []
+    while len(lexicon) < LEXICON:
+        if signs["logograms"] and random() < 0.2:
+            lexicon.append(logogram())
+            continue
+        syllables = generator.choices((1, 2, 3, 4), (3, 4, 2, 1))[0]
+        parts = []
+        for index in range(syllables):
+            # Only words start with a vowel, avoiding hiatus.
+            onset = consonants and (index or random() < 0.8 or not vowels)
+            if profile.joiner:
+                parts.append(consonant() if onset else vowel())
+                continue
+            if onset:
+                parts.append(consonant())
+            if vowels:
+                parts.append(vowel())
+                if accents and random() < 0.2:
+                    parts.append(generator.choice(accents))
+            if codas and random() < 0.2:
+                parts.append(coda())
+        lexicon.append(profile.joiner.join(parts))
+    return lexicon
+
+
+def _lines(profile, words, generator):
+    """ Yields the lines of a text, made of words, numbers and marks """
+    word = _zipf(generator, _lexicon(profile, generator))
+    number = _zipf(generator, range(1, 1000))
+    random = generator.random
+    line = []
+    for _ in range(words):
+        if random() < profile.mark_rate:
+            if profile.gaps and random() < 0.2:
+                line.append(generator.choice(profile.gaps))
+            else:
+                before, after = generator.choice(profile.marks)
+                line.append(before + word() + after)
+        else:
+            line.append(word())
+        if random() < profile.numbers:
+            line.append(str(number()))
+        if random() < LINE_BREAKS:
+            yield " ".join(line)
+            line = []
+    if line:
+        yield " ".join(line)
+
+
+def generate(language, words=1000, seed=0):
+    """ Returns a pseudo-text of a language
+
+    Parameters
+    ----------
+    language : str
+        Name of the language, as given to `pieoffice convert`.
+
+    words : int
+        Number of words of the text, besides numbers and marks.
+
+    seed : int
+        Seed of the random draws.
+
+    Returns
+    -------
+    text : str
+        Lines of about 10 words, in the notation the converter reads.
+    """
+    name = get_language(language).name
+    try:
+        profile = PROFILES[name]
+    except KeyError:
+        raise ValueError("No corpus profile for: {}".format(name)) from None
+
+    lines = _lines(profile, words, random.Random(seed))
+    text = "".join(line + "\n" for line in lines)
+    if profile.source is not None:
+        text = get_converter(profile.source)[0](text)
+    return text
+
+
+def sample(language, length, seed=0):
+    """ Returns a pseudo-text of a language with the given length
+
+    Parameters
+    ----------
+    language : str
+        Name of the language, as given to `pieoffice convert`.
+
+    length : int
+        Number of characters of the text.
+
+    seed : int
+        Seed of the random draws.
+
+    Returns
+    -------
+    text : str
+        Beginning of the text `generate` gives with the same seed.
+    """
+    words = length // 4 + 1
+    while True:
+        text = generate(language, words, seed)
+        if len(text) >= length:
+            return text[:length]
+        words *= 2
+
+
+if __name__ == "__main__":
+    language = sys.argv[1]
+    words = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    sys.stdout.write(generate(language, words, seed))
@@ -0,0 +1,715 @@
+#! /usr/bin/env python3
+
+""" Longest-match transliteration engine
+
+This module implements the conversion engine shared by the script converters.
+Instead of running one `str.replace` pass over the whole text for every rule,
+the rules are loaded into a character trie and the text is converted in a
+single left-to-right pass: at each position the longest rule key starting
+there is replaced by its value, and characters not covered by any rule are
+copied unchanged. The literal strings among the rules of regular
+expression tables are still applied with `str.replace`, whose passes cost
+less than a walk in Python for a few rules, but in an order giving that
+same longest match.
+
+The file can be imported as a module and contains the following classes:
+    TrieConverter - converts strings with an ordered table of (key, value)
+    rules.
+    ChainConverter - converts strings with an ordered chain of
+    `str.replace` calls, for a few literal rules.
+    ContextConverter - converts strings with literal rules depending on
+    their context, such as word-initial vowels.
+    TokenConverter - converts strings with literal rules, looking whole
+    logograms up in a dictionary.
+    RegexConverter - converts strings with precompiled regular expression
+    passes, for the tables whose keys are patterns.
+    ReverseConverter - converts script back to transliteration, optionally
+    separating consecutive readings.
+
+Usage
+-----
+
+    > converter = TrieConverter([("-", ""), ("ka", "𐀏"), ("a", "𐀀")])
+    > converter.convert("a-ka")
+    + 𐀀𐀏
+"""
+
+import functools
+import heapq
+import re
+
+
+class TrieConverter:
+    """
+    Convert strings with a table of literal rules in a single pass.
+
+    The rules are loaded into a character trie made of nested dictionaries,
+    which are cheap to build and walk. When
+    two rules share the same key, the first one in the table is kept, as it
+    was the one applied by the former chain of replacements. A key is
+    always read whole rather than as a shorter key it extends, such as
+    Linear B `*181` rather than `*18`, whatever their order in the table.
+    Matching at a position takes at most one step per character of the
+    longest key, however many rules the table has. Runs of characters that
+    no rule starts with, such as punctuation, digits and spaces, are found
+    with a compiled character class and copied as a whole.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs the converter was built from.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string applying the longest matching rule at each
+        position.
+    """
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+
+        # Each node maps a character to the next node; the value of a rule
+        # ending at a node is stored under the None key.
+        self._root = {}
+        for key, value in self.rules:
+            if not key:
+                continue
+            node = self._root
+            for char in key:
+                node = node.setdefault(char, {})
+            node.setdefault(None, value)
+
+        # Characters no rule starts with are copied in runs, up to the next
+        # character that may start one.
+        self._start = None
+        if self._root:
+            self._start = re.compile(
+                "[" + "".join(map(re.escape, sorted(self._root))) + "]")
+
+    def convert(self, text):
+        """ Converts a string with the converter's rules
+
+        Parameters
+        ----------
+        text : str
+            Text to be converted.
+
+        Returns
+        -------
+        output : str
+            Converted text.
+        """
+        root = self._root
+        if not root:
+            return text
+        search = self._start.search
+        output = []
+        append = output.append
+        position = 0
+        length = len(text)
+        while position < length:
+            node = root.get(text[position])
+            if node is None:
+                end = position + 1
+                if end < length and text[end] not in root:
+                    start = search(text, end)
+                    end = length if start is None else start.start()
+                append(text[position:end])
+                position = end
+                continue
+
+            match = node.get(None)
+            end = cursor = position + 1
+            while cursor < length:
+                node = node.get(text[cursor])
+                if node is None:
+                    break
+                cursor += 1
+                if None in node:
+                    match = node[None]
+                    end = cursor
+
+            if match is None:
+                append(text[position])
+                position += 1
+            else:
+                append(match)
+                position = end
+        return "".join(output)
+
+    __call__ = convert
+
+
+class ChainConverter:
+    """
+    Convert strings with an ordered chain of `str.replace` calls.
+
+    This is how the converters worked before `TrieConverter`, and remains the
+    fastest way to apply a few rules: each call runs over the whole text in
+    C. `RegexConverter` applies the literal strings of its tables with it.
+    The rules are reordered so that the chain gives the same result as the
+    longest match of `TrieConverter`: a key is replaced before any shorter
+    key it contains, before any key it overlaps from the left, such as `ab`
+    before `bc`, and before any rule whose value it could be read from
+    again. Single character keys deleted, such as the Linear B `-`, go last.
+    The keys that no order satisfies, because they must come before one
+    another, and those that must come before them are found first by a
+    regular expression alternation. If that pre-pass deletes a key, the text
+    between its matches is converted piece by piece, so as not to join it.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs the converter was built from.
+
+    chain : tuple
+        (key, value) pairs replaced one after the other.
+
+    prepass : dict
+        Rules found by the alternation before the chain runs.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string applying the longest matching rule at each
+        position.
+    """
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        value = {}
+        for key, replacement in self.rules:
+            if key:
+                value.setdefault(key, replacement)
+        index = {key: number for number, key in enumerate(value)}
+
+        # Keys by their proper prefixes, proper suffixes and substrings.
+        prefixes = {}
+        suffixes = {}
+        containing = {}
+        for key in value:
+            for start in range(len(key)):
+                for end in range(start + 1, len(key) + 1):
+                    if end - start < len(key):
+                        containing.setdefault(key[start:end], set()).add(key)
+            for cut in range(1, len(key)):
+                prefixes.setdefault(key[:cut], set()).add(key)
+                suffixes.setdefault(key[cut:], set()).add(key)
+
+        # after[key] holds the keys to be replaced after key.
+        after = {key: set() for key in value}
+        for key in value:
+            for cut in range(1, len(key)):
+                after[key].update(prefixes.get(key[cut:], ()))
+        for shorter, keys in containing.items():
+            if shorter in after:
+                for key in keys:
+                    after[key].add(shorter)
+        for key, replacement in value.items():
+            if not replacement:
+                continue
+            earlier = set(containing.get(replacement, ()))
+            for start in range(len(replacement)):
+                for end in range(start + 1, len(replacement) + 1):
+                    if replacement[start:end] in after:
+                        earlier.add(replacement[start:end])
+            for cut in range(1, len(replacement)):
+                earlier.update(prefixes.get(replacement[cut:], ()))
+                earlier.update(suffixes.get(replacement[:cut], ()))
+            for other in earlier:
+                after[other].add(key)
+        for key in value:
+            after[key].discard(key)
+
+        # Removing the keys with nothing after them, repeatedly, leaves the
+        # cycles and the keys before them, which the pre-pass replaces,
+        # along with deletions that cannot go last.
+        before = {key: set() for key in value}
+        for key, later in after.items():
+            for other in later:
+                before[other].add(key)
+        remaining = {key: len(later) for key, later in after.items()}
+        free = [key for key, count in remaining.items() if not count]
+        while free:
+            key = free.pop()
+            del remaining[key]
+            for other in before[key]:
+                remaining[other] -= 1
+                if not remaining[other]:
+                    free.append(other)
+        prepass = set(remaining)
+        prepass.update(key for key in value if not value[key]
+                       and (len(key) > 1 or after[key]))
+        pending = list(prepass)
+        while pending:
+            for other in before[pending.pop()]:
+                if other not in prepass:
+                    prepass.add(other)
+                    pending.append(other)
+
+        # The others in table order as far as the constraints allow,
+        # deletions last.
+        count = {key: 0 for key in value if key not in prepass}
+        for key in count:
+            for other in after[key]:
+                count[other] += 1
+        ready = [(not value[key], index[key], key)
+                 for key, number in count.items() if not number]
+        heapq.heapify(ready)
+        chain = []
+        while ready:
+            key = heapq.heappop(ready)[2]
+            chain.append((key, value[key]))
+            for other in after[key]:
+                count[other] -= 1
+                if not count[other]:
+                    heapq.heappush(ready,
+                                   (not value[other], index[other], other))
+        self.chain = tuple(chain)
+
+        self.prepass = {key: value[key]
+                        for key in sorted(prepass, key=index.get)}
+        self._pattern = None
+        self._replace = self.prepass.__getitem__
+        # Deleting a key found by the pre-pass would join the text around
+        # it, which is then converted piece by piece instead.
+        self._separate = "" in self.prepass.values()
+        if self.prepass:
+            keys = sorted(self.prepass, key=len, reverse=True)
+            self._pattern = re.compile(
+                "(" + "|".join(map(re.escape, keys)) + ")")
+
+    def convert(self, text):
+        """ Converts a string with the converter's rules
+
+        Parameters
+        ----------
+        text : str
+            Text to be converted.
+
+        Returns
+        -------
+        output : str
+            Converted text.
+        """
+        if self._pattern is not None:
+            # Text between matches at even indices, matched keys at odd ones.
+            parts = self._pattern.split(text)
+            parts[1::2] = map(self._replace, parts[1::2])
+            if self._separate:
+                parts[::2] = map(self._chain, parts[::2])
+                return "".join(parts)
+            text = "".join(parts)
+        return self._chain(text)
+
+    def _chain(self, text):
+        """ Applies the chain of replacements to a string """
+        for key, value in self.chain:
+            text = text.replace(key, value)
+        return text
+
+    __call__ = convert
+
+
+class ContextConverter:
+    """
+    Convert strings with literal rules conditioned on their context.
+
+    Rules are (key, value, context) triples, where context is one of:
+        None - the rule applies anywhere;
+        "initial" - only at the start of a word;
+        "final" - only at the end of a word;
+        "joined" - only right after a rule leaving a coda.
+    Words are delimited by the boundary characters and the ends of the text.
+
+    A value may also be a (value, coda) pair. The coda is written after the
+    value unless the next match is a joined rule, which replaces it. This is
+    how a consonant is written with a virama, unless a vowel sign follows.
+
+    At each position the longest key whose context holds is applied; among
+    the rules of a key, those with a context are tried before the others,
+    then in the order of the table. As in `TrieConverter`, runs of
+    characters that no rule starts with are copied as a whole.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (key, value, context) triples the converter was built from.
+
+    boundaries : str
+        Characters delimiting words.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string applying the longest matching rule at each
+        position.
+    """
+
+    CONTEXTS = (None, "initial", "final", "joined")
+
+    def __init__(self, rules, boundaries=" \n"):
+        self.rules = tuple(rules)
+        self.boundaries = boundaries
+
+        # Each node maps a character to the next node, and the None key to
+        # the (value, coda, context) candidates of the rules ending there.
+        self._root = {}
+        for key, value, context in self.rules:
+            if context not in self.CONTEXTS:
+                raise ValueError("Unknown context: {}".format(context))
+            if not key:
+                continue
+            value, coda = value if isinstance(value, tuple) else (value, None)
+            node = self._root
+            for char in key:
+                node = node.setdefault(char, {})
+            node.setdefault(None, []).append((value, coda, context))
+        self._sort(self._root)
+
+        self._start = None
+        if self._root:
+            self._start = re.compile(
+                "[" + "".join(map(re.escape, sorted(self._root))) + "]")
+
+    def _sort(self, node):
+        for char, child in node.items():
+            if char is None:
+                child.sort(key=lambda candidate: candidate[2] is None)
+            else:
+                self._sort(child)
+
+    def convert(self, text):
+        """ Converts a string with the converter's rules
+
+        Parameters
+        ----------
+        text : str
+            Text to be converted.
+
+        Returns
+        -------
+        output : str
+            Converted text.
+        """
+        root = self._root
+        if not root:
+            return text
+        boundaries = self.boundaries
+        search = self._start.search
+        output = []
+        append = output.append
+        coda = None
+        position = 0
+        length = len(text)
+        while position < length:
+            node = root.get(text[position])
+            if node is None:
+                if coda is not None:
+                    append(coda)
+                    coda = None
+                end = position + 1
+                if end < length and text[end] not in root:
+                    start = search(text, end)
+                    end = length if start is None else start.start()
+                append(text[position:end])
+                position = end
+                continue
+
+            initial = position == 0 or text[position - 1] in boundaries
+            match = None
+            cursor = position
+            while node is not None:
+                cursor += 1
+                for candidate in node.get(None, ()):
+                    context = candidate[2]
+                    if context is None \
+                            or context == "joined" and coda is not None \
+                            or context == "initial" and initial \
+                            or context == "final" and (
+                                cursor == length
+                                or text[cursor] in boundaries):
+                        match = candidate
+                        end = cursor
+                        break
+                if cursor == length:
+                    break
+                node = node.get(text[cursor])
+
+            if match is None:
+                if coda is not None:
+                    append(coda)
+                    coda = None
+                append(text[position])
+                position += 1
+            else:
+                value, next_coda, context = match
+                if coda is not None and context != "joined":
+                    append(coda)
+                append(value)
+                coda = next_coda
+                position = end
+        if coda is not None:
+            append(coda)
+        return "".join(output)
+
+    __call__ = convert
+
+
+class TokenConverter:
+    """
+    Convert strings with literal rules, looking whole logograms up.
+
+    Logograms and sign numbers, such as Luwian `MAGNUS.REX` or Linear B
+    `*180`, are words of their own, starting with one of a few characters.
+    Runs of such words are found by a single regular expression, split on
+    their spaces, and each word is looked up in a dictionary of the keys.
+    Only the words that are not keys, and the text between the runs, go
+    through a `TrieConverter`. As long as no key holds a space, a match can
+    never cross a word, so the result is that of the trie on the whole
+    text; tables with such keys are converted by the trie alone.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs the converter was built from.
+
+    initials : str
+        Regular expression character class of the characters a logogram
+        starts with, such as "[A-Z*]".
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string applying the longest matching rule at each
+        position.
+    """
+
+    def __init__(self, rules, initials):
+        self.rules = tuple(rules)
+        self.initials = initials
+        self._converter = TrieConverter(self.rules)
+        self._words = {}
+        for key, value in self.rules:
+            if key:
+                self._words.setdefault(key, value)
+
+        # The lookbehind follows the first character, so that the search
+        # can skip ahead to the characters a logogram starts with.
+        self._split = None
+        if not any(char.isspace() for key in self._words for char in key):
+            self._split = re.compile(
+                r"({0}(?<!\S.)\S*(?: +{0}\S*)*)".format(initials),
+                re.DOTALL).split
+
+    def _run(self, run):
+        words = run.split(" ")
+        values = list(map(self._words.get, words))
+        if None in values:
+            convert = self._converter.convert
+            values = [convert(word) if value is None else value
+                      for word, value in zip(words, values)]
+        return " ".join(values)
+
+    def convert(self, text):
+        """ Converts a string with the converter's rules
+
+        Parameters
+        ----------
+        text : str
+            Text to be converted.
+
+        Returns
+        -------
+        output : str
+            Converted text.
+        """
+        if self._split is None:
+            return self._converter.convert(text)
+
+        # Text between runs at even indices, runs of logograms at odd ones.
+        parts = self._split(text)
+        parts[::2] = map(self._converter.convert, parts[::2])
+        parts[1::2] = map(self._run, parts[1::2])
+        return "".join(parts)
+
+    __call__ = convert
+
+
+class RegexConverter:
+    """
+    Convert strings with a sequence of precompiled regular expression passes.
+
+    Each pass is a compiled pattern and its replacement, which is either a
+    template string or a function dispatching on the match. Passes are built
+    by `pieoffice.compiler.compile_regex_rules`, which merges as many rules
+    as possible into a single alternation, and are given as (pattern,
+    replacement, rules, fallback, first) tuples: fallback lists the steps
+    standing for the pass on long texts, and first is the (characters,
+    digits) pair the matches of the pass may start with, or None.
+
+    A merged pass pays a Python call for every match, while running its
+    rules one by one costs a C-level scan per rule. The latter is faster once
+    the text is longer than about one character per scan, so merged passes
+    keep their rules to fall back on for long texts. Consecutive rules of
+    literal strings are run there by a `ChainConverter`, whose `str.replace`
+    calls are cheaper than `re.sub` calls, and so is a pass of a single
+    literal rule.
+
+    Passes whose matches start with a known set of characters, such as the
+    Armenian numerals with a digit, are skipped along with the following
+    such passes when the text holds none of the characters any of them
+    starts with: a single search then stands for a scan per rule.
+
+    Attributes
+    ----------
+    passes : tuple
+        Ordered (pattern, replacement, rules) triples, where rules holds the
+        compiled (pattern, replacement) pairs merged into the pass.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string running every pass in order.
+    """
+
+    def __init__(self, passes):
+        passes = tuple(passes)
+        self.passes = tuple(step[:3] for step in passes)
+
+        # Each pass is guarded by the characters the matches of the passes
+        # from it to the end of its run may start with, and the run ends at
+        # the first pass whose matches may start with anything.
+        self._passes = []
+        chars = set()
+        digits = False
+        end = len(passes)
+        for index in reversed(range(len(passes))):
+            pattern, replacement, rules, fallback, first = passes[index]
+            fallback, limit = self._sequence(fallback)
+            if first is None:
+                chars = set()
+                digits = False
+                end = index
+                guard = None
+            else:
+                chars.update(first[0])
+                digits = digits or first[1]
+                source = "".join(map(re.escape, sorted(chars)))
+                if digits:
+                    source += "\\d"
+                guard = re.compile("[" + source + "]" if source
+                                   else "(?!)").search
+            self._passes.append((pattern.sub, replacement, fallback, limit,
+                                 guard, index + 1 if guard is None else end))
+        self._passes.reverse()
+
+    @staticmethod
+    def _sequence(steps):
+        """ Returns a function running steps one after the other
+
+        Steps are `ChainConverter` objects or (pattern, replacement) pairs.
+        The number of scans of the text they make is returned as well.
+        """
+        if not steps:
+            return None, 0
+        calls = []
+        scans = 0
+        for step in steps:
+            if isinstance(step, ChainConverter):
+                calls.append(step.convert)
+                scans += len(step.chain) + bool(step.prepass)
+            else:
+                calls.append(functools.partial(step[0].sub, step[1]))
+                scans += 1
+
+        def convert(text):
+            for call in calls:
+                text = call(text)
+            return text
+
+        return convert, scans
+
+    def convert(self, text):
+        """ Converts a string with the converter's passes
+
+        Parameters
+        ----------
+        text : str
+            Text to be converted.
+
+        Returns
+        -------
+        output : str
+            Converted text.
+        """
+        passes = self._passes
+        index = 0
+        while index < len(passes):
+            sub, replacement, fallback, limit, guard, end = passes[index]
+            if guard is not None and guard(text) is None:
+                index = end
+                continue
+            index += 1
+            if fallback is not None and len(text) > limit:
+                text = fallback(text)
+            else:
+                text = sub(replacement, text)
+        return text
+
+    __call__ = convert
+
+
+class ReverseConverter:
+    """
+    Convert script back to transliteration with an inverted rule table.
+
+    The glyphs are looked up in a `TrieConverter`, so the conversion is a
+    single pass over the text. Syllabic scripts join the readings of
+    consecutive glyphs with a separator, as their transliterations do with
+    dashes: each reading is wrapped in NUL marks, and the marks between two
+    readings become the separator while the others are dropped.
+
+    Attributes
+    ----------
+    rules : tuple
+        (glyph, reading) pairs, one reading per glyph.
+
+    separator : str
+        String put between the readings of consecutive glyphs.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string of glyphs to their readings.
+    """
+
+    def __init__(self, rules, separator=""):
+        self.rules = tuple(rules)
+        self.separator = separator
+        rules = self.rules
+        if separator:
+            rules = tuple((glyph, "\0" + reading + "\0")
+                          for glyph, reading in rules)
+        self._converter = TrieConverter(rules)
+
+    def convert(self, text):
+        """ Converts a string of glyphs to their readings
+
+        Parameters
+        ----------
+        text : str
+            Text in the script.
+
+        Returns
+        -------
+        output : str
+            Transliterated text.
+        """
+        text = self._converter.convert(text)
+        if self.separator:
+            text = text.replace("\0\0", self.separator).replace("\0", "")
+        return text
+
+    __call__ = convert
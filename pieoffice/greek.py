@@ -18,11 +18,438 @@ letters:
     *s4     ϡ
     s5       ϻ
     *s5       Ϻ
+
+Both directions read the text in a single pass: alpha_to_greek converts Beta
+Code, optionally to NFC or NFD Greek, and greek_to_alpha converts Greek back
+to Beta Code, whatever its normal form.
 """
 
-from betacode.conv import beta_to_uni
+import itertools
+import re
+import unicodedata
+
+from pieoffice.compiler import compile_rules, get_engine
+
+# Beta Code tokens and their Greek letters, as in betacode 1.1, whose
+# converter they must keep agreeing with. The table is copied from betacode
+# under the following notice:
+#
+# Copyright 2026 Matias Grioni
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the
+# following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE
+# USE OR OTHER DEALINGS IN THE SOFTWARE.
+BETACODE_MAP = {
+    # No marks
+    "a": "\u03b1",
+    "b": "\u03b2",
+    "g": "\u03b3",
+    "d": "\u03b4",
+    "e": "\u03b5",
+    "z": "\u03b6",
+    "h": "\u03b7",
+    "q": "\u03b8",
+    "i": "\u03b9",
+    "k": "\u03ba",
+    "l": "\u03bb",
+    "m": "\u03bc",
+    "n": "\u03bd",
+    "c": "\u03be",
+    "o": "\u03bf",
+    "p": "\u03c0",
+    "r": "\u03c1",
+    "s": "\u03c3",
+    "s1": "\u03c3",
+    "s2": "\u03c2",
+    "s3": "\u03f2",
+    "t": "\u03c4",
+    "u": "\u03c5",
+    "f": "\u03c6",
+    "x": "\u03c7",
+    "y": "\u03c8",
+    "w": "\u03c9",
+    "v": "\u03dd",
+    "*a": "\u0391",
+    "*b": "\u0392",
+    "*g": "\u0393",
+    "*d": "\u0394",
+    "*e": "\u0395",
+    "*z": "\u0396",
+    "*h": "\u0397",
+    "*q": "\u0398",
+    "*i": "\u0399",
+    "*k": "\u039a",
+    "*l": "\u039b",
+    "*m": "\u039c",
+    "*n": "\u039d",
+    "*c": "\u039e",
+    "*o": "\u039f",
+    "*p": "\u03a0",
+    "*r": "\u03a1",
+    "*s": "\u03a3",
+    "*s3": "\u03f9",
+    "*t": "\u03a4",
+    "*u": "\u03a5",
+    "*f": "\u03a6",
+    "*x": "\u03a7",
+    "*y": "\u03a8",
+    "*w": "\u03a9",
+    "*v": "\u03dc",
+    # Smooth breathing
+    "a)": "\u1f00",
+    "e)": "\u1f10",
+    "h)": "\u1f20",
+    "i)": "\u1f30",
+    "o)": "\u1f40",
+    "u)": "\u1f50",
+    "w)": "\u1f60",
+    "r)": "\u1fe4",
+    "*)a": "\u1f08",
+    "*)e": "\u1f18",
+    "*)h": "\u1f28",
+    "*)i": "\u1f38",
+    "*)o": "\u1f48",
+    "*)w": "\u1f68",
+    # Rough breathing
+    "a(": "\u1f01",
+    "e(": "\u1f11",
+    "h(": "\u1f21",
+    "i(": "\u1f31",
+    "o(": "\u1f41",
+    "u(": "\u1f51",
+    "w(": "\u1f61",
+    "r(": "\u1fe5",
+    "*(a": "\u1f09",
+    "*(e": "\u1f19",
+    "*(h": "\u1f29",
+    "*(i": "\u1f39",
+    "*(o": "\u1f49",
+    "*(u": "\u1f59",
+    "*(w": "\u1f69",
+    "*(r": "\u1fec",
+    # Acute accent and grave accent
+    "a\\": "\u1f70",
+    "a/": "\u1f71",
+    "e\\": "\u1f72",
+    "e/": "\u1f73",
+    "h\\": "\u1f74",
+    "h/": "\u1f75",
+    "i\\": "\u1f76",
+    "i/": "\u1f77",
+    "o\\": "\u1f78",
+    "o/": "\u1f79",
+    "u\\": "\u1f7a",
+    "u/": "\u1f7b",
+    "w\\": "\u1f7c",
+    "w/": "\u1f7d",
+    "*\\a": "\u1fba",
+    "*/a": "\u1fbb",
+    "*\\e": "\u1fce",
+    "*/e": "\u1fc9",
+    "*\\h": "\u1fca",
+    "*/h": "\u1fcb",
+    "*\\i": "\u1fda",
+    "*/i": "\u1fdb",
+    "*\\o": "\u1ff8",
+    "*/o": "\u1ff9",
+    "*\\u": "\u1fea",
+    "*/u": "\u1feb",
+    "*\\w": "\u1ffa",
+    "*/w": "\u1ffb",
+    # Smooth breathing and acute accent
+    "a)/": "\u1f04",
+    "e)/": "\u1f14",
+    "h)/": "\u1f24",
+    "i)/": "\u1f34",
+    "o)/": "\u1f44",
+    "u)/": "\u1f54",
+    "w)/": "\u1f64",
+    "*)/a": "\u1f0c",
+    "*)/e": "\u1f1c",
+    "*)/h": "\u1f2c",
+    "*)/i": "\u1f3c",
+    "*)/o": "\u1f4c",
+    "*)/u": "\u1f5c",
+    "*)/w": "\u1f6c",
+    # Smooth breathing and grave accent
+    "a)\\": "\u1f02",
+    "e)\\": "\u1f12",
+    "h)\\": "\u1f22",
+    "i)\\": "\u1f32",
+    "o)\\": "\u1f42",
+    "u)\\": "\u1f52",
+    "w)\\": "\u1f62",
+    "*)\\a": "\u1f0a",
+    "*)\\e": "\u1f1a",
+    "*)\\h": "\u1f2a",
+    "*)\\i": "\u1f3a",
+    "*)\\o": "\u1f4a",
+    "*)\\u": "\u1f5a",
+    "*)\\w": "\u1f6a",
+    # Rough breathing and acute accent
+    "a(/": "\u1f05",
+    "e(/": "\u1f15",
+    "h(/": "\u1f25",
+    "i(/": "\u1f35",
+    "o(/": "\u1f45",
+    "u(/": "\u1f55",
+    "w(/": "\u1f65",
+    "*(/a": "\u1f0d",
+    "*(/e": "\u1f1d",
+    "*(/h": "\u1f2d",
+    "*(/i": "\u1f3d",
+    "*(/o": "\u1f4d",
+    "*(/u": "\u1f5d",
+    "*(/w": "\u1f6d",
+    # Rough breathing and grave accent
+    "a(\\": "\u1f03",
+    "e(\\": "\u1f13",
+    "h(\\": "\u1f23",
+    "i(\\": "\u1f33",
+    "o(\\": "\u1f43",
+    "u(\\": "\u1f53",
+    "w(\\": "\u1f63",
+    "*(\\a": "\u1f0b",
+    "*(\\e": "\u1f1b",
+    "*(\\h": "\u1f2b",
+    "*(\\i": "\u1f3b",
+    "*(\\o": "\u1f4b",
+    "*(\\u": "\u1f5b",
+    "*(\\w": "\u1f6b",
+    # Perispomeni
+    "a=": "\u1fb6",
+    "h=": "\u1fc6",
+    "i=": "\u1fd6",
+    "u=": "\u1fe6",
+    "w=": "\u1ff6",
+    # Smooth breathing and perispomeni
+    "a)=": "\u1f06",
+    "h)=": "\u1f26",
+    "i)=": "\u1f36",
+    "u)=": "\u1f56",
+    "w)=": "\u1f66",
+    "*)=a": "\u1f0e",
+    "*)=h": "\u1f2e",
+    "*)=i": "\u1f3e",
+    "*)=w": "\u1f6e",
+    # Rough breathing and perispomeni
+    "a(=": "\u1f07",
+    "h(=": "\u1f27",
+    "i(=": "\u1f37",
+    "u(=": "\u1f57",
+    "w(=": "\u1f67",
+    "*(=a": "\u1f0f",
+    "*(=h": "\u1f2f",
+    "*(=i": "\u1f3f",
+    "*(=u": "\u1f5f",
+    "*(=w": "\u1f6f",
+    # Perispomeni and ypogegrammeni
+    "a=|": "\u1fb7",
+    "h=|": "\u1fc7",
+    "w=|": "\u1ff7",
+    # Ypogegrammeni
+    "a|": "\u1fb3",
+    "h|": "\u1fc3",
+    "w|": "\u1ff3",
+    "*a|": "\u1fbc",
+    "*h|": "\u1fcc",
+    "*w|": "\u1ffc",
+    # Acute accent and ypogegrammeni
+    "a/|": "\u1fb4",
+    "h/|": "\u1fc4",
+    "w/|": "\u1ff4",
+    # Smooth breathing and ypogegrammeni
+    "a)|": "\u1f80",
+    "h)|": "\u1f90",
+    "w)|": "\u1fa0",
+    "*)a|": "\u1f88",
+    "*)h|": "\u1f98",
+    "*)w|": "\u1fa8",
+    # Rough breathing and ypogegrammeni
+    "a(|": "\u1f81",
+    "h(|": "\u1f91",
+    "w(|": "\u1fa1",
+    "*(a|": "\u1f89",
+    "*(h|": "\u1f99",
+    "*(w|": "\u1fa9",
+    # Smooth breathing, grave accent, and ypogegrammeni
+    "a)\\|": "\u1f82",
+    "h)\\|": "\u1f92",
+    "w)\\|": "\u1fa2",
+    "*)\\a|": "\u1f8a",
+    "*)\\h|": "\u1f9a",
+    "*)\\w|": "\u1faa",
+    # Rough breathing, grave accent, and ypogegrammeni
+    "a(\\|": "\u1f83",
+    "h(\\|": "\u1f93",
+    "w(\\|": "\u1fa3",
+    "*(\\a|": "\u1f8b",
+    "*(\\h|": "\u1f9b",
+    "*(\\w|": "\u1fab",
+    # Smooth breathing, acute accent, and ypogegrammeni
+    "a)/|": "\u1f84",
+    "h)/|": "\u1f94",
+    "w)/|": "\u1fa4",
+    "*)/a|": "\u1f8c",
+    "*)/h|": "\u1f9c",
+    "*)/w|": "\u1fac",
+    # Rough breathing, acute accent, and ypogegrammeni
+    "a(/|": "\u1f85",
+    "h(/|": "\u1f95",
+    "w(/|": "\u1fa5",
+    "*(/a|": "\u1f8d",
+    "*(/h|": "\u1f9d",
+    "*(/w|": "\u1fad",
+    # Smooth breathing, ypogegrammeni, and perispomeni
+    "a)=|": "\u1f86",
+    "h)=|": "\u1f96",
+    "w)=|": "\u1fa6",
+    "*)=a|": "\u1f8e",
+    "*)=h|": "\u1f9e",
+    "*)=w|": "\u1fae",
+    # Rough breathing, ypogegrammeni, and perispomeni
+    "a(=|": "\u1f87",
+    "h(=|": "\u1f97",
+    "w(=|": "\u1fa7",
+    "*(=a|": "\u1f8f",
+    "*(=h|": "\u1f9f",
+    "*(=w|": "\u1faf",
+    # Diaeresis
+    "i+": "\u03ca",
+    "*+i": "\u03aa",
+    "i\\+": "\u1fd2",
+    "i/+": "\u1fd3",
+    "i+/": "\u1fd3",
+    "i=+": "\u1fd7",
+    "u+": "\u03cb",
+    "*+u": "\u03ab",
+    "u\\+": "\u1fe2",
+    "u/+": "\u1fe3",
+    "u=+": "\u1fe7",
+    # Macron
+    "a&": "\u1fb0",
+    "i&": "\u1fd0",
+    "u&": "\u1fe0",
+    # Breve
+    "a'": "\u1fb1",
+    "i'": "\u1fd1",
+    "u'": "\u1fe1",
+    # Basic punctuation
+    ":": "\u00b7",
+    "'": "\u2019",
+    "-": "\u2010",
+    "_": "\u2014",
+}
+
+# Letters pieoffice adds to Beta Code, read as a sigma followed by a digit.
+SIGMA_DIGIT_LETTERS = {
+    ("σ", "4"): "Ϡ",
+    ("Σ", "4"): "ϡ",
+    ("σ", "5"): "ϻ",
+    ("Σ", "5"): "Ϻ",
+}
+
+GREEK_TO_BETA_EXTRA = (
+    ("Ϡ", "s4"),
+    ("ϡ", "*s4"),
+    ("ϻ", "s5"),
+    ("Ϻ", "*s5"),
+    # As in betacode, the final sigma is left to the position of the s.
+    ("ς", "s"),
+)
+
+_MEDIAL_SIGMA = "σ"
+_FINAL_SIGMA = "ς"
+_APOSTROPHE = "’"
+_INNER_FINAL_SIGMA = re.compile(r"ς(?=[^\W_]|’)")
+_PUNCTUATION = frozenset("':-_")
+
+_beta_roots = {}
+_greek_rules = []
+
+
+def _beta_root(normalization):
+    """ Nested dictionaries of the Beta Code tokens, as betacode's trie
+
+    Diacritics are accepted in any order and letters in either case. The
+    Greek values are put in the given normal form once, here, rather than
+    normalizing each converted text.
+    """
+    try:
+        return _beta_roots[normalization]
+    except KeyError:
+        pass
+
+    root = {}
+    for beta, greek in BETACODE_MAP.items():
+        if normalization:
+            greek = unicodedata.normalize(normalization, greek)
+        for diacritics in itertools.permutations(beta[1:]):
+            key = beta[0] + "".join(diacritics)
+            for variant in (key.lower(), key.upper()):
+                node = root
+                for char in variant:
+                    node = node.setdefault(char, {})
+                node[None] = greek
+    _beta_roots[normalization] = root
+    return root
 
-def alpha_to_greek(input):
+
+def _greek_variants(greek):
+    """ The text itself and its canonically equivalent compositions """
+    decomposed = unicodedata.normalize("NFD", greek)
+    variants = [greek]
+    for split in range(1, len(decomposed) + 1):
+        variants.append(unicodedata.normalize("NFC", decomposed[:split])
+                        + decomposed[split:])
+    return variants
+
+
+def _greek_to_beta_rules():
+    """ Rule table from Greek to Beta Code, built once
+
+    The shortest Beta Code of a letter is kept, the first one winning ties,
+    so σ is read as s rather than s1. Every letter is recognized precomposed,
+    decomposed and partly composed, with tonos or oxia.
+    """
+    if _greek_rules:
+        return _greek_rules[0]
+
+    readings = {}
+    for beta, greek in BETACODE_MAP.items():
+        letter = unicodedata.normalize("NFD", greek)
+        if letter not in readings or len(beta) < len(readings[letter]):
+            readings[letter] = beta
+    for greek, beta in GREEK_TO_BETA_EXTRA:
+        readings[unicodedata.normalize("NFD", greek)] = beta
+
+    rules = []
+    for beta, greek in BETACODE_MAP.items():
+        for variant in _greek_variants(greek):
+            rules.append((variant, readings[unicodedata.normalize("NFD",
+                                                                  greek)]))
+    for greek, beta in GREEK_TO_BETA_EXTRA:
+        rules.append((greek, beta))
+    _greek_rules.append(tuple(rules))
+    return _greek_rules[0]
+
+
+def alpha_to_greek(input, normalization=None):
     """ Converts text in Latin Alphabet to Greek Script
 
     Each syllable should be separated by a sing dash, each word by a space.
@@ -32,6 +459,10 @@ def alpha_to_greek(input):
     input : str
         Text input with syllables separated by dashes and words by spaces.
 
+    normalization : str
+        "NFC" or "NFD" to have the Greek letters in that normal form, None
+        to keep betacode's own forms.
+
     Returns
     -------
     output : str
@@ -40,22 +471,108 @@ def alpha_to_greek(input):
     Usage
     -----
     
-    > alpha_to_greek("<++>")
-    + 
+    > alpha_to_greek("a)/s5 *s4")
+    + ἄϻ ϡ
 
     """
-    # print(input.translate(script))
+    if get_engine() == "legacy":
+        return _legacy_alpha_to_greek(input, normalization)
 
-    output = beta_to_uni(input)
+    # The text is read in one pass with betacode's tokens and final sigma
+    # rule, a sigma followed by 4 or 5 becoming one of the extra letters.
+    root = _beta_root(normalization)
+    output = []
+    append = output.append
+    boundary = False
+    position = 0
+    length = len(input)
+    while position < length:
+        if boundary and len(output) > 1 and output[-2] == _MEDIAL_SIGMA \
+                and not output[-1].isalnum() and output[-1] != _APOSTROPHE:
+            output[-2] = _FINAL_SIGMA
 
-    output = output.replace("σ4", "Ϡ")
-    output = output.replace("Σ4", "ϡ")
-    output = output.replace("σ5", "ϻ")
-    output = output.replace("Σ5", "Ϻ")
+        char = input[position]
+        node = root.get(char)
+        match = None
+        if node is not None:
+            match = node.get(None)
+            end = cursor = position + 1
+            while cursor < length:
+                node = node.get(input[cursor])
+                if node is None:
+                    break
+                cursor += 1
+                if None in node:
+                    match = node[None]
+                    end = cursor
 
+        if match is None:
+            boundary = True
+            letter = output and SIGMA_DIGIT_LETTERS.get((output[-1], char))
+            if letter:
+                output[-1] = letter
+            else:
+                append(char)
+            position += 1
+        else:
+            boundary = char in _PUNCTUATION
+            append(match)
+            position = end
+
+    if boundary and len(output) > 1 and output[-2] == _MEDIAL_SIGMA \
+            and not output[-1].isalnum() and output[-1] != _APOSTROPHE:
+        output[-2] = _FINAL_SIGMA
+    elif output and output[-1] == _MEDIAL_SIGMA:
+        output[-1] = _FINAL_SIGMA
+
+    return "".join(output)
+
+
+def _legacy_alpha_to_greek(input, normalization):
+    """ betacode's own converter, then a replacement per extra letter """
+    from betacode.conv import beta_to_uni
+
+    output = beta_to_uni(input)
+    for (sigma, digit), letter in SIGMA_DIGIT_LETTERS.items():
+        output = output.replace(sigma + digit, letter)
+    if normalization:
+        output = unicodedata.normalize(normalization, output)
     return output
 
 
+def greek_to_alpha(input):
+    """ Converts text in Greek Script to Beta Code
+
+    Letters are recognized whether precomposed or decomposed, with tonos or
+    oxia, and the extra letters Ϡ, ϡ, ϻ and Ϻ are written s4, *s4, s5 and
+    *s5. A final sigma is written s at the end of a word and s2 within
+    one.
+
+    Parameters
+    ----------
+    input : str
+        Text input in Greek Script.
+
+    Returns
+    -------
+    output : str
+        Transliterated text in Beta Code
+
+    Usage
+    -----
+
+    > greek_to_alpha("ἄϻ ϡ")
+    + a)/s5 *s4
+
+    """
+    converter = compile_rules(_greek_to_beta_rules())
+    if _FINAL_SIGMA not in input:
+        return converter.convert(input)
+    # A final sigma within a word is written s2, as s would give a medial
+    # one back.
+    return "s2".join(map(converter.convert, _INNER_FINAL_SIGMA.split(input)))
+
+
 if __name__ == "__main__":
        a = """
        a)/s5 *s4
@@ -0,0 +1,106 @@
+#! /usr/bin/env python3
+
+""" Legacy conversion engine
+
+The converters as they were before `pieoffice.engine`: the rules of a table
+applied one after the other over the whole text, with one `str.replace` call
+for each literal rule and one `re.sub` call for each regular expression. A
+rule thus also rewrites the output of the earlier ones, and a key is never
+matched once a shorter key it contains was replaced, unlike the single pass
+of the compiled converters.
+
+They are kept to check the compiled converters against, with
+`pieoffice.compiler.use_engine("legacy")` or `get_converter(language,
+engine="legacy")`, and are not meant for converting texts.
+
+The file can be imported as a module and contains the following classes:
+    ReplaceConverter - applies a literal rule table with `str.replace`.
+    SubConverter - applies a table of regular expressions with `re.sub`.
+
+Usage
+-----
+
+    > converter = ReplaceConverter([("-", ""), ("ka", "𐀏"), ("a", "𐀀")])
+    > converter.convert("a-ka")
+    + 𐀀𐀏
+"""
+
+import re
+
+
+class ReplaceConverter:
+    """
+    Convert strings with a chain of `str.replace` calls, one per rule.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (key, value) pairs, applied in this order.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string applying every rule in turn.
+    """
+
+    def __init__(self, rules):
+        self.rules = tuple((key, value) for key, value in rules if key)
+
+    def convert(self, text):
+        """ Converts a string applying every rule in turn
+
+        Parameters
+        ----------
+        text : str
+            Text to be converted.
+
+        Returns
+        -------
+        output : str
+            Converted text.
+        """
+        for key, value in self.rules:
+            text = text.replace(key, value)
+        return text
+
+    __call__ = convert
+
+
+class SubConverter:
+    """
+    Convert strings with a chain of `re.sub` calls, one per rule.
+
+    Attributes
+    ----------
+    rules : tuple
+        Ordered (pattern, replacement) pairs, applied in this order.
+
+    Methods
+    -------
+    convert(self, text)
+        Converts a string applying every rule in turn.
+    """
+
+    def __init__(self, rules):
+        self.rules = tuple(tuple(rule) for rule in rules)
+        self._rules = tuple((re.compile(pattern), replacement)
+                            for pattern, replacement in self.rules)
+
+    def convert(self, text):
+        """ Converts a string applying every rule in turn
+
+        Parameters
+        ----------
+        text : str
+            Text to be converted.
+
+        Returns
+        -------
+        output : str
+            Converted text.
+        """
+        for pattern, replacement in self._rules:
+            text = pattern.sub(replacement, text)
+        return text
+
+    __call__ = convert
@@ -12,7 +12,241 @@ This conversion scheme supports Aegean numbers and measurements.
 
 """
 
-from pieoffice.tools import get_key, aegean_numbers
+from pieoffice.compiler import LazyConverter, LazyReverseConverter
+from pieoffice.tools import aegean_numbers, aegean_values
+
+ASCII_TO_LINEARB = (
+    ("-", ""),
+
+
+    ("*132", "𐂗"),
+    ("*142", "𐂜"),
+    ("*146", "𐂞"),
+    ("*150", "𐂟"),
+    ("*152", "𐂡"),
+    ("*153", "𐂢"),
+    ("*154", "𐂣"),
+    ("*155", "𐃞"),
+    ("*157", "𐂥"),
+    ("*158", "𐂦"),
+    ("*160", "𐂨"),
+    ("*161", "𐂩"),
+    ("*164", "𐂬"),
+    ("*165", "𐂭"),
+    ("*166", "𐂮"),
+    ("*167", "𐂯"),
+    ("*168", "𐂰"),
+    ("*169", "𐂱"),
+    ("*170", "𐂲"),
+    ("*171", "𐂳"),
+    ("*172", "𐂴"),
+    ("*174", "𐂶"),
+    ("*177", "𐂸"),
+    ("*178", "𐂹"),
+    ("*179", "𐂺"),
+    ("*180", "𐂻"),
+    ("*18", "𐁐"),
+    ("*181", "𐂼"),
+    ("*182", "𐂽"),
+    ("*183", "𐂾"),
+    ("*184", "𐂿"),
+    ("*185", "𐃀"),
+    ("*189", "𐃁"),
+    ("*190", "𐃂"),
+    ("*19", "𐁑"),
+    ("*200", "𐃟"),
+    ("*201", "𐃠"),
+    ("*202", "𐃡"),
+    ("*203", "𐃢"),
+    ("*204", "𐃣"),
+    ("*205", "𐃤"),
+    ("*206", "𐃥"),
+    ("*207", "𐃦"),
+    ("*208", "𐃧"),
+    ("*209", "𐃨"),
+    ("*210", "𐃩"),
+    ("*211", "𐃪"),
+    ("*212", "𐃫"),
+    ("*213", "𐃬"),
+    ("*214", "𐃭"),
+    ("*215", "𐃮"),
+    ("*216", "𐃯"),
+    ("*217", "𐃰"),
+    ("*218", "𐃱"),
+    ("*219", "𐃲"),
+    ("*220", "𐃄"),
+    ("*221", "𐃳"),
+    ("*222", "𐃴"),
+    ("*226", "𐃵"),
+    ("*227", "𐃶"),
+    ("*228", "𐃷"),
+    ("*229", "𐃸"),
+    ("*22", "𐁒"),
+    ("*232", "𐃈"),
+    ("*234", "𐃊"),
+    ("*236", "𐃋"),
+    ("*245", "𐃐"),
+    ("*246", "𐃑"),
+    ("*248", "𐃓"),
+    ("*249", "𐃔"),
+    ("*250", "𐃹"),
+    ("*251", "𐃕"),
+    ("*252", "𐃖"),
+    ("*253", "𐃗"),
+    ("*255", "𐃙"),
+    ("*256", "𐃚"),
+    ("*257", "𐃛"),
+    ("*258", "𐃜"),
+    ("*259", "𐃝"),
+    ("*305", "𐃺"),
+    ("*34", "𐁓"),
+    ("*47", "𐁔"),
+    ("*49", "𐁕"),
+    ("*56", "𐁖"),
+    ("*63", "𐁗"),
+    ("*64", "𐁘"),
+    ("*65", "𐀎"),
+    ("*79", "𐁙"),
+    ("*82", "𐁚"),
+    ("*83", "𐁛"),
+    ("*86", "𐁜"),
+    ("*89", "𐁝"),
+    ("AES", "𐂚"),
+    ("ALVEUS", "𐃅"),
+    ("ARBOR", "𐂷"),
+    ("AREPA", "𐂘"),
+    ("ARMA", "𐂫"),
+    ("AROM", "𐂑"),
+    ("AUR", "𐂛"),
+    ("BIGAE", "𐃌"),
+    ("BOSf", "𐂌"),
+    ("BOSm", "𐂍"),
+    ("CAPSUS", "𐃎"),
+    ("CAPf", "𐂈"),
+    ("CAPm", "𐂉"),
+    ("CERV", "𐂂"),
+    ("CORNU", "𐂠"),
+    ("CURRUS", "𐃍"),
+    ("CYP", "𐂒"),
+    ("DIPTE", "𐃒"),
+    ("EQUf", "𐂄"),
+    ("EQUm", "𐂅"),
+    ("EQU", "𐂃"),
+    ("GALEA", "𐃃"),
+    ("GRA", "𐂎"),
+    ("HASTA", "𐃆"),
+    ("HORD", "𐂏"),
+    ("JACULUM", "𐃘"),
+    ("KANAKO", "𐂔"),
+    ("KAPO", "𐂓"),
+    ("LANA", "𐂝"),
+    ("LUNA", "𐂵"),
+    ("MERI", "𐂙"),
+    ("MUL", "𐂁"),
+    ("OLE", "𐂕"),
+    ("OLIV", "𐂐"),
+    ("OVISf", "𐂆"),
+    ("OVISm", "𐂇"),
+    ("PUGIO", "𐃉"),
+    ("ROTA", "𐃏"),
+    ("SAGITTA", "𐃇"),
+    ("SUSf", "𐂊"),
+    ("SUSm", "𐂋"),
+    ("TELA", "𐂧"),
+    ("TUNICA", "𐂪"),
+    ("TURO2", "𐂤"),
+    ("VIN", "𐂖"),
+    ("VIR", "𐂀"),
+    ("da", "𐀅"),
+    ("de", "𐀆"),
+    ("di", "𐀇"),
+    ("do", "𐀈"),
+    ("du", "𐀉"),
+    ("dwe", "𐁃"),
+    ("dwo", "𐁄"),
+    ("je", "𐀋"),
+    ("jo", "𐀍"),
+    ("ju2", "𐀎"),
+    ("ju", "𐀎"),
+    ("ka", "𐀏"),
+    ("ke", "𐀐"),
+    ("ki", "𐀑"),
+    ("ko", "𐀒"),
+    ("ku", "𐀓"),
+    ("ma", "𐀔"),
+    ("me", "𐀕"),
+    ("mi", "𐀖"),
+    ("mo", "𐀗"),
+    ("mu", "𐀘"),
+    ("na", "𐀙"),
+    ("ne", "𐀚"),
+    ("ni", "𐀛"),
+    ("no", "𐀜"),
+    ("nu", "𐀝"),
+    ("nwa", "𐁅"),
+    ("ja", "𐀊"),
+    ("pa", "𐀞"),
+    ("pe", "𐀟"),
+    ("pi", "𐀠"),
+    ("po", "𐀡"),
+    ("pte", "𐁇"),
+    ("pu2", "𐁆"),
+    ("pu", "𐀢"),
+    ("qa", "𐀣"),
+    ("qe", "𐀤"),
+    ("qi", "𐀥"),
+    ("qo", "𐀦"),
+    ("ra2", "𐁈"),
+    ("ra3", "𐁉"),
+    ("ra", "𐀨"),
+    ("re", "𐀩"),
+    ("ri", "𐀪"),
+    ("ro2", "𐁊"),
+    ("ro", "𐀫"),
+    ("ru", "𐀬"),
+    ("sa", "𐀭"),
+    ("se", "𐀮"),
+    ("si", "𐀯"),
+    ("so", "𐀰"),
+    ("su", "𐀱"),
+    ("ta2", "𐁌"),
+    ("ta", "𐀲"),
+    ("te", "𐀳"),
+    ("ti", "𐀴"),
+    ("to", "𐀵"),
+    ("tu", "𐀶"),
+    ("two", "𐁍"),
+    ("u", "𐀄"),
+    ("wa", "𐀷"),
+    ("we", "𐀸"),
+    ("wi", "𐀹"),
+    ("wo", "𐀺"),
+    ("za", "𐀼"),
+    ("ze", "𐀽"),
+    ("zo", "𐀿"),
+
+    ("e", "𐀁"),
+    ("a2", "𐁀"),
+    ("a3", "𐁁"),
+    ("a", "𐀀"),
+    ("i", "𐀂"),
+    ("o", "𐀃"),
+
+    (",", "𐄀"),
+    ("V", "𐄾"),
+    ("M", "𐄸"),
+    ("N", "𐄹"),
+    ("T", "𐄼"),
+    ("P", "𐄺"),
+    ("Q", "𐄻"),
+    ("L", "𐄷"),
+    ("S", "𐄽"),
+    ("Z", "𐄿"),
+)
+
+_converter = LazyConverter(ASCII_TO_LINEARB)
+_reverse = LazyReverseConverter(ASCII_TO_LINEARB, "-")
+
 
 def alpha_to_linearb(input, numbers=True):
     """ Converts text in Latin Alphabet to Linear B Script
@@ -49,234 +283,7 @@ def alpha_to_linearb(input, numbers=True):
     #                 num_out = num + numbers[str(num[i]*tens[i])]
     #         output[i] = num_out
 
-    
-    output = input.replace("-", "")
-
-    # output = " ".join(output).replace("-", "")
-
-    output = output.replace("*132", "𐂗")
-    output = output.replace("*142", "𐂜")
-    output = output.replace("*146", "𐂞")
-    output = output.replace("*150", "𐂟")
-    output = output.replace("*152", "𐂡")
-    output = output.replace("*153", "𐂢")
-    output = output.replace("*154", "𐂣")
-    output = output.replace("*155", "𐃞")
-    output = output.replace("*157", "𐂥")
-    output = output.replace("*158", "𐂦")
-    output = output.replace("*160", "𐂨")
-    output = output.replace("*161", "𐂩")
-    output = output.replace("*164", "𐂬")
-    output = output.replace("*165", "𐂭")
-    output = output.replace("*166", "𐂮")
-    output = output.replace("*167", "𐂯")
-    output = output.replace("*168", "𐂰")
-    output = output.replace("*169", "𐂱")
-    output = output.replace("*170", "𐂲")
-    output = output.replace("*171", "𐂳")
-    output = output.replace("*172", "𐂴")
-    output = output.replace("*174", "𐂶")
-    output = output.replace("*177", "𐂸")
-    output = output.replace("*178", "𐂹")
-    output = output.replace("*179", "𐂺")
-    output = output.replace("*180", "𐂻")
-    output = output.replace("*18", "𐁐")
-    output = output.replace("*181", "𐂼")
-    output = output.replace("*182", "𐂽")
-    output = output.replace("*183", "𐂾")
-    output = output.replace("*184", "𐂿")
-    output = output.replace("*185", "𐃀")
-    output = output.replace("*189", "𐃁")
-    output = output.replace("*190", "𐃂")
-    output = output.replace("*19", "𐁑")
-    output = output.replace("*200", "𐃟")
-    output = output.replace("*201", "𐃠")
-    output = output.replace("*202", "𐃡")
-    output = output.replace("*203", "𐃢")
-    output = output.replace("*204", "𐃣")
-    output = output.replace("*205", "𐃤")
-    output = output.replace("*206", "𐃥")
-    output = output.replace("*207", "𐃦")
-    output = output.replace("*208", "𐃧")
-    output = output.replace("*209", "𐃨")
-    output = output.replace("*210", "𐃩")
-    output = output.replace("*211", "𐃪")
-    output = output.replace("*212", "𐃫")
-    output = output.replace("*213", "𐃬")
-    output = output.replace("*214", "𐃭")
-    output = output.replace("*215", "𐃮")
-    output = output.replace("*216", "𐃯")
-    output = output.replace("*217", "𐃰")
-    output = output.replace("*218", "𐃱")
-    output = output.replace("*219", "𐃲")
-    output = output.replace("*220", "𐃄")
-    output = output.replace("*221", "𐃳")
-    output = output.replace("*222", "𐃴")
-    output = output.replace("*226", "𐃵")
-    output = output.replace("*227", "𐃶")
-    output = output.replace("*228", "𐃷")
-    output = output.replace("*229", "𐃸")
-    output = output.replace("*22", "𐁒")
-    output = output.replace("*232", "𐃈")
-    output = output.replace("*234", "𐃊")
-    output = output.replace("*236", "𐃋")
-    output = output.replace("*245", "𐃐")
-    output = output.replace("*246", "𐃑")
-    output = output.replace("*248", "𐃓")
-    output = output.replace("*249", "𐃔")
-    output = output.replace("*250", "𐃹")
-    output = output.replace("*251", "𐃕")
-    output = output.replace("*252", "𐃖")
-    output = output.replace("*253", "𐃗")
-    output = output.replace("*255", "𐃙")
-    output = output.replace("*256", "𐃚")
-    output = output.replace("*257", "𐃛")
-    output = output.replace("*258", "𐃜")
-    output = output.replace("*259", "𐃝")
-    output = output.replace("*305", "𐃺")
-    output = output.replace("*34", "𐁓")
-    output = output.replace("*47", "𐁔")
-    output = output.replace("*49", "𐁕")
-    output = output.replace("*56", "𐁖")
-    output = output.replace("*63", "𐁗")
-    output = output.replace("*64", "𐁘")
-    output = output.replace("*65", "𐀎")
-    output = output.replace("*79", "𐁙")
-    output = output.replace("*82", "𐁚")
-    output = output.replace("*83", "𐁛")
-    output = output.replace("*86", "𐁜")
-    output = output.replace("*89", "𐁝")
-    output = output.replace("AES", "𐂚")
-    output = output.replace("ALVEUS", "𐃅")
-    output = output.replace("ARBOR", "𐂷")
-    output = output.replace("AREPA", "𐂘")
-    output = output.replace("ARMA", "𐂫")
-    output = output.replace("AROM", "𐂑")
-    output = output.replace("AUR", "𐂛")
-    output = output.replace("BIGAE", "𐃌")
-    output = output.replace("BOSf", "𐂌")
-    output = output.replace("BOSm", "𐂍")
-    output = output.replace("CAPSUS", "𐃎")
-    output = output.replace("CAPf", "𐂈")
-    output = output.replace("CAPm", "𐂉")
-    output = output.replace("CERV", "𐂂")
-    output = output.replace("CORNU", "𐂠")
-    output = output.replace("CURRUS", "𐃍")
-    output = output.replace("CYP", "𐂒")
-    output = output.replace("DIPTE", "𐃒")
-    output = output.replace("EQUf", "𐂄")
-    output = output.replace("EQUm", "𐂅")
-    output = output.replace("EQU", "𐂃")
-    output = output.replace("GALEA", "𐃃")
-    output = output.replace("GRA", "𐂎")
-    output = output.replace("HASTA", "𐃆")
-    output = output.replace("HORD", "𐂏")
-    output = output.replace("JACULUM", "𐃘")
-    output = output.replace("KANAKO", "𐂔")
-    output = output.replace("KAPO", "𐂓")
-    output = output.replace("LANA", "𐂝")
-    output = output.replace("LUNA", "𐂵")
-    output = output.replace("MERI", "𐂙")
-    output = output.replace("MUL", "𐂁")
-    output = output.replace("OLE", "𐂕")
-    output = output.replace("OLIV", "𐂐")
-    output = output.replace("OVISf", "𐂆")
-    output = output.replace("OVISm", "𐂇")
-    output = output.replace("PUGIO", "𐃉")
-    output = output.replace("ROTA", "𐃏")
-    output = output.replace("SAGITTA", "𐃇")
-    output = output.replace("SUSf", "𐂊")
-    output = output.replace("SUSm", "𐂋")
-    output = output.replace("TELA", "𐂧")
-    output = output.replace("TUNICA", "𐂪")
-    output = output.replace("TURO2", "𐂤")
-    output = output.replace("VIN", "𐂖")
-    output = output.replace("VIR", "𐂀")
-    output = output.replace("da", "𐀅")
-    output = output.replace("de", "𐀆")
-    output = output.replace("di", "𐀇")
-    output = output.replace("do", "𐀈")
-    output = output.replace("du", "𐀉")
-    output = output.replace("dwe", "𐁃")
-    output = output.replace("dwo", "𐁄")
-    output = output.replace("je", "𐀋")
-    output = output.replace("jo", "𐀍")
-    output = output.replace("ju2", "𐀎")
-    output = output.replace("ju", "𐀎")
-    output = output.replace("ka", "𐀏")
-    output = output.replace("ke", "𐀐")
-    output = output.replace("ki", "𐀑")
-    output = output.replace("ko", "𐀒")
-    output = output.replace("ku", "𐀓")
-    output = output.replace("ma", "𐀔")
-    output = output.replace("me", "𐀕")
-    output = output.replace("mi", "𐀖")
-    output = output.replace("mo", "𐀗")
-    output = output.replace("mu", "𐀘")
-    output = output.replace("na", "𐀙")
-    output = output.replace("ne", "𐀚")
-    output = output.replace("ni", "𐀛")
-    output = output.replace("no", "𐀜")
-    output = output.replace("nu", "𐀝")
-    output = output.replace("nwa", "𐁅")
-    output = output.replace("ja", "𐀊")
-    output = output.replace("pa", "𐀞")
-    output = output.replace("pe", "𐀟")
-    output = output.replace("pi", "𐀠")
-    output = output.replace("po", "𐀡")
-    output = output.replace("pte", "𐁇")
-    output = output.replace("pu2", "𐁆")
-    output = output.replace("pu", "𐀢")
-    output = output.replace("qa", "𐀣")
-    output = output.replace("qe", "𐀤")
-    output = output.replace("qi", "𐀥")
-    output = output.replace("qo", "𐀦")
-    output = output.replace("ra2", "𐁈")
-    output = output.replace("ra3", "𐁉")
-    output = output.replace("ra", "𐀨")
-    output = output.replace("re", "𐀩")
-    output = output.replace("ri", "𐀪")
-    output = output.replace("ro2", "𐁊")
-    output = output.replace("ro", "𐀫")
-    output = output.replace("ru", "𐀬")
-    output = output.replace("sa", "𐀭")
-    output = output.replace("se", "𐀮")
-    output = output.replace("si", "𐀯")
-    output = output.replace("so", "𐀰")
-    output = output.replace("su", "𐀱")
-    output = output.replace("ta2", "𐁌")
-    output = output.replace("ta", "𐀲")
-    output = output.replace("te", "𐀳")
-    output = output.replace("ti", "𐀴")
-    output = output.replace("to", "𐀵")
-    output = output.replace("tu", "𐀶")
-    output = output.replace("two", "𐁍")
-    output = output.replace("u", "𐀄")
-    output = output.replace("wa", "𐀷")
-    output = output.replace("we", "𐀸")
-    output = output.replace("wi", "𐀹")
-    output = output.replace("wo", "𐀺")
-    output = output.replace("za", "𐀼")
-    output = output.replace("ze", "𐀽")
-    output = output.replace("zo", "𐀿")
-
-    output = output.replace("e", "𐀁")
-    output = output.replace("a2", "𐁀")
-    output = output.replace("a3", "𐁁")
-    output = output.replace("a", "𐀀")
-    output = output.replace("i", "𐀂")
-    output = output.replace("o", "𐀃")
-
-    output = output.replace(",", "𐄀")
-    output = output.replace("V", "𐄾")
-    output = output.replace("M", "𐄸")
-    output = output.replace("N", "𐄹")
-    output = output.replace("T", "𐄼")
-    output = output.replace("P", "𐄺")
-    output = output.replace("Q", "𐄻")
-    output = output.replace("L", "𐄷")
-    output = output.replace("S", "𐄽")
-    output = output.replace("Z", "𐄿")
+    output = _converter.convert(input)
     
     output = output.split()
     if numbers:
@@ -292,6 +299,32 @@ def alpha_to_linearb(input, numbers=True):
     return " ".join(output)
 
 
+def linearb_to_alpha(input):
+    """ Converts text in Linear B Script to Latin Alphabet
+
+    Syllables are separated by dashes. Glyphs with several readings are
+    given their shortest one. Aegean numbers are converted back to
+    digits.
+
+    Parameters
+    ----------
+    input : str
+        Text input in Linear B Script.
+
+    Returns
+    -------
+    output : str
+        Transliterated text in Latin Alphabet
+    """
+
+    output = _reverse.convert(input).split()
+    for i in range(len(output)):
+        if all(char in aegean_values for char in output[i]):
+            output[i] = str(sum(aegean_values[char] for char in output[i]))
+
+    return " ".join(output)
+
+
 if __name__ == "__main__":
     a = ["apiqoita doe-ra MUL 32",
          "ko-wa me-zo-e 5 ko-wa me-wi-jo-e 15",
@@ -14,6 +14,48 @@ The transliteration scheme is as follows
 
 """
 
+from pieoffice.compiler import LazyConverter, LazyReverseConverter
+
+ASCII_TO_LYDIAN = (
+    ("a", "𐤠"),
+    ("b", "𐤡"),
+    ("p", "𐤡"),
+    ("g", "𐤢"),
+    ("d", "𐤣"),
+    ("e", "𐤤"),
+    ("v", "𐤥"),
+    ("w", "𐤥"),
+    ("i", "𐤦"),
+    ("y", "𐤧"),
+    ("k", "𐤨"),
+    ("l", "𐤩"),
+    ("m", "𐤪"),
+    ("n", "𐤫"),
+    ("o", "𐤬"),
+    ("r", "𐤭"),
+    ("S", "𐤮"),
+    ("ś", "𐤮"),
+    ("t", "𐤯"),
+    ("u", "𐤰"),
+    ("f", "𐤱"),
+    ("q", "𐤲"),
+    ("s", "𐤳"),
+    ("sh", "𐤳"),
+    ("T", "𐤴"),
+    ("ã", "𐤵"),
+    ("A", "𐤵"),
+    ("ẽ", "𐤶"),
+    ("E", "𐤶"),
+    ("L", "𐤷"),
+    ("N", "𐤸"),
+    ("c", "𐤹"),
+    (".", ""),
+)
+
+_converter = LazyConverter(ASCII_TO_LYDIAN)
+_reverse = LazyReverseConverter(ASCII_TO_LYDIAN)
+
+
 def alpha_to_lydian(input):
     """ 
     Parameters
@@ -26,42 +68,29 @@ def alpha_to_lydian(input):
     output : str
         Transliterated text in Lydian Script
     """
-    # print(input.translate(script))
-
-    output = input
-    output = output.replace("a", "𐤠")
-    output = output.replace("b", "𐤡")
-    output = output.replace("p", "𐤡")
-    output = output.replace("g", "𐤢")
-    output = output.replace("d", "𐤣")
-    output = output.replace("e", "𐤤")
-    output = output.replace("v", "𐤥")
-    output = output.replace("w", "𐤥")
-    output = output.replace("i", "𐤦")
-    output = output.replace("y", "𐤧")
-    output = output.replace("k", "𐤨")
-    output = output.replace("l", "𐤩")
-    output = output.replace("m", "𐤪")
-    output = output.replace("n", "𐤫")
-    output = output.replace("o", "𐤬")
-    output = output.replace("r", "𐤭")
-    output = output.replace("S", "𐤮")
-    output = output.replace("ś", "𐤮")
-    output = output.replace("t", "𐤯")
-    output = output.replace("u", "𐤰")
-    output = output.replace("f", "𐤱")
-    output = output.replace("q", "𐤲")
-    output = output.replace("s", "𐤳")
-    output = output.replace("sh","𐤳")
-    output = output.replace("T", "𐤴")
-    output = output.replace("ã", "𐤵")
-    output = output.replace("A", "𐤵")
-    output = output.replace("ẽ", "𐤶")
-    output = output.replace("E", "𐤶")
-    output = output.replace("L", "𐤷")
-    output = output.replace("N", "𐤸")
-    output = output.replace("c", "𐤹")
-    output = output.replace(".", "")
+
+    output = _converter.convert(input)
+
+    return output
+
+
+def lydian_to_alpha(input):
+    """ Converts text in Lydian Script to Latin Alphabet
+
+    Glyphs with several readings are given their shortest one.
+
+    Parameters
+    ----------
+    input : str
+        Text input in Lydian Script.
+
+    Returns
+    -------
+    output : str
+        Transliterated text in Latin Alphabet
+    """
+
+    output = _reverse.convert(input)
 
     return output
 
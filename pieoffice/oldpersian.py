@@ -21,6 +21,65 @@ The transliteration scheme is as follows:
 
 """
 
+from pieoffice.compiler import LazyConverter, LazyReverseConverter
+
+ASCII_TO_OLDPERSIAN = (
+    ("-", ""),
+    ("ahuramazda1", "𐏈"),
+    ("ahuramazda2", "𐏉"),
+    ("ahuramazda3", "𐏊"),
+    ("xshayathia", "𐏋"),
+    ("dahyaus1", "𐏌"),
+    ("dahyaus2", "𐏌"),
+    ("baga", "𐏎"),
+    ("bumis", "𐏏"),
+    ("mi", "𐎷"),
+    ("mu", "𐎸"),
+    ("ku", "𐎤"),
+    ("xi", "𐎧"),
+    ("gu", "𐎦"),
+    ("xu", "𐎧"),
+    ("ji", "𐎪"),
+    ("ti", "𐎫"),
+    ("tu", "𐎬"),
+    ("th", "𐎰"),
+    ("di", "𐎮"),
+    ("du", "𐎯"),
+    ("ni", "𐎴"),
+    ("nu", "𐎵"),
+    ("vi", "𐎻"),
+    ("ri", "𐎽"),
+    ("sh", "𐏁"),
+    ("a", "𐎠"),
+    ("i", "𐎡"),
+    ("u", "𐎢"),
+    ("k", "𐎣"),
+    ("x", "𐎧"),
+    ("g", "𐎥"),
+    ("c", "𐎨"),
+    ("ç", "𐏂"),
+    ("j", "𐎩"),
+    ("t", "𐎫"),
+    ("d", "𐎭"),
+    ("p", "𐎱"),
+    ("f", "𐎳"),
+    ("b", "𐎲"),
+    ("n", "𐎴"),
+    ("m", "𐎶"),
+    ("y", "𐎹"),
+    ("v", "𐎺"),
+    ("r", "𐎼"),
+    ("l", "𐎾"),
+    ("s", "𐎿"),
+    ("z", "𐏀"),
+    ("š", "𐏁"),
+    ("h", "𐏃"),
+)
+
+_converter = LazyConverter(ASCII_TO_OLDPERSIAN)
+_reverse = LazyReverseConverter(ASCII_TO_OLDPERSIAN, "-")
+
+
 def alpha_to_oldpersian(input):
     """ 
     Parameters
@@ -33,58 +92,30 @@ def alpha_to_oldpersian(input):
     output : str
         Transliterated text in Old Persian Script
     """
-    # print(input.translate(script))
-
-    output = input.replace("-","")
-    output = output.replace("ahuramazda1", "𐏈")
-    output = output.replace("ahuramazda2", "𐏉")
-    output = output.replace("ahuramazda3", "𐏊")
-    output = output.replace("xshayathia", "𐏋")
-    output = output.replace("dahyaus1", "𐏌")
-    output = output.replace("dahyaus2", "𐏌")
-    output = output.replace("baga", "𐏎")
-    output = output.replace("bumis", "𐏏")
-    output = output.replace("mi", "𐎷")
-    output = output.replace("mu", "𐎸")
-    output = output.replace("ku", "𐎤")
-    output = output.replace("xi", "𐎧")
-    output = output.replace("gu", "𐎦")
-    output = output.replace("xu", "𐎧")
-    output = output.replace("ji", "𐎪")
-    output = output.replace("ti", "𐎫")
-    output = output.replace("tu", "𐎬")
-    output = output.replace("th", "𐎰")
-    output = output.replace("di", "𐎮")
-    output = output.replace("du", "𐎯")
-    output = output.replace("ni", "𐎴")
-    output = output.replace("nu", "𐎵")
-    output = output.replace("vi", "𐎻")
-    output = output.replace("ri", "𐎽")
-    output = output.replace("sh", "𐏁")
-    output = output.replace("a", "𐎠")
-    output = output.replace("i", "𐎡")
-    output = output.replace("u", "𐎢")
-    output = output.replace("k", "𐎣")
-    output = output.replace("x", "𐎧")
-    output = output.replace("g", "𐎥")
-    output = output.replace("c", "𐎨")
-    output = output.replace("ç", "𐏂")
-    output = output.replace("j", "𐎩")
-    output = output.replace("t", "𐎫")
-    output = output.replace("d", "𐎭")
-    output = output.replace("p", "𐎱")
-    output = output.replace("f", "𐎳")
-    output = output.replace("b", "𐎲")
-    output = output.replace("n", "𐎴")
-    output = output.replace("m", "𐎶")
-    output = output.replace("y", "𐎹")
-    output = output.replace("v", "𐎺")
-    output = output.replace("r", "𐎼")
-    output = output.replace("l", "𐎾")
-    output = output.replace("s", "𐎿")
-    output = output.replace("z", "𐏀")
-    output = output.replace("š", "𐏁")
-    output = output.replace("h", "𐏃")
+
+    output = _converter.convert(input)
+
+    return output
+
+
+def oldpersian_to_alpha(input):
+    """ Converts text in Old Persian Script to Latin Alphabet
+
+    Syllables are separated by dashes. Glyphs with several readings are
+    given their shortest one.
+
+    Parameters
+    ----------
+    input : str
+        Text input in Old Persian Script.
+
+    Returns
+    -------
+    output : str
+        Transliterated text in Latin Alphabet
+    """
+
+    output = _reverse.convert(input)
 
     return output
 
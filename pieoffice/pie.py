@@ -22,6 +22,56 @@ The transliteration scheme is close to the Harvard-Kyoto for Sanskrit:
 
 """
 
+from pieoffice.compiler import LazyConverter
+
+ASCII_TO_PIE = (
+    ("A/", "ā́"),
+    ("A", "ā"),
+    ("I/", "ī́"),
+    ("I", "ī"),
+    ("U/", "ū́"),
+    ("U", "ū"),
+    ("lRR/", "l̥̄́"),
+    ("lRR", "l̥̄"),
+    ("lR/", "ĺ̥"),
+    ("lR", "l̥"),
+    ("RR/", "r̥̄́"),
+    ("RR", "r̥̄"),
+    ("R/", "ŕ̥"),
+    ("R", "r̥"),
+    ("LL/", "l̥̄́"),
+    ("LL", "l̥̄"),
+    ("L/", "ĺ̥"),
+    ("L", "l̥"),
+    ("cw", "k̑ʷ"),
+    ("c", "k̑"),
+    ("kw", "kʷ"),
+    ("jw", "ĝʷ"),
+    ("j", "ĝ"),
+    ("bh", "bʰ"),
+    ("dh", "dʰ"),
+    ("jh", "ĝʰ"),
+    ("gwh", "gʷʰ"),
+    ("gh", "gʰ"),
+    ("gw", "gʷ"),
+    ("h1", "h₁"),
+    ("h2", "h₂"),
+    ("h3", "h₃"),
+    ("y", "i̯"),
+    ("w", "u̯"),
+    ("E/", "ḗ"),
+    ("O", "ō"),
+    ("É", "ḗ"),
+    ("O/", "ṓ"),
+    ("E", "ē"),
+    ("Ó", "ṓ"),
+    ("M", "m̥"),
+    ("N", "n̥"),
+)
+
+_converter = LazyConverter(ASCII_TO_PIE)
+
+
 def alpha_to_pie(input):
     """ 
     Parameters
@@ -34,51 +84,8 @@ def alpha_to_pie(input):
     output : str
         Transliterated text in Avestan Script
     """
-    # print(input.translate(script))
 
-    output = input
-    output = output.replace("A/", "ā́")
-    output = output.replace("A", "ā")
-    output = output.replace("I/", "ī́")
-    output = output.replace("I", "ī")
-    output = output.replace("U/", "ū́")
-    output = output.replace("U", "ū")
-    output = output.replace("lRR/", "l̥̄́")
-    output = output.replace("lRR", "l̥̄")
-    output = output.replace("lR/", "ĺ̥")
-    output = output.replace("lR", "l̥")
-    output = output.replace("RR/", "r̥̄́")
-    output = output.replace("RR", "r̥̄")
-    output = output.replace("R/", "ŕ̥")
-    output = output.replace("R", "r̥")
-    output = output.replace("LL/", "l̥̄́")
-    output = output.replace("LL", "l̥̄")
-    output = output.replace("L/", "ĺ̥")
-    output = output.replace("L", "l̥")
-    output = output.replace("cw", "k̑ʷ")
-    output = output.replace("c", "k̑")
-    output = output.replace("kw", "kʷ")
-    output = output.replace("jw", "ĝʷ")
-    output = output.replace("j", "ĝ")
-    output = output.replace("bh", "bʰ")
-    output = output.replace("dh", "dʰ")
-    output = output.replace("jh", "ĝʰ")
-    output = output.replace("gwh", "gʷʰ")
-    output = output.replace("gh", "gʰ")
-    output = output.replace("gw", "gʷ")
-    output = output.replace("h1", "h₁")
-    output = output.replace("h2", "h₂")
-    output = output.replace("h3", "h₃")
-    output = output.replace("y", "i̯")
-    output = output.replace("w", "u̯")
-    output = output.replace("E/", "ḗ")
-    output = output.replace("O", "ō")
-    output = output.replace("É", "ḗ")
-    output = output.replace("O/", "ṓ")
-    output = output.replace("E", "ē")
-    output = output.replace("Ó", "ṓ")
-    output = output.replace("M", "m̥")
-    output = output.replace("N", "n̥")
+    output = _converter.convert(input)
     return output
 
 
@@ -0,0 +1,429 @@
+#! /usr/bin/env python3
+
+""" Per-rule profiling
+
+Records how many times each rule of the compiled converters fires and how
+long it takes, to tune the order of the rule tables and to find the rules
+that never fire. While a `Profiler` runs, the `convert` method of every
+converter compiled by `pieoffice.compiler` is shadowed by an instrumented
+one giving the same output:
+
+    - literal tables walked as a trie count the matches of each key and
+      time each match, runs of text no rule starts with being counted as
+      "(unmatched)";
+    - literal tables applied as a chain of replacements count the
+      occurrences of each key and time each `str.replace` call;
+    - tables of rules with contexts do the same for each key and context;
+    - tables of regular expressions apply their rules one after the other,
+      as they did before being merged, and time each `re.subn` call.
+
+The instrumented walks are slower than the compiled converters, so the
+times are mostly useful compared with each other. Nothing is shadowed
+while no profiler runs, and the converters are then left as they are.
+
+Setting `PIEOFFICE_PROFILE=1` profiles the whole process and writes the
+report to the standard error when it exits, and `pieoffice profile
+<language> FILE` writes the report of converting a file.
+
+The file can be imported as a module and contains the following:
+    Profiler - records per-rule hits and times of the converters.
+    profile_file - returns the report of converting a file.
+    profile_process - profiles the whole process.
+
+Usage
+-----
+
+    > with Profiler() as profiler:
+    >     alpha_to_luwian("MAGNUS.REX ka-ra-ka-mi-sà")
+    > print(profiler.report())
+"""
+
+import atexit
+import re
+import sys
+import time
+
+from pieoffice import compiler
+from pieoffice.engine import ChainConverter, ContextConverter, \
+    RegexConverter, ReverseConverter, TokenConverter, TrieConverter
+from pieoffice.legacy import ReplaceConverter
+
+UNMATCHED = "(unmatched)"
+
+
+class Profiler:
+    """
+    Record per-rule hits and times of the compiled converters.
+
+    Attributes
+    ----------
+    stats : dict
+        For each instrumented converter, a dict mapping each rule to its
+        [hits, seconds], in the order of the table.
+
+    Methods
+    -------
+    start(self)
+        Instruments the compiled converters, and those compiled later.
+    stop(self)
+        Restores the converters.
+    instrument(self, converter)
+        Shadows the convert method of a converter.
+    report(self)
+        Returns the report of the recorded rules.
+    """
+
+    def __init__(self):
+        self.stats = {}
+
+    def start(self):
+        """ Instruments the compiled converters, and those compiled later """
+        if compiler._profiler is not None:
+            raise RuntimeError("A profiler is already running")
+        compiler._profiler = self
+        for cache in _caches():
+            for rules, converter in cache.values():
+                self.instrument(converter)
+        for converter in compiler._compiled_regex.values():
+            self.instrument(converter)
+
+    def stop(self):
+        """ Restores the converters """
+        if compiler._profiler is self:
+            compiler._profiler = None
+        for converter in self.stats:
+            converter.__dict__.pop("convert", None)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def instrument(self, converter):
+        """ Shadows the convert method of a converter
+
+        Parameters
+        ----------
+        converter : object
+            Converter of `pieoffice.engine`.
+        """
+        if converter in self.stats:
+            return
+        if isinstance(converter, RegexConverter):
+            stats, convert = _regex(converter)
+        elif isinstance(converter, ContextConverter):
+            stats, convert = _context(converter)
+        elif isinstance(converter, ReverseConverter):
+            stats, convert = _literal(converter._converter._root,
+                                      converter.rules)
+            separator = converter.separator
+            if separator:
+                walk = convert
+                convert = lambda text: walk(text).replace(
+                    "\0\0", separator).replace("\0", "")
+        elif isinstance(converter, TokenConverter):
+            stats, convert = _literal(converter._converter._root,
+                                      converter.rules)
+        elif isinstance(converter, TrieConverter):
+            stats, convert = _literal(converter._root, converter.rules)
+        elif isinstance(converter, ChainConverter):
+            stats, convert = _literal(TrieConverter(converter.rules)._root,
+                                      converter.rules)
+        elif isinstance(converter, ReplaceConverter):
+            stats, convert = _replace(converter)
+        else:
+            return
+        self.stats[converter] = stats
+        converter.convert = convert
+
+    def report(self):
+        """ Returns the report of the recorded rules
+
+        Converters are listed from the one that took longest, each with its
+        rules from the one that took longest, then the rules that never
+        fired.
+
+        Returns
+        -------
+        report : str
+            Table of the hits and times of the rules.
+        """
+        lines = []
+        converters = sorted(
+            (sum(seconds for hits, seconds in stats.values()), index,
+             converter)
+            for index, (converter, stats) in enumerate(self.stats.items()))
+        for total, index, converter in reversed(converters):
+            stats = self.stats[converter]
+            if not total:
+                continue
+            lines.append("{} of {}, {} rules, {:.6f} s".format(
+                type(converter).__name__, _table_name(converter),
+                len(stats) - (UNMATCHED in stats), total))
+            lines.append("{:>12} {:>12}  {}".format("hits", "seconds",
+                                                     "rule"))
+            fired = sorted(((seconds, hits, str(rule))
+                            for rule, (hits, seconds) in stats.items()
+                            if hits),
+                           reverse=True)
+            for seconds, hits, rule in fired:
+                lines.append("{:>12,} {:>12.6f}  {}".format(hits, seconds,
+                                                             rule))
+            dead = [str(rule) for rule, (hits, seconds) in stats.items()
+                    if not hits and rule != UNMATCHED]
+            if dead:
+                lines.append("{} rules never fired: {}".format(
+                    len(dead), " ".join(dead)))
+            lines.append("")
+        return "\n".join(lines)
+
+
+def _caches():
+    return (compiler._compiled, compiler._compiled_context,
+            compiler._compiled_token, compiler._compiled_reverse)
+
+
+def _source(converter):
+    """ The table a converter was compiled from """
+    for rules, compiled in compiler._compiled_regex.items():
+        if compiled is converter:
+            return rules
+    for cache in _caches():
+        for rules, compiled in cache.values():
+            if compiled is converter:
+                return rules
+    return None
+
+
+def _table_name(converter):
+    """ The name of the table of a converter, found in the loaded modules """
+    rules = _source(converter)
+    if rules is not None:
+        name = compiler.table_name(rules)
+        if name is not None:
+            return name
+    return "a table"
+
+
+def _literal(root, rules):
+    """ Instruments a longest-match walk of a trie """
+    stats = {}
+    for rule in rules:
+        if rule[0]:
+            stats.setdefault(rule[0], [0, 0.0])
+    stats[UNMATCHED] = unmatched = [0, 0.0]
+    start = None
+    if root:
+        start = re.compile(
+            "[" + "".join(map(re.escape, sorted(root))) + "]").search
+    timer = time.perf_counter
+
+    def convert(text):
+        output = []
+        append = output.append
+        position = 0
+        length = len(text)
+        while position < length:
+            begin = timer()
+            node = root.get(text[position])
+            if node is None:
+                found = start(text, position) if start else None
+                end = length if found is None else found.start()
+                append(text[position:end])
+                position = end
+                unmatched[0] += 1
+                unmatched[1] += timer() - begin
+                continue
+
+            match = node.get(None)
+            end = cursor = position + 1
+            while cursor < length:
+                node = node.get(text[cursor])
+                if node is None:
+                    break
+                cursor += 1
+                if None in node:
+                    match = node[None]
+                    end = cursor
+
+            if match is None:
+                append(text[position])
+                position += 1
+                unmatched[0] += 1
+                unmatched[1] += timer() - begin
+            else:
+                append(match)
+                record = stats[text[position:end]]
+                position = end
+                record[0] += 1
+                record[1] += timer() - begin
+        return "".join(output)
+
+    return stats, convert
+
+
+def _context(converter):
+    """ Instruments the walk of a `ContextConverter` """
+    root = converter._root
+    boundaries = converter.boundaries
+    stats = {}
+    for key, value, context in converter.rules:
+        if key:
+            stats.setdefault(_context_rule(key, context), [0, 0.0])
+    stats[UNMATCHED] = unmatched = [0, 0.0]
+    timer = time.perf_counter
+
+    def convert(text):
+        output = []
+        append = output.append
+        coda = None
+        position = 0
+        length = len(text)
+        while position < length:
+            begin = timer()
+            node = root.get(text[position])
+            initial = position == 0 or text[position - 1] in boundaries
+            match = None
+            cursor = position
+            while node is not None:
+                cursor += 1
+                for candidate in node.get(None, ()):
+                    context = candidate[2]
+                    if context is None \
+                            or context == "joined" and coda is not None \
+                            or context == "initial" and initial \
+                            or context == "final" and (
+                                cursor == length
+                                or text[cursor] in boundaries):
+                        match = candidate
+                        end = cursor
+                        break
+                if cursor == length:
+                    break
+                node = node.get(text[cursor])
+
+            if match is None:
+                if coda is not None:
+                    append(coda)
+                    coda = None
+                append(text[position])
+                position += 1
+                unmatched[0] += 1
+                unmatched[1] += timer() - begin
+            else:
+                value, next_coda, context = match
+                if coda is not None and context != "joined":
+                    append(coda)
+                append(value)
+                coda = next_coda
+                record = stats[_context_rule(text[position:end], context)]
+                position = end
+                record[0] += 1
+                record[1] += timer() - begin
+        if coda is not None:
+            append(coda)
+        return "".join(output)
+
+    return stats, convert
+
+
+def _context_rule(key, context):
+    return key if context is None else "{} ({})".format(key, context)
+
+
+def _regex(converter):
+    """ Instruments the passes of a `RegexConverter`, rule by rule """
+    stats = {}
+    steps = []
+    for pattern, replacement, rules in converter.passes:
+        for rule, template in rules or ((pattern, replacement),):
+            # Rules are told apart by their position, as a table may repeat
+            # a pattern.
+            label = _Rule(len(steps), rule.pattern)
+            stats[label] = [0, 0.0]
+            steps.append((rule.subn, template, stats[label]))
+    timer = time.perf_counter
+
+    def convert(text):
+        for subn, template, record in steps:
+            begin = timer()
+            text, hits = subn(template, text)
+            record[0] += hits
+            record[1] += timer() - begin
+        return text
+
+    return stats, convert
+
+
+def _replace(converter):
+    """ Instruments the chain of a `ReplaceConverter`, rule by rule """
+    stats = {}
+    steps = []
+    for key, value in converter.rules:
+        # Rules are told apart by their position, as a table may repeat a
+        # key.
+        label = _Rule(len(steps), key)
+        stats[label] = [0, 0.0]
+        steps.append((key, value, stats[label]))
+    timer = time.perf_counter
+
+    def convert(text):
+        for key, value, record in steps:
+            begin = timer()
+            record[0] += text.count(key)
+            text = text.replace(key, value)
+            record[1] += timer() - begin
+        return text
+
+    return stats, convert
+
+
+class _Rule(tuple):
+    """ A (position, key) pair, printed as its key """
+
+    def __new__(cls, position, key):
+        return super().__new__(cls, (position, key))
+
+    def __str__(self):
+        return self[1]
+
+
+def profile_file(language, path, scheme=None):
+    """ Returns the report of converting a file
+
+    Parameters
+    ----------
+    language : str
+        Name or alias of the language.
+
+    path : str
+        File to be converted, - for the standard input.
+
+    scheme : str
+        Type of transliteration, as given with --type.
+
+    Returns
+    -------
+    report : str
+        Report of the rules of the converters used.
+    """
+    from pieoffice.registry import get_converter
+
+    conv = get_converter(language, scheme)[0]
+    if path == "-":
+        text = sys.stdin.read()
+    else:
+        with open(path, encoding="utf-8") as source:
+            text = source.read()
+    with Profiler() as profiler:
+        conv(text)
+    return profiler.report()
+
+
+def profile_process():
+    """ Profiles the whole process, writing the report when it exits """
+    profiler = Profiler()
+    profiler.start()
+    atexit.register(lambda: sys.stderr.write(profiler.report()))
@@ -0,0 +1,365 @@
+#! /usr/bin/env python3
+
+""" Language registry
+
+Describes every language pieoffice converts: its name and aliases, the module
+holding its converter, how the converter is built for each type of
+transliteration, and where its rules are documented. Modules are only
+imported when a converter is requested, and each converter is built once.
+Listing the languages or printing their rules imports no converter module.
+
+Other packages can add languages through the `pieoffice.languages` entry
+point group, each entry point pointing to a `Language` instance:
+
+    [tool.poetry.plugins."pieoffice.languages"]
+    hittite = "pieoffice_hittite.language:HITTITE"
+
+The installed entry points are only looked at when a name is not one of the
+languages shipped with pieoffice, or when every language is listed, and the
+plugin named after the language is loaded first.
+
+The file can be imported as a module and contains the following:
+    Language - description of a language and of its converters.
+    LANGUAGES - the languages shipped with pieoffice.
+    languages - returns every registered language.
+    get_language - returns a language by name or alias.
+    get_converter - returns the conversion function for a language.
+
+Usage
+-----
+
+    > conv, stream_options = get_converter("vedic", "iast")
+    > conv("agni/mILe")
+    + agnímīl̠e
+"""
+
+import ast
+import importlib
+import importlib.util
+
+
+class Language:
+    """
+    Description of a language and of its converters.
+
+    Attributes
+    ----------
+    name : str
+        Name used on the command line.
+
+    description : str
+        Line shown by `pieoffice list`.
+
+    module : str
+        Module holding the converter, whose docstring documents the rules.
+
+    factory : str
+        Name of the conversion function in the module or, for languages with
+        several types of transliteration, of the converter class. The class
+        is built with the scheme and its converter method is used.
+
+    aliases : tuple
+        Other names of the language.
+
+    schemes : dict
+        Scheme given to the converter class for each value of --type, the
+        None key holding the default. None for conversion functions.
+
+    stream_options : dict
+        Options of `pieoffice.stream.convert_stream`, by value of --type.
+
+    Methods
+    -------
+    scheme(self, scheme)
+        Returns the value of --type standing for scheme.
+    converter(self, scheme=None, engine="compiled")
+        Returns the cached conversion function for a type of
+        transliteration.
+    """
+
+    def __init__(self, name, description, module, factory, aliases=(),
+                 schemes=None, stream_options=None):
+        self.name = name
+        self.description = description
+        self.module = module
+        self.factory = factory
+        self.aliases = tuple(aliases)
+        self.schemes = schemes
+        self.stream_options = stream_options or {}
+        self._converters = {}
+        self._doc = None
+
+    @property
+    def types(self):
+        """ Values accepted by --type, besides the default """
+        return tuple(scheme for scheme in self.schemes or () if scheme)
+
+    def scheme(self, scheme):
+        """ Returns the value of --type standing for scheme
+
+        That is scheme itself if the language supports it, otherwise None,
+        for the default type.
+        """
+        if self.schemes is not None and scheme in self.schemes:
+            return scheme
+        return None
+
+    @property
+    def doc(self):
+        """ Docstring of the module, read without importing it """
+        if self._doc is None:
+            self._doc = _module_doc(self.module)
+        return self._doc
+
+    def converter(self, scheme=None, engine="compiled"):
+        """ Returns the conversion function for a type of transliteration
+
+        Unknown types fall back to the default one.
+
+        Parameters
+        ----------
+        scheme : str
+            Value of --type.
+
+        engine : str
+            "compiled", or "legacy" for the former chains of replacements,
+            as kept by `pieoffice.legacy` to check the converters against.
+
+        Returns
+        -------
+        conv : callable
+            Function converting a string.
+        """
+        scheme = self.scheme(scheme)
+        try:
+            return self._converters[scheme, engine]
+        except KeyError:
+            pass
+
+        from pieoffice.compiler import use_engine
+
+        with use_engine(engine):
+            factory = getattr(importlib.import_module(self.module),
+                              self.factory)
+            if self.schemes is None:
+                conv = factory
+            else:
+                conv = factory(self.schemes[scheme]).converter
+        if engine != "compiled":
+            conv = _with_engine(conv, engine)
+        self._converters[scheme, engine] = conv
+        return conv
+
+
+def _with_engine(conv, engine):
+    """ The conversion function, run with another engine """
+    from pieoffice.compiler import use_engine
+
+    def convert(text):
+        with use_engine(engine):
+            return conv(text)
+
+    return convert
+
+
+def _module_doc(module):
+    spec = importlib.util.find_spec(module)
+    try:
+        with open(spec.origin, encoding="utf-8") as source:
+            tree = ast.parse(source.read())
+    except (OSError, SyntaxError, TypeError, ValueError):
+        # No readable source, as for compiled modules.
+        return importlib.import_module(module).__doc__
+    return ast.get_docstring(tree, clean=False)
+
+
+LANGUAGES = (
+    Language("pie", "Proto-Indo-European",
+             "pieoffice.pie", "alpha_to_pie"),
+    Language("greek", "Polytonic Greek",
+             "pieoffice.greek", "alpha_to_greek"),
+    Language("linearb", "Mycenaean Libear B",
+             "pieoffice.linearb", "alpha_to_linearb",
+             stream_options={None: {"separator": " "}}),
+    Language("cypriot", "Cypriot Greek Script",
+             "pieoffice.cypriot", "alpha_to_cypriot",
+             stream_options={None: {"separator": " "}}),
+    Language("luwian", "Hieroglyphic Luwian",
+             "pieoffice.luwian", "alpha_to_luwian"),
+    Language("lycian", "Lycian",
+             "pieoffice.lycian", "alpha_to_lycian"),
+    Language("lydian", "Lydian",
+             "pieoffice.lydian", "alpha_to_lydian"),
+    Language("carian", "Carian",
+             "pieoffice.carian", "alpha_to_carian"),
+    Language("gothic", "Gothic",
+             "pieoffice.gothic", "alpha_to_gothic"),
+    Language("armenian", "Armenian",
+             "pieoffice.armenian", "AsciiConverter",
+             schemes={
+                 None: "armenian_alphabet",
+                 "iso": "iso",
+                 "classical": "classical",
+                 "maiscules": "armenian_maiscules",
+             }),
+    Language("vedic", "Vedic / Sanskrit (HK>Devanagari)",
+             "pieoffice.vedic", "AsciiConverter",
+             aliases=("sanskrit",),
+             schemes={
+                 None: "hk_to_deva",
+                 "iso": "hk_to_iso",
+                 "iast": "hk_to_iast",
+             },
+             stream_options={None: {"lines": True}}),
+    Language("vedictranslit", "Vedic / Sanskrit (HK>IAST)",
+             "pieoffice.vedic", "AsciiConverter",
+             aliases=("sanskrithk",),
+             schemes={
+                 None: "hk_to_iast",
+                 "iso": "hk_to_iso",
+                 "iast": "hk_to_iast",
+             }),
+    Language("vedicdeva", "Vedic / Sanskrit (Devanagari>HK)",
+             "pieoffice.vedic", "DevaConverter",
+             aliases=("sanskritdeva",),
+             schemes={
+                 None: "deva_to_hk",
+                 "iast": "deva_to_iast",
+             },
+             stream_options={None: {"lines": True}, "iast": {"lines": True}}),
+    Language("avestan", "Avestan (script)",
+             "pieoffice.avestan", "AsciiConverter",
+             schemes={
+                 None: "script",
+                 "translit": "roman-hoffman",
+             }),
+    Language("avestantranslit", "Avestan (romanized)",
+             "pieoffice.avestan", "AsciiConverter",
+             schemes={
+                 None: "roman-hoffman",
+             }),
+    Language("oldpersian", "Old Persian Cuneiform",
+             "pieoffice.oldpersian", "alpha_to_oldpersian"),
+    Language("ogham", "Ogham Script",
+             "pieoffice.ogham", "alpha_to_ogham"),
+    Language("oscan", "Oscan (Old Italic Script)",
+             "pieoffice.oscan", "alpha_to_oscan"),
+)
+
+ENTRY_POINT_GROUP = "pieoffice.languages"
+
+_languages = None
+_index = {}
+_plugins = None
+
+
+def _entry_points():
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8
+        try:
+            from pkg_resources import iter_entry_points
+        except ImportError:
+            return ()
+        return tuple(iter_entry_points(ENTRY_POINT_GROUP))
+
+    found = entry_points()
+    if hasattr(found, "select"):
+        return tuple(found.select(group=ENTRY_POINT_GROUP))
+    return tuple(found.get(ENTRY_POINT_GROUP, ()))
+
+
+def _plugin_entry_points():
+    """ The entry points of the plugins, looked up once """
+    global _plugins
+    if _plugins is None:
+        _plugins = _entry_points()
+    return _plugins
+
+
+def _register(language):
+    for name in (language.name,) + language.aliases:
+        _index.setdefault(name, language)
+
+
+def languages():
+    """ Returns the languages shipped with pieoffice and those of plugins
+
+    Every plugin is loaded.
+
+    Returns
+    -------
+    languages : tuple of Language
+        Registered languages, in the order they are listed.
+    """
+    global _languages
+    if _languages is None:
+        registered = list(LANGUAGES)
+        for entry_point in _plugin_entry_points():
+            registered.append(entry_point.load())
+        _languages = tuple(registered)
+        for language in _languages:
+            _register(language)
+    return _languages
+
+
+def get_language(name):
+    """ Returns a registered language by name or alias
+
+    Parameters
+    ----------
+    name : str
+        Name or alias of the language.
+
+    Returns
+    -------
+    language : Language
+        The registered language.
+    """
+    if not _index:
+        for language in LANGUAGES:
+            _register(language)
+    try:
+        return _index[name]
+    except KeyError:
+        pass
+
+    # The plugin named after the language, then all of them for aliases.
+    for entry_point in _plugin_entry_points():
+        if entry_point.name == name:
+            _register(entry_point.load())
+            break
+    else:
+        languages()
+    try:
+        return _index[name]
+    except KeyError:
+        raise ValueError("Unknown language: {}".format(name)) from None
+
+
+def get_converter(language, scheme=None, engine="compiled"):
+    """ Returns the conversion function for a language
+
+    Parameters
+    ----------
+    language : str
+        Name or alias of the language.
+
+    scheme : str
+        Type of transliteration, as given with --type.
+
+    engine : str
+        "compiled", or "legacy" for the former chains of replacements.
+
+    Returns
+    -------
+    conv : callable
+        Function converting a string.
+
+    stream_options : dict
+        Options of `pieoffice.stream.convert_stream` for the converter.
+    """
+    language = get_language(language)
+    scheme = language.scheme(scheme)
+    return (language.converter(scheme, engine),
+            language.stream_options.get(scheme, {}))
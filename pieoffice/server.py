@@ -0,0 +1,254 @@
+#! /usr/bin/env python3
+
+""" Conversion server
+
+Keeps the converters loaded in a long running process, so that editors and
+scripts converting many short texts pay for the interpreter startup and the
+module imports only once. Requests and responses are JSON objects, one per
+line, exchanged over a Unix socket or over the standard input and output.
+
+A request names the language, and optionally the type of transliteration and
+an id, which is echoed back:
+
+    {"id": 1, "language": "vedic", "type": "iast", "text": "agni/mILe"}
+
+The response holds either the converted text or an error message:
+
+    {"id": 1, "output": "agnímīl̠e"}
+    {"id": 2, "error": "Unknown language: hittite"}
+
+The file can be imported as a module and contains the following:
+    Server - answers conversion requests, caching the converters it uses.
+    serve_socket - serves requests on a Unix socket.
+    serve_stdio - serves requests on the standard input and output.
+    request - sends a request to a server listening on a Unix socket.
+    default_socket_path - returns the socket used when none is given.
+
+Usage
+-----
+
+    $ pieoffice serve &
+    $ pieoffice convert gothic wulfila --client
+    𐍅𐌿𐌻𐍆𐌹𐌻𐌰
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+
+# Fields every request must hold.
+_REQUIRED = ("language", "text")
+
+
+def default_socket_path():
+    """ Returns the path of the server socket
+
+    It is taken from the PIEOFFICE_SOCKET environment variable, falling back
+    to a per-user file in the temporary directory.
+    """
+    try:
+        return os.environ["PIEOFFICE_SOCKET"]
+    except KeyError:
+        return os.path.join(tempfile.gettempdir(),
+                            "pieoffice-{}.sock".format(os.getuid()))
+
+
+class Server:
+    """
+    Answers conversion requests.
+
+    Attributes
+    ----------
+    resolve : callable
+        Function returning the conversion function for a language and a type
+        of transliteration, such as `pieoffice.__main__.get_converter`.
+
+    converters : dict
+        Conversion functions already resolved, by (language, type).
+
+    Methods
+    -------
+    converter(self, language, scheme=None)
+        Returns the cached conversion function for a language.
+    warm(self, languages)
+        Loads the converters of the given (language, type) pairs.
+    respond(self, line)
+        Answers a request line with a response line.
+    """
+
+    def __init__(self, resolve):
+        self.resolve = resolve
+        self.converters = {}
+
+    def converter(self, language, scheme=None):
+        """ Returns the conversion function for a language """
+        try:
+            return self.converters[language, scheme]
+        except KeyError:
+            conv = self.resolve(language, scheme)[0]
+            self.converters[language, scheme] = conv
+            return conv
+
+    def warm(self, languages):
+        """ Loads and compiles the converters of (language, type) pairs """
+        for language, scheme in languages:
+            self.converter(language, scheme)("")
+
+    def respond(self, line):
+        """ Answers a request
+
+        Parameters
+        ----------
+        line : str
+            JSON request.
+
+        Returns
+        -------
+        response : str
+            JSON response, ending with a newline.
+        """
+        response = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("A request must be a JSON object")
+            if "id" in request:
+                response["id"] = request["id"]
+            for field in _REQUIRED:
+                if field not in request:
+                    raise ValueError("Missing field: {}".format(field))
+            conv = self.converter(request["language"], request.get("type"))
+            response["output"] = conv(request["text"])
+        except Exception as error:
+            response["error"] = str(error) or type(error).__name__
+        return json.dumps(response, ensure_ascii=False) + "\n"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                response = self.server.respond(line.decode("utf-8"))
+                self.wfile.write(response.encode("utf-8"))
+
+
+class _SocketServer(socketserver.ThreadingMixIn,
+                    socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, server):
+        self.respond = server.respond
+        super().__init__(path, _Handler)
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def _listening(path):
+    """ Whether a server accepts connections on the socket """
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(path)
+    except OSError:
+        return False
+    finally:
+        connection.close()
+    return True
+
+
+def serve_socket(server, path=None):
+    """ Serves requests on a Unix socket until interrupted or terminated
+
+    Parameters
+    ----------
+    server : Server
+        Server answering the requests.
+
+    path : str
+        Path of the socket, by default `default_socket_path()`. A socket
+        left there by a server that is gone is replaced.
+
+    Raises
+    ------
+    OSError
+        If another server is listening on the socket.
+    """
+    path = path or default_socket_path()
+    if os.path.exists(path):
+        if _listening(path):
+            raise OSError("A server is already listening on {}".format(path))
+        # Left behind by a server that did not exit cleanly.
+        os.unlink(path)
+    socket_server = _SocketServer(path, server)
+    signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        socket_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        socket_server.server_close()
+        os.unlink(path)
+
+
+def serve_stdio(server, source=None, target=None):
+    """ Serves requests read from the standard input until it is closed
+
+    Parameters
+    ----------
+    server : Server
+        Server answering the requests.
+
+    source, target : file object
+        Text streams to be used instead of the standard input and output.
+    """
+    source = source or sys.stdin
+    target = target or sys.stdout
+    for line in source:
+        if line.strip():
+            target.write(server.respond(line))
+            target.flush()
+
+
+def request(language, text, scheme=None, path=None):
+    """ Converts a text with a server listening on a Unix socket
+
+    Parameters
+    ----------
+    language : str
+        Language name.
+
+    text : str
+        Text to be converted.
+
+    scheme : str
+        Type of transliteration.
+
+    path : str
+        Path of the socket, by default `default_socket_path()`.
+
+    Returns
+    -------
+    output : str
+        Converted text.
+    """
+    message = {"language": language, "text": text}
+    if scheme is not None:
+        message["type"] = scheme
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(path or default_socket_path())
+        stream = connection.makefile("rwb")
+        stream.write((json.dumps(message) + "\n").encode("utf-8"))
+        stream.flush()
+        response = json.loads(stream.readline().decode("utf-8"))
+    finally:
+        connection.close()
+
+    if "error" in response:
+        raise ValueError(response["error"])
+    return response["output"]
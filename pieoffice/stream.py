@@ -0,0 +1,108 @@
+#! /usr/bin/env python3
+
+""" Streaming conversion
+
+Converts texts read from a file object chunk by chunk, so that inputs of any
+size are converted in bounded memory. Chunks are only cut right after a space
+or a newline: no rule key spans a word boundary, so keys like `lRR`, `*181`
+or `(DEUS)VIA+TERRA` are matched just as in the whole text, and the rules
+looking at the start of words see the same context.
+
+The file can be imported as a module and contains the following:
+    iter_chunks - splits a text stream into chunks ending at a boundary.
+    convert_stream - converts a text stream into another one.
+
+Usage
+-----
+
+    > from pieoffice.gothic import alpha_to_gothic
+    > with open("wulfila.txt") as source, open("out.txt", "w") as target:
+    >     convert_stream(alpha_to_gothic, source, target)
+"""
+
+CHUNK_SIZE = 1 << 16
+
+
+def iter_chunks(source, chunk_size=CHUNK_SIZE, boundaries=" \n"):
+    """ Reads a text stream in chunks ending right after a boundary
+
+    A chunk grows past chunk_size only when no boundary turns up, as in a
+    very long line without spaces.
+
+    Parameters
+    ----------
+    source : file object
+        Text stream to be read.
+
+    chunk_size : int
+        Number of characters read at a time.
+
+    boundaries : str
+        Characters after which a chunk may end.
+
+    Yields
+    ------
+    chunk : str
+        Consecutive pieces of the text, all but the last one ending with a
+        boundary character.
+    """
+    pending = []
+    while True:
+        data = source.read(chunk_size)
+        if not data:
+            break
+        cut = max(data.rfind(boundary) for boundary in boundaries) + 1
+        if not cut:
+            pending.append(data)
+            continue
+        pending.append(data[:cut])
+        yield "".join(pending)
+        pending = [data[cut:]]
+
+    tail = "".join(pending)
+    if tail:
+        yield tail
+
+
+def convert_stream(convert, source, target, chunk_size=CHUNK_SIZE,
+                   separator="", lines=False):
+    """ Converts a text stream into another one, chunk by chunk
+
+    Parameters
+    ----------
+    convert : callable
+        Conversion function, such as `alpha_to_gothic` or the converter
+        method of an AsciiConverter.
+
+    source : file object
+        Text stream to be converted.
+
+    target : file object
+        Text stream the converted text is written to.
+
+    chunk_size : int
+        Number of characters read at a time.
+
+    separator : str
+        Text written between non-empty converted chunks, for converters that
+        strip the whitespace around their output, like `alpha_to_linearb`.
+
+    lines : bool
+        Whether each line is converted on its own. Converters whose output
+        depends on the whole text, such as the udatta to anudatta accents of
+        Vedic, then handle every line as a separate text.
+    """
+    if lines:
+        for chunk in iter_chunks(source, chunk_size, "\n"):
+            target.write("\n".join(map(convert, chunk.split("\n"))))
+        return
+
+    written = False
+    for chunk in iter_chunks(source, chunk_size):
+        output = convert(chunk)
+        if not output:
+            continue
+        if written:
+            target.write(separator)
+        target.write(output)
+        written = True
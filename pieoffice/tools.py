@@ -1,9 +1,22 @@
 #! /usr/bin/env python3
 
+import warnings
+
 aegean_numbers = {"1": "𐄇", "2": "𐄈", "3": "𐄉", "4": "𐄊", "5": "𐄋", "6": "𐄌", "7": "𐄍", "8": "𐄎", "9": "𐄏", "10": "𐄐", "20": "𐄑", "30": "𐄒", "40": "𐄓", "50": "𐄔", "60": "𐄕", "70": "𐄖", "80": "𐄗", "90": "𐄘", "100": "𐄙", "200": "𐄚", "300": "𐄛", "400": "𐄜", "500": "𐄝", "600": "𐄞", "700": "𐄟", "800": "𐄠", "900": "𐄡", "1000": "𐄢", "2000": "𐄣", "3000": "𐄤", "4000": "𐄥", "5000": "𐄦", "6000": "𐄧", "7000": "𐄨", "8000": "𐄩", "9000": "𐄪", "10000": "𐄫", "20000": "𐄬", "30000": "𐄭", "40000": "𐄮", "50000": "𐄯", "60000": "𐄰", "70000": "𐄱", "80000": "𐄲", "90000": "𐄳", "0":""}
 
+aegean_values = {glyph: int(number)
+                 for number, glyph in aegean_numbers.items() if glyph}
+
+
 def get_key(val, script):
+    """ Returns the first key of a dictionary mapped to a value
+
+    Deprecated: it scans the whole dictionary at each call. Look values up
+    in a reverse index instead, such as `aegean_values` or the tables of
+    `pieoffice.compiler.invert_rules`.
+    """
+    warnings.warn("get_key is deprecated, use a reverse index such as "
+                  "aegean_values", DeprecationWarning, stacklevel=2)
     for key, value in script.items():
         if val == value:
             return key
-
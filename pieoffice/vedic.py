@@ -10,10 +10,18 @@ Accents should be placed as following for DEVANAGARI
         + स्वरितः - अ॑
 
 Otherwise, use ´, /, `. \\ and =, ^
+
+Devanagari is converted back to Harvard-Kyoto or IAST by DevaConverter,
+which reads the anudatta notation back into udatta slashes:
+        > deva_to_hk(अ॒ग्निमी॑ळे)
+        + agni/mILe
 """
 
 import re
 
+from pieoffice.compiler import compile_context_rules, compile_regex_rules, \
+    compile_rules
+
 ASCII_HK_TO_DEVA = (
     (r"([\n ]|^)ai", r"\1ऐ"),
     (r"([\n ]|^)au", r"\1औ"),
@@ -194,6 +202,116 @@ ASCII_HK_TO_ISO = (
 )
 
 
+# Harvard-Kyoto units, longest first. Anything else is a token of its own.
+HK_TOKEN = re.compile(r"lRR|lR|RR|ai|au|[kgcjTDtdpb]h|LL|MM|\|\||.",
+                      re.DOTALL)
+
+HK_VOWELS = frozenset((
+    "ai", "au", "a", "A", "i", "I", "u", "U", "e", "o",
+    "lRR", "lR", "RR", "R",
+))
+
+HK_CONSONANTS = frozenset((
+    "kh", "gh", "ch", "jh", "Th", "Dh", "th", "dh", "ph", "bh",
+    "k", "g", "G", "c", "j", "J", "T", "D", "N", "t", "d", "n", "p", "b", "m",
+    "y", "r", "l", "v", "z", "S", "s", "LL", "L", "h",
+))
+
+# Tokens closing a syllable, as in hkToSyllables.
+HK_NUCLEI = HK_VOWELS | {"E", "O"}
+
+# Text whose syllables hkToSyllables reads differently from the token list:
+# units that a dropped accent or syllable dot joins into a longer unit. Such
+# texts are accented from the string instead.
+_HK_AMBIGUOUS = re.compile(
+    r"a[/.]+[iu]|l[/.]+R|R[/.]+R|[kgcjTDtdpb][/.]+h|L[/.]+L|M[/.]+M"
+    r"|\|[/.]+\|"
+)
+
+# Devanagari to Harvard-Kyoto. Consonants carry an inherent a, which a vowel
+# sign replaces and a virama removes.
+DEVA_CONSONANTS = (
+    ("ख", "kh"), ("घ", "gh"), ("छ", "ch"), ("झ", "jh"), ("ठ", "Th"),
+    ("ढ", "Dh"), ("थ", "th"), ("ध", "dh"), ("फ", "ph"), ("भ", "bh"),
+    ("क", "k"), ("ग", "g"), ("ङ", "G"), ("च", "c"), ("ज", "j"), ("ञ", "J"),
+    ("ट", "T"), ("ड", "D"), ("ण", "N"), ("त", "t"), ("द", "d"), ("न", "n"),
+    ("प", "p"), ("ब", "b"), ("म", "m"), ("य", "y"), ("र", "r"), ("ल", "l"),
+    ("व", "v"), ("श", "z"), ("ष", "S"), ("स", "s"), ("ऴ", "LL"), ("ळ", "L"),
+    ("ह", "h"),
+)
+
+DEVA_VOWEL_SIGNS = (
+    ("ा", "A"), ("ि", "i"), ("ी", "I"), ("ु", "u"), ("ू", "U"), ("े", "e"),
+    ("ै", "ai"), ("ो", "o"), ("ौ", "au"), ("ृ", "R"), ("ॄ", "RR"),
+    ("ॢ", "lR"), ("ॣ", "lRR"),
+)
+
+DEVA_VIRAMA = "्"
+
+DEVA_TO_HK = (
+    ("अ", "a"), ("आ", "A"), ("इ", "i"), ("ई", "I"), ("उ", "u"), ("ऊ", "U"),
+    ("ए", "e"), ("ऐ", "ai"), ("ओ", "o"), ("औ", "au"), ("ऋ", "R"),
+    ("ॠ", "RR"), ("ऌ", "lR"), ("ॡ", "lRR"), ("ॐ", "OM"),
+
+    ("ं", "M"),
+    ("ः", "H"),
+    ("ँ", "&"),
+    ("ऽ", "'"),
+    ("॑", "\\"),
+    ("॒", "="),
+
+    ("१", "1"), ("२", "2"), ("३", "3"), ("४", "4"), ("५", "5"),
+    ("६", "6"), ("७", "7"), ("८", "8"), ("९", "9"), ("०", "0"),
+
+    ("॥", "||"),
+    ("।", "|"),
+)
+
+# Harvard-Kyoto vowels at the start of a word, as written by ASCII_HK_TO_DEVA.
+HK_INITIAL_VOWELS = (
+    ("ai", "ऐ"), ("au", "औ"), ("a", "अ"), ("A", "आ"), ("i", "इ"), ("I", "ई"),
+    ("u", "उ"), ("U", "ऊ"), ("e", "ए"), ("o", "ओ"), ("lRR", "लॄ"),
+    ("lR", "लृ"), ("RR", "ॠ"), ("R", "ऋ"),
+)
+
+
+def _hk_rules():
+    # A consonant leaves a virama, which the sign of a following vowel
+    # replaces. A vowel neither initial nor after a consonant, as after an
+    # anusvara, is written as its sign after a space, the inherent a as the
+    # space alone. An udatta left before an accent mark is dropped with it.
+    rules = [(hk, glyph, "initial") for hk, glyph in HK_INITIAL_VOWELS]
+    for sign, hk in (("", "a"),) + DEVA_VOWEL_SIGNS:
+        rules.append((hk, sign, "joined"))
+        rules.append((hk, " " + sign, None))
+    for glyph, hk in DEVA_CONSONANTS:
+        rules.append((hk, (glyph, DEVA_VIRAMA), None))
+    for glyph, hk in DEVA_TO_HK:
+        if hk not in HK_VOWELS and hk != "OM":
+            rules.append((hk, glyph, None))
+    rules.append(("/\\", "", None))
+    rules.append(("/=", "", None))
+    return tuple(rules)
+
+
+# The rules read the longest unit at each position, and so differ on
+# purpose from ASCII_HK_TO_DEVA, the table of the released converter, which
+# the legacy engine still applies:
+#   - "ai" after a consonant is written with one sign: kai gives कै, not
+#     कै ै;
+#   - a word-initial lRR is read whole: lRR gives लॄ, not लृ ृ;
+#   - runs of L are read from the left, two at a time: kaLLLa gives कऴ्ळ,
+#     not कळ्ऴ.
+HK_TO_DEVA_RULES = _hk_rules()
+
+# A Harvard-Kyoto syllable as split by hkToSyllables, and the svarita or
+# anudatta mark closing it in the anudatta notation.
+_HK_MARKED_SYLLABLE = re.compile(
+    r"([^aeiouAEIOUR\\=]*(?:ai|au|RR|[aeiouAEIOUR]))([HM&]*)([\\=]?)"
+    r"|([^aeiouAEIOUR\\=]+)([\\=]?)$"
+)
+
+
 def hkUdToHkAnu(hkUdStr):
     hkSyllab = hkToSyllables(hkUdStr)
     hkAcc = hkAccentuation(hkSyllab)
@@ -257,17 +375,23 @@ def udToAnu(udStr):
 
     anuStr = udStr
 
-    anuStr = re.sub(r"BU",  "AU", anuStr)
-    anuStr = re.sub(r"UB",  "US", anuStr)
-    anuStr = re.sub(r"U",   "D", anuStr)
+    anuStr = anuStr.replace("BU", "AU")
+    anuStr = anuStr.replace("UB", "US")
+    anuStr = anuStr.replace("U", "D")
 
-    while ("BA" in anuStr or "BD" in anuStr):
-        anuStr = re.sub(r"^(B*)[BD](A)",    r"\1A\2", anuStr)
-        anuStr = re.sub(r"\n(B*)[BD](A)",   r"\1A\2", anuStr)
-        anuStr = re.sub(r"([ADSB])B([AD])", r"\1D\2", anuStr)
-        anuStr = re.sub(r"B$", "D", anuStr)
+    # The unmarked syllables are settled as a whole rather than by rewriting
+    # the string until it stops changing. Without an anudatta right after an
+    # unmarked syllable they all stay unmarked. Otherwise the run opening the
+    # text turns anudatta, as does a leading udatta directly followed by an
+    # anudatta, and every other unmarked syllable becomes D.
+    if "BA" not in anuStr:
+        return anuStr
 
-    return anuStr
+    if anuStr.startswith("DA"):
+        return "A" + anuStr[1:].replace("B", "D")
+
+    opening = len(anuStr) - len(anuStr.lstrip("B"))
+    return "A" * opening + anuStr[opening:].replace("B", "D")
 
 
 class AsciiConverter:
@@ -284,6 +408,11 @@ class AsciiConverter:
             self.scheme = "hk_to_iso"
             self.script_set = ASCII_HK_TO_ISO
             self.udata_to_anudatta = False
+        if self.scheme == "hk_to_deva":
+            self._converter = compile_context_rules(HK_TO_DEVA_RULES,
+                                                    legacy=ASCII_HK_TO_DEVA)
+        else:
+            self._converter = compile_regex_rules(self.script_set)
 
     def converter(self, ascii_text):
         if self.udata_to_anudatta and self.scheme == "hk_to_deva":
@@ -293,8 +422,249 @@ class AsciiConverter:
         else:
             output = ascii_text
 
-        for pair in self.script_set:
-            output = re.sub(pair[0], pair[1], output)
+        return self._converter.convert(output)
+
+
+class _TokenTable(dict):
+    """ Renderings of single tokens, filled in by a converter on demand """
+
+    def __init__(self, converter):
+        super().__init__()
+        self.converter = converter
+
+    def __missing__(self, token):
+        self[token] = rendering = self.converter(token)
+        return rendering
+
+
+_token_tables = {}
+
+
+def _token_table(scheme):
+    try:
+        return _token_tables[scheme]
+    except KeyError:
+        converter = AsciiConverter(scheme, udatta_to_anudatta=False).converter
+        table = _token_tables[scheme] = _TokenTable(converter)
+        return table
+
+
+def hkTokenize(hkStr):
+    """
+    Splits a Harvard-Kyoto string into its units: vowels, consonants,
+    and single characters for everything else.
+
+    Example:
+    >>> hkTokenize("kRSNa/M")
+    ['k', 'R', 'S', 'N', 'a', '/', 'M']
+    """
+    return HK_TOKEN.findall(hkStr)
+
+
+def hkTokensToSyllables(tokens):
+    """
+    Groups a token list into syllables, splitting it where hkToSyllables
+    would place its dots.
+    """
+    syllables = []
+    syllable = []
+    # 0: no pending dot; 1: right after a dot, which an accent and then one
+    # of H, M or & may still cross; 2: after a dot crossed by an accent; 3:
+    # after a dot crossed by H, M or &.
+    pending = 0
+    for token in tokens:
+        if pending:
+            if pending == 1 and token == "/":
+                syllable.append(token)
+                pending = 2
+                continue
+            if pending < 3 and token in ("H", "M", "&"):
+                syllable.append(token)
+                pending = 3
+                continue
+            if pending < 3 and token == "MM":
+                syllable.append("M")
+                token = "M"
+            syllables.append(syllable)
+            syllable = []
+            pending = 0
+
+        if token == ".":
+            pending = 1
+        else:
+            syllable.append(token)
+            if token in HK_NUCLEI:
+                pending = 1
+
+    # A dot closing the text, or its last line, is dropped.
+    if not pending and syllable == ["\n"] and syllables:
+        syllables[-1].append("\n")
+    else:
+        syllables.append(syllable)
+    return syllables
+
+
+def hkTokensUdToAnu(tokens):
+    """
+    Token list counterpart of hkUdToHkAnu: accent marks follow the
+    anudatta notation, and udatta marks and syllable dots are dropped.
+    """
+    syllables = hkTokensToSyllables(tokens)
+    accents = udToAnu("".join("U" if "/" in syllable else "B"
+                              for syllable in syllables))
+
+    anuTokens = []
+    for accent, syllable in zip(accents, syllables):
+        if accent == "A":
+            anuTokens.extend(syllable)
+            anuTokens.append("=")
+        elif accent == "S":
+            anuTokens.extend(syllable)
+            anuTokens.append("\\")
+        else:
+            anuTokens.extend(token for token in syllable if token != "/")
+    return anuTokens
+
+
+def convert_multi(hkStr, schemes=("deva", "iast", "iso"),
+                  udatta_to_anudatta=True):
+    """
+    Converts a Harvard-Kyoto string into several schemes at once.
+
+    The text is tokenized a single time and every output is rendered from
+    the same token list, instead of running each scheme's rule table over
+    the raw string. The outputs are the same as AsciiConverter's.
+
+    Parameters
+    ----------
+    hkStr : str
+        Text in Harvard-Kyoto.
+
+    schemes : sequence of str
+        Target schemes, among "deva", "iast" and "iso" (or "hk_to_deva",
+        "hk_to_iast" and "hk_to_iso").
+
+    udatta_to_anudatta : bool
+        Whether the Devanagari output marks accents in the anudatta
+        notation.
+
+    Returns
+    -------
+    outputs : list of str
+        One converted text per scheme, in the order requested.
+
+    Example:
+    >>> convert_multi("agni/mILe", ["deva", "iast"])
+    ['अ॒ग्निमी॑ळे', 'agnímīḷe']
+    """
+    tokens = hkTokenize(hkStr)
+    outputs = []
+    for scheme in schemes:
+        if not scheme.startswith("hk_to_"):
+            scheme = "hk_to_" + scheme
+        if scheme == "hk_to_deva":
+            if udatta_to_anudatta and not _HK_AMBIGUOUS.search(hkStr):
+                converter = compile_context_rules(HK_TO_DEVA_RULES)
+                outputs.append(converter.convert(
+                    "".join(hkTokensUdToAnu(tokens))))
+            else:
+                converter = AsciiConverter(scheme, udatta_to_anudatta)
+                outputs.append(converter.converter(hkStr))
+        elif scheme in ("hk_to_iast", "hk_to_iso"):
+            outputs.append("".join(map(_token_table(scheme).__getitem__,
+                                       tokens)))
+        else:
+            raise ValueError("Unknown scheme: {}".format(scheme))
+    return outputs
+
+
+def _deva_rules():
+    rules = list(DEVA_TO_HK)
+    for consonant, hk in DEVA_CONSONANTS:
+        rules.append((consonant + DEVA_VIRAMA, hk))
+        for sign, vowel in DEVA_VOWEL_SIGNS:
+            rules.append((consonant + sign, hk + vowel))
+        rules.append((consonant, hk + "a"))
+    return tuple(rules)
+
+
+DEVA_TO_HK_RULES = _deva_rules()
+
+
+def hkAnuToHkUd(hkAnuStr):
+    """
+    Converts Harvard-Kyoto text with accents in the anudatta notation,
+    svarita marked with a backslash and anudatta with =, back to the udatta
+    notation of hkUdToHkAnu, with a slash after each udatta vowel.
+
+    The udatta syllables are the unmarked ones following an anudatta or
+    another udatta, as well as the unmarked syllables opening a text with
+    accent marks. Other unmarked syllables are unaccented.
+
+    Example:
+    >>> hkAnuToHkUd("a=gnimI\\Le")
+    'agni/mILe'
+    """
+    # Accent of the previous syllable: A, S, U or B.
+    state = ["U" if re.search(r"[\\=]", hkAnuStr) else "B"]
+
+    def syllable(match):
+        nucleus, coda, mark, consonants, final = match.groups()
+        if nucleus is None:
+            nucleus, coda, mark = consonants, "", final
+        if mark == "=":
+            state[0] = "A"
+        elif mark == "\\":
+            state[0] = "S"
+        elif state[0] in ("A", "U"):
+            state[0] = "U"
+            if consonants is None:
+                return nucleus + "/" + coda
+        else:
+            state[0] = "B"
+        return nucleus + coda
+
+    return _HK_MARKED_SYLLABLE.sub(syllable, hkAnuStr)
+
+
+class DevaConverter:
+    """
+    Convert Devanagari to Harvard-Kyoto or IAST.
+
+    The text is read in a single pass by a `pieoffice.engine.TrieConverter`
+    holding every consonant with its vowel sign or virama, so the inherent a
+    needs no context. The accent marks are then read as the anudatta
+    notation and turned back into udatta slashes, unless
+    anudatta_to_udatta is False, in which case they are kept as the
+    backslash and = of Harvard-Kyoto input.
+
+    Attributes
+    ----------
+    scheme : str
+        "deva_to_hk" or "deva_to_iast".
+
+    anudatta_to_udatta : bool
+        Whether the accents are converted to the udatta notation.
+
+    Methods
+    -------
+    converter(self, deva_text)
+        Converts a Devanagari string.
+    """
+
+    def __init__(self, scheme="deva_to_hk", anudatta_to_udatta=True):
+        if scheme not in ("deva_to_hk", "deva_to_iast"):
+            raise ValueError("Unknown scheme: {}".format(scheme))
+        self.scheme = scheme
+        self.anudatta_to_udatta = anudatta_to_udatta
+        self._converter = compile_rules(DEVA_TO_HK_RULES)
+
+    def converter(self, deva_text):
+        output = self._converter.convert(deva_text)
+        if self.anudatta_to_udatta:
+            output = hkAnuToHkUd(output)
+        if self.scheme == "deva_to_iast":
+            output = compile_regex_rules(ASCII_HK_TO_IAST).convert(output)
         return output
 
 
@@ -310,5 +680,4 @@ if __name__ == "__main__":
         scheme="hk_to_deva", udatta_to_anudatta=False
         )
     print(ascii_replace.converter(hk))
-
-
+    print(DevaConverter().converter(deva) == hk)